@@ -0,0 +1,116 @@
+"""
+Benchmark: v3 canonicalize-and-hash throughput vs worker count.
+
+Usage:
+    python benchmarks/bench_v3_canonicalize_parallel.py [n_events] [chunk_size] [max_workers]
+
+Prints events/second for the single-item loop, the batch API and the
+process-pool mode at 1..cpu_count workers. The batch rows show speed-up
+over the matching single-item loop; the parallel rows show speed-up over
+the batch API. Output order is verified against the single-item function.
+The "int severity" rows feed records the batch fast path declines, so
+they measure only the shared-encoder saving.
+
+"hashes only" rows use context_hashes_parallel(), whose workers send back
+(index, context_hash) instead of whole canonical events.
+
+Measured (100k events, chunk_size=2000, max_workers=4, best of 3, two
+runs) on a 1-CPU container, speed-up relative to canonicalize_events:
+
+    workers   full results   hashes only
+    1         x1.00-1.05     x1.00-1.08    (inline, no pool)
+    2         x0.23-0.29     x0.64-0.77
+    4         x0.23-0.25     x0.59-0.60
+
+With one CPU, extra workers cannot help. The pool rows show the overhead
+alone: pickling full results back to the parent costs about three
+quarters of the throughput, and hash-only results cut that loss to about
+a third. Multi-core scaling is still unmeasured. Run this with
+max_workers <= cpu count on the target host before using workers > 1.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from adaptive_core.v3.canonicalize import canonicalize_event, canonicalize_events
+from adaptive_core.v3.parallel import canonicalize_events_parallel, context_hashes_parallel
+
+
+def _events(n: int, int_severity: bool = False):
+    # int_severity: records the batch fast path declines (the full
+    # validator coerces them), to show the fallback cost.
+    for i in range(n):
+        yield {
+            "source_layer": f"layer-{i % 5}",
+            "event_type": "reject",
+            "severity": (i % 2) if int_severity else (i % 100) / 100.0,
+            "timestamp": "2026-01-14T00:00:00Z",
+            "correlation_id": f"cid-{i}",
+            "meta": {"seq": i, "payload": "x" * 64, "tags": ["a", "b", i % 7]},
+            "reason_id": f"RSN-{i % 13}",
+        }
+
+
+def _drain(results) -> int:
+    # Consume without retaining, so every row pays the same allocation/GC cost.
+    return sum(1 for _ in results)
+
+
+def _timed(label: str, fn, n: int, baseline: float | None = None, repeat: int = 3) -> float:
+    # Best of `repeat` runs: the least disturbed by other load on the host.
+    dt = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        dt = min(dt, time.perf_counter() - t0)
+    rate = n / dt
+    extra = "" if baseline is None else f"  x{rate / baseline:.2f}"
+    print(f"{label:<28} {rate:>12,.0f} ev/s{extra}")
+    return rate
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    cpus = os.cpu_count() or 1
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else cpus
+    print(f"events={n} chunk_size={chunk} cpus={cpus} max_workers={max_workers}")
+
+    # Inputs are built up front so only canonicalization is timed.
+    events = list(_events(n))
+    int_events = list(_events(n, int_severity=True))
+    expected = [canonicalize_event(e).context_hash for e in events[:5_000]]
+
+    loop = _timed("single-item loop", lambda: _drain(canonicalize_event(e) for e in events), n)
+    base = _timed("canonicalize_events", lambda: _drain(canonicalize_events(events)), n, loop)
+
+    slow = _timed("loop, int severity", lambda: _drain(canonicalize_event(e) for e in int_events), n)
+    _timed("batch, int severity", lambda: _drain(canonicalize_events(int_events)), n, slow)
+
+    w = 1
+    while w <= max_workers:
+        got = [
+            r.context_hash
+            for r in canonicalize_events_parallel(events[:5_000], workers=w, chunk_size=chunk)
+        ]
+        assert got == expected, "parallel output diverged from single-item function"
+        _timed(
+            f"parallel workers={w}",
+            lambda: _drain(canonicalize_events_parallel(events, workers=w, chunk_size=chunk)),
+            n,
+            base,
+        )
+        _timed(
+            f"hashes only workers={w}",
+            lambda: _drain(context_hashes_parallel(events, workers=w, chunk_size=chunk)),
+            n,
+            base,
+        )
+        w *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,9 @@ from .models import (
 )
 from .memory import InMemoryAdaptiveStore
 from .threat_memory import ThreatMemory
-from .threat_packet import ThreatPacket
+from .threat_packet import ThreatPacket, timestamp_epoch
 from .pattern_engine import DeepPatternEngine
+from .trend_rollups import ThreatTrendRollups, bucket_label
 
 
 class AdaptiveEngine:
@@ -48,6 +49,8 @@ class AdaptiveEngine:
         store: InMemoryAdaptiveStore | None = None,
         initial_state: AdaptiveState | None = None,
         threat_memory: ThreatMemory | None = None,
+        deep_short_seconds: Optional[float] = None,
+        deep_long_seconds: Optional[float] = None,
     ) -> None:
         # Store keeps a history of raw events (and in future, snapshots).
         self.store = store or InMemoryAdaptiveStore()
@@ -59,6 +62,21 @@ class AdaptiveEngine:
         self.threat_memory = threat_memory or ThreatMemory(path=None)
         self.threat_memory.load()
 
+        # Long-lived Deep Pattern Engine, updated incrementally on ingest.
+        # deep_short_seconds / deep_long_seconds (set together) switch its
+        # spike windows from packet counts to time spans.
+        self.deep_patterns = DeepPatternEngine(
+            memory=self.threat_memory,
+            short_seconds=deep_short_seconds,
+            long_seconds=deep_long_seconds,
+        )
+
+        # Minute / hour / day trend counters, updated on ingest.
+        # Seeded from whatever ThreatMemory loaded.
+        self.trend_rollups = ThreatTrendRollups()
+        for packet in self.threat_memory.list_packets():
+            self.trend_rollups.add_packet(packet)
+
         # Last update metadata (UTC ISO strings, or None if never updated).
         # Telemetry only — not used for decisions.
         self.last_threat_received: Optional[str] = None
@@ -113,6 +131,8 @@ class AdaptiveEngine:
         Persistence is opt-in. save() is a no-op unless ThreatMemory.path is set.
         """
         self.threat_memory.add_packet(packet)
+        self._deep_pattern_engine().observe(packet)
+        self.trend_rollups.add_packet(packet)
         self.threat_memory.save()
         # record last time any threat was seen (telemetry only)
         self.last_threat_received = datetime.utcnow().isoformat() + "Z"
@@ -340,6 +360,15 @@ class AdaptiveEngine:
             - "hour" → group by YYYY-MM-DD HH:00
             - "day"  → group by YYYY-MM-DD
 
+        Buckets are UTC, labelled exactly like rollup_threat_trends();
+        offset timestamps are converted, naive ones are read as UTC.
+
+        This scans ThreatMemory on purpose: it describes the packets held
+        now (after pruning or a reload), which is what the other
+        generate_immune_report() sections describe too. The ingest-time
+        rollups describe everything ingested within their retention and
+        so can differ; use rollup_threat_trends() for that view.
+
         Patch C rule:
           - No silent fallbacks. Invalid timestamps are counted explicitly.
         """
@@ -363,17 +392,14 @@ class AdaptiveEngine:
         bucket_counts: Dict[str, int] = {}
         bucket_high: Dict[str, int] = {}
 
+        resolution = "day" if bucket == "day" else "hour"
         for p in packets:
-            try:
-                ts = datetime.fromisoformat(p.timestamp.replace("Z", ""))
-            except ValueError:
+            epoch = timestamp_epoch(p.timestamp)
+            if epoch is None:
                 invalid_timestamp_count += 1
                 continue
 
-            if bucket == "day":
-                key = ts.strftime("%Y-%m-%d")
-            else:
-                key = ts.strftime("%Y-%m-%d %H:00")
+            key = bucket_label(epoch, resolution)
 
             bucket_counts[key] = bucket_counts.get(key, 0) + 1
             if p.severity >= 8:
@@ -420,6 +446,32 @@ class AdaptiveEngine:
             "invalid_timestamp_count": invalid_timestamp_count,
         }
 
+    def rollup_threat_trends(
+        self,
+        bucket: str = "hour",
+        min_severity: int = 0,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        threat_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Time trends answered from ingest-time rollups (no memory scan).
+
+        bucket: "minute", "hour" or "day".
+        start / end: optional ISO timestamps bounding the range [start, end).
+
+        Same result shape as detect_threat_trends(), but covering every
+        packet ingested within each resolution's retention, independent of
+        ThreatMemory pruning.
+        """
+        return self.trend_rollups.query(
+            bucket=bucket,
+            min_severity=min_severity,
+            start=start,
+            end=end,
+            threat_type=threat_type,
+        )
+
     def generate_immune_report(
         self,
         min_severity: int = 0,
@@ -430,6 +482,9 @@ class AdaptiveEngine:
         """
         High-level immune system report combining all analysis components,
         including the Deep Pattern Engine (spike + diversity).
+
+        Every section describes the packets currently in ThreatMemory, so
+        trends come from detect_threat_trends(), not the rollups.
         """
         summary = self.summarize_threats(min_severity=min_severity)
         analysis = self.analyze_threats(
@@ -449,8 +504,7 @@ class AdaptiveEngine:
         )
 
         # Deep Pattern Engine (spike + diversity + composite risk)
-        deep_engine = DeepPatternEngine(memory=self.threat_memory)
-        deep = deep_engine.analyze(min_severity=min_severity)
+        deep = self._deep_pattern_engine().analyze(min_severity=min_severity)
 
         lines: List[str] = []
         lines.append("=== DigiByte Quantum Adaptive Core — Immune Report ===")
@@ -631,6 +685,22 @@ class AdaptiveEngine:
     # Internal helpers
     # ------------------------------------------------------------------ #
 
+    def _deep_pattern_engine(self) -> DeepPatternEngine:
+        """
+        Return the long-lived DeepPatternEngine, re-binding it if
+        threat_memory was swapped out since it was created.
+        """
+        if self.deep_patterns.memory is not self.threat_memory:
+            self.deep_patterns = DeepPatternEngine(
+                memory=self.threat_memory,
+                short_window=self.deep_patterns.short_window,
+                long_window=self.deep_patterns.long_window,
+                min_severity=self.deep_patterns.min_severity,
+                short_seconds=self.deep_patterns.short_seconds,
+                long_seconds=self.deep_patterns.long_seconds,
+            )
+        return self.deep_patterns
+
     def _apply_single_event(
         self,
         event: RiskEvent,
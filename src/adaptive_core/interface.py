@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Iterable, Dict, List
+import copy
+from collections import OrderedDict
+from typing import Any, Optional, Iterable, Dict, List, Tuple
 
 from .engine import AdaptiveEngine
 from .threat_packet import ThreatPacket
@@ -23,9 +25,20 @@ class AdaptiveCoreInterface:
       - Accept wallet / app events from bridges (e.g. QWG via emit_adaptive_event)
       - Forward them into the AdaptiveEngine where appropriate
       - Expose a unified Immune Report and adaptive state for consumers
+
+    Immune reports are memoized per parameter set and invalidated whenever
+    ThreatMemory changes (tracked via ThreatMemory.generation) or the
+    engine's DeepPatternEngine is replaced or reconfigured, so repeated
+    dashboard polls between ingests do not recompute anything. Every call
+    still returns its own copy of the report. The most recently used
+    `report_cache_size` parameter sets are kept (LRU); 0 disables caching.
     """
 
-    def __init__(self, engine: Optional[AdaptiveEngine] = None) -> None:
+    def __init__(
+        self,
+        engine: Optional[AdaptiveEngine] = None,
+        report_cache_size: int = 8,
+    ) -> None:
         # If no engine is provided, create a default one.
         self.engine: AdaptiveEngine = engine or AdaptiveEngine()
 
@@ -33,6 +46,10 @@ class AdaptiveCoreInterface:
         # These are stored for diagnostics / future learning hooks.
         self.received_events: List[Dict[str, Any]] = []
 
+        # Immune report cache: params -> (report version, report)
+        self.report_cache_size: int = max(0, report_cache_size)
+        self._report_cache: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[Any, ...], Dict[str, Any]]]" = OrderedDict()
+
     # ------------------------------------------------------------------ #
     # Inbound API from shield layers (ThreatPackets + feedback)
     # ------------------------------------------------------------------ #
@@ -119,12 +136,13 @@ class AdaptiveCoreInterface:
     ) -> dict[str, Any]:
         """
         Return the full structured immune report generated by the core.
+
+        Reports are served from cache while ThreatMemory and the deep
+        pattern engine are unchanged. Each call returns a fresh copy, so
+        callers may modify it freely.
         """
-        return self.engine.generate_immune_report(
-            min_severity=min_severity,
-            pattern_window=pattern_window,
-            trend_bucket=trend_bucket,
-            last_n=last_n,
+        return copy.deepcopy(
+            self._cached_report(min_severity, pattern_window, trend_bucket, last_n)
         )
 
     def get_immune_report_text(
@@ -138,14 +156,15 @@ class AdaptiveCoreInterface:
         Convenience helper that returns only the human-readable text
         section of the immune report.
         """
-        report = self.get_immune_report(
-            min_severity=min_severity,
-            pattern_window=pattern_window,
-            trend_bucket=trend_bucket,
-            last_n=last_n,
-        )
+        report = self._cached_report(min_severity, pattern_window, trend_bucket, last_n)
         return report.get("text", "")
 
+    def clear_report_cache(self) -> None:
+        """
+        Drop all memoized immune reports.
+        """
+        self._report_cache.clear()
+
     def get_threat_insights_text(self, min_severity: int = 0) -> str:
         """
         Shortcut wrapper for the simpler threat_insights view.
@@ -163,3 +182,66 @@ class AdaptiveCoreInterface:
         Return metadata about last threat and last learning update.
         """
         return self.engine.get_last_update_metadata()
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _cached_report(
+        self,
+        min_severity: int,
+        pattern_window: int,
+        trend_bucket: str,
+        last_n: int,
+    ) -> Dict[str, Any]:
+        """
+        Return the memoized report for these parameters (shared, never
+        handed to callers as-is), regenerating it when stale.
+        """
+        key = (min_severity, pattern_window, trend_bucket, last_n)
+        version = self._report_version()
+
+        if version is not None:
+            cached = self._report_cache.get(key)
+            if cached is not None and self._same_version(cached[0], version):
+                self._report_cache.move_to_end(key)
+                return cached[1]
+
+        report = self.engine.generate_immune_report(
+            min_severity=min_severity,
+            pattern_window=pattern_window,
+            trend_bucket=trend_bucket,
+            last_n=last_n,
+        )
+
+        if version is not None and self.report_cache_size > 0:
+            self._report_cache[key] = (version, report)
+            self._report_cache.move_to_end(key)
+            while len(self._report_cache) > self.report_cache_size:
+                self._report_cache.popitem(last=False)
+
+        return report
+
+    def _report_version(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Identify everything a cached report depends on as
+        (memory, generation, deep pattern engine, its configuration).
+
+        Returns None when the engine does not expose a generation counter,
+        in which case reports are never cached.
+        """
+        memory = getattr(self.engine, "threat_memory", None)
+        generation = getattr(memory, "generation", None)
+        if not isinstance(generation, int):
+            return None
+        deep = getattr(self.engine, "deep_patterns", None)
+        deep_config = tuple(
+            getattr(deep, name, None)
+            for name in ("short_window", "long_window", "min_severity", "short_seconds", "long_seconds")
+        )
+        return (memory, generation, deep, deep_config)
+
+    @staticmethod
+    def _same_version(a: Tuple[Any, ...], b: Tuple[Any, ...]) -> bool:
+        # Objects are compared by identity, counters and settings by value.
+        return a[0] is b[0] and a[1] == b[1] and a[2] is b[2] and a[3] == b[3]
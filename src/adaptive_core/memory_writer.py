@@ -7,12 +7,22 @@ This module is the small bridge that takes AdaptiveEvent objects
 Right now it uses an in-memory list so the integration stays
 lightweight. Later, DigiByte nodes / wallets can swap this out
 for a DB, file, or remote collector – without changing Sentinel.
+
+Bundled sinks:
+  - InMemoryEventSink       – unbounded list (default)
+  - RingBufferEventSink     – bounded, keeps the most recent events
+  - JsonLinesFileEventSink  – buffered, rotating JSON-lines file (opt-in disk I/O)
+  - BatchingFanOutEventSink – batches events and forwards to several sinks
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Protocol, List, Optional, Any
+import json
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Protocol, List, Optional, Any, Deque, Iterable, Sequence, TextIO
 
 from .models import AdaptiveEvent
 
@@ -27,6 +37,45 @@ class EventSink(Protocol):
         ...
 
 
+class BatchEventSink(EventSink, Protocol):
+    """
+    Optional extension: sinks that can accept a whole batch in one call.
+
+    AdaptiveMemoryWriter.write_many() uses store_events() when present and
+    falls back to one store_event() call per event otherwise.
+    """
+
+    def store_events(self, events: Sequence[AdaptiveEvent]) -> None:  # pragma: no cover - protocol
+        ...
+
+
+def _store_batch(sink: EventSink, events: Sequence[AdaptiveEvent]) -> None:
+    """Forward a batch to a sink, using store_events() if it has one."""
+    store_events = getattr(sink, "store_events", None)
+    if store_events is not None:
+        store_events(events)
+        return
+    for event in events:
+        sink.store_event(event)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def event_to_json_line(event: AdaptiveEvent) -> str:
+    """
+    Serialise one event as a single compact JSON line (no trailing newline).
+
+    Keys are sorted so identical events always produce identical lines.
+    Raw dict payloads are accepted as-is for symmetry with InMemoryEventSink.
+    """
+    data = asdict(event) if is_dataclass(event) else dict(event)
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
 class InMemoryEventSink:
     """
     Default sink used in v2: just keeps events in a Python list.
@@ -48,12 +97,224 @@ class InMemoryEventSink:
     def store_event(self, event: AdaptiveEvent) -> None:
         self._events.append(event)
 
+    def store_events(self, events: Sequence[AdaptiveEvent]) -> None:
+        self._events.extend(events)
+
     @property
     def events(self) -> List[AdaptiveEvent]:
         """Return all stored events (read-only list reference)."""
         return self._events
 
 
+class RingBufferEventSink:
+    """
+    Bounded in-memory sink: keeps only the most recent `capacity` events.
+
+    Oldest events are discarded first, so memory stays flat no matter how
+    long Sentinel keeps streaming.
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._events: Deque[AdaptiveEvent] = deque(maxlen=capacity)
+        self.dropped: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen or 0
+
+    def store_event(self, event: AdaptiveEvent) -> None:
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append(event)
+
+    def store_events(self, events: Sequence[AdaptiveEvent]) -> None:
+        overflow = len(self._events) + len(events) - self.capacity
+        if overflow > 0:
+            self.dropped += overflow
+        self._events.extend(events)
+
+    @property
+    def events(self) -> List[AdaptiveEvent]:
+        """Return a copy of the retained events (oldest first)."""
+        return list(self._events)
+
+
+class JsonLinesFileEventSink:
+    """
+    Append-only JSON-lines file sink with buffered writes and size rotation.
+
+    - Events are serialised into an in-memory buffer and written to disk
+      once `flush_every` lines are pending (or on flush() / close()).
+    - When the active file would grow beyond `max_bytes`, it is rotated:
+      events.jsonl -> events.jsonl.1 -> events.jsonl.2 ... up to
+      `backup_count` files; the oldest backup is discarded.
+
+    Disk I/O is opt-in: nothing touches the filesystem until this sink is
+    constructed with an explicit path and given events to store.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        flush_every: int = 256,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        if backup_count < 0:
+            raise ValueError("backup_count must be >= 0")
+        if flush_every <= 0:
+            raise ValueError("flush_every must be > 0")
+
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        self.flush_every: int = flush_every
+
+        self._pending: List[str] = []
+        self._fh: Optional[TextIO] = None
+        self._size: int = 0
+
+    def store_event(self, event: AdaptiveEvent) -> None:
+        self._pending.append(event_to_json_line(event))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def store_events(self, events: Sequence[AdaptiveEvent]) -> None:
+        self._pending.extend(event_to_json_line(e) for e in events)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of serialised lines not yet written to disk."""
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Write all pending lines to disk, rotating as needed."""
+        if not self._pending:
+            return
+
+        fh = self._open()
+        chunk: List[str] = []
+        chunk_size = 0
+        for line in self._pending:
+            record = line + "\n"
+            n = len(record.encode("utf-8"))
+            if self._size + chunk_size + n > self.max_bytes and (self._size + chunk_size) > 0:
+                fh.write("".join(chunk))
+                self._size += chunk_size
+                chunk, chunk_size = [], 0
+                fh = self._rotate()
+            chunk.append(record)
+            chunk_size += n
+
+        fh.write("".join(chunk))
+        fh.flush()
+        self._size += chunk_size
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush pending lines and release the file handle."""
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "JsonLinesFileEventSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _open(self) -> TextIO:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("a", encoding="utf-8")
+            self._size = self.path.stat().st_size
+        return self._fh
+
+    def _rotate(self) -> TextIO:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = self.path.with_name(f"{self.path.name}.{i}")
+                if src.exists():
+                    src.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+        return self._open()
+
+
+class BatchingFanOutEventSink:
+    """
+    Buffer events and forward them in batches to one or more downstream sinks.
+
+    Each downstream sink receives the same batch in the same order. Sinks
+    exposing store_events() get the whole batch in one call.
+    """
+
+    def __init__(self, sinks: Iterable[EventSink], batch_size: int = 100) -> None:
+        self._sinks: List[EventSink] = list(sinks)
+        if not self._sinks:
+            raise ValueError("at least one downstream sink is required")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        self.batch_size: int = batch_size
+        self._buffer: List[AdaptiveEvent] = []
+
+    @property
+    def sinks(self) -> List[EventSink]:
+        return list(self._sinks)
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events not yet forwarded."""
+        return len(self._buffer)
+
+    def store_event(self, event: AdaptiveEvent) -> None:
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def store_events(self, events: Sequence[AdaptiveEvent]) -> None:
+        self._buffer.extend(events)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Forward buffered events downstream, then flush downstream sinks."""
+        if self._buffer:
+            batch = self._buffer
+            self._buffer = []
+            for sink in self._sinks:
+                _store_batch(sink, batch)
+        for sink in self._sinks:
+            flush = getattr(sink, "flush", None)
+            if flush is not None:
+                flush()
+
+    def close(self) -> None:
+        """Flush everything and close downstream sinks that support it."""
+        self.flush()
+        for sink in self._sinks:
+            close = getattr(sink, "close", None)
+            if close is not None:
+                close()
+
+
 class AdaptiveMemoryWriter:
     """
     High-level helper that receives AdaptiveEvent payloads and
@@ -91,3 +352,25 @@ class AdaptiveMemoryWriter:
         event = AdaptiveEvent(**payload)
         self._sink.store_event(event)
         return event
+
+    def write_many(self, events: Iterable[AdaptiveEvent]) -> List[AdaptiveEvent]:
+        """
+        Store a batch of already-constructed AdaptiveEvent instances.
+
+        The batch is handed to the sink in a single store_events() call
+        when the sink supports it.
+        """
+        batch = list(events)
+        if batch:
+            _store_batch(self._sink, batch)
+        return batch
+
+    def write_many_from_dicts(self, payloads: Iterable[dict[str, Any]]) -> List[AdaptiveEvent]:
+        """
+        Batch version of write_from_dict().
+
+        Every payload is validated before anything is stored: if one payload
+        is invalid, the error is raised and the sink receives nothing.
+        """
+        batch = [AdaptiveEvent(**payload) for payload in payloads]
+        return self.write_many(batch)
@@ -2,10 +2,63 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from typing import Dict, Any, Deque, List, Optional, Tuple
 
 from .threat_memory import ThreatMemory
-from .threat_packet import ThreatPacket
+from .threat_packet import ThreatPacket, timestamp_epoch
+
+
+class SlidingTimeWindow:
+    """
+    Sorted multiset of packet epochs, viewed through (now - horizon, now].
+
+    "Now" is the newest epoch currently held (never the wall clock), so
+    the window is deterministic for a given memory state. Epochs stay in
+    the multiset until discard() is called for them (i.e. until their
+    packet leaves ThreatMemory), even while outside the span: evicting the
+    newest packet or ingesting out of order can then never leave the
+    window out of step with a full rescan. Counts are read with bisect.
+    """
+
+    def __init__(self, horizon: float) -> None:
+        if horizon <= 0:
+            raise ValueError("horizon must be > 0")
+        self.horizon = float(horizon)
+        self._epochs: List[float] = []
+
+    def __len__(self) -> int:
+        return self.count_within(self.horizon)
+
+    @property
+    def now(self) -> Optional[float]:
+        return self._epochs[-1] if self._epochs else None
+
+    @property
+    def oldest(self) -> Optional[float]:
+        """Oldest epoch inside the window."""
+        if not self._epochs:
+            return None
+        return self._epochs[bisect_right(self._epochs, self._epochs[-1] - self.horizon)]
+
+    def count_within(self, span: float) -> int:
+        """Epochs in (now - span, now]."""
+        if not self._epochs:
+            return 0
+        return len(self._epochs) - bisect_right(self._epochs, self._epochs[-1] - span)
+
+    def add(self, epoch: float) -> None:
+        if not self._epochs or epoch >= self._epochs[-1]:
+            self._epochs.append(epoch)
+        else:
+            insort(self._epochs, epoch)
+
+    def discard(self, epoch: float) -> None:
+        """Remove one occurrence of `epoch` if it is held."""
+        i = bisect_left(self._epochs, epoch)
+        if i < len(self._epochs) and self._epochs[i] == epoch:
+            del self._epochs[i]
 
 
 class DeepPatternEngine:
@@ -22,6 +75,25 @@ class DeepPatternEngine:
 
     This is intentionally simple and deterministic so it is easy to
     test and safe to evolve later.
+
+    Incremental mode:
+      The engine is meant to be long-lived. Call observe(packet) right
+      after each ThreatMemory.add_packet() and it keeps the window state
+      (filtered total, short-window types + per-type counter) up to date,
+      including FIFO evictions from memory. analyze() with the engine's own
+      `min_severity` is then O(1) (O(log n) in time mode). Any other
+      min_severity, or a memory that
+      changed behind the engine's back (ThreatMemory.generation mismatch),
+      falls back to / triggers a full rescan.
+
+    Time-based windows (opt-in):
+      Count windows say nothing about arrival rate once memory is full.
+      Pass `short_seconds` / `long_seconds` (e.g. 300 / 21600) to compute
+      spike_ratio from packet rates instead: packets in the last
+      short_seconds vs the last long_seconds, measured against the newest
+      packet timestamp. The long span is capped at the observed history so
+      a freshly started node does not report a spurious spike. Diversity
+      stays on the count-based short window.
     """
 
     def __init__(
@@ -29,10 +101,113 @@ class DeepPatternEngine:
         memory: ThreatMemory,
         short_window: int = 50,
         long_window: int = 500,
+        min_severity: int = 0,
+        short_seconds: Optional[float] = None,
+        long_seconds: Optional[float] = None,
     ) -> None:
         self.memory = memory
         self.short_window = max(1, short_window)
         self.long_window = max(self.short_window, long_window)
+        self.min_severity = min_severity
+
+        if (short_seconds is None) != (long_seconds is None):
+            raise ValueError("short_seconds and long_seconds must be set together")
+        if short_seconds is not None and long_seconds is not None:
+            if short_seconds <= 0:
+                raise ValueError("short_seconds must be > 0")
+            long_seconds = max(short_seconds, long_seconds)
+        self.short_seconds: Optional[float] = short_seconds
+        self.long_seconds: Optional[float] = long_seconds
+
+        # Incremental state (valid while _generation == memory.generation)
+        self._generation: Optional[int] = None
+        # One (admitted, epoch) entry per packet in memory.
+        self._admitted: Deque[Tuple[bool, Optional[float]]] = deque()
+        self._total: int = 0
+        self._short_types: Deque[str] = deque()
+        self._short_counts: Counter[str] = Counter()
+        # Every admitted epoch still in memory, viewed over long_seconds.
+        self._time: Optional[SlidingTimeWindow] = None
+        self._reset_time_windows()
+
+    @property
+    def time_windows_enabled(self) -> bool:
+        return self.short_seconds is not None
+
+    # ------------------------------------------------------------------ #
+    # Incremental state
+    # ------------------------------------------------------------------ #
+
+    def observe(self, packet: ThreatPacket) -> None:
+        """
+        Account for a packet that was just appended to ThreatMemory.
+
+        If the engine was not in sync with memory before the append,
+        the state is rebuilt from memory instead.
+        """
+        if self._generation is None or self.memory.generation != self._generation + 1:
+            self.rebuild()
+            return
+
+        admitted = packet.severity >= self.min_severity
+        epoch = self._observe_time(packet) if admitted else None
+        self._admitted.append((admitted, epoch))
+        if admitted:
+            self._total += 1
+            self._short_types.append(packet.threat_type)
+            self._short_counts[packet.threat_type] += 1
+            if len(self._short_types) > self.short_window:
+                self._drop_short(self._short_types.popleft())
+
+        # Mirror ThreatMemory's FIFO pruning.
+        while len(self._admitted) > max(0, self.memory.max_packets):
+            was_admitted, old_epoch = self._admitted.popleft()
+            if was_admitted:
+                self._total -= 1
+                if len(self._short_types) > self._total:
+                    self._drop_short(self._short_types.popleft())
+                if old_epoch is not None and self._time is not None:
+                    self._time.discard(old_epoch)
+
+        self._generation = self.memory.generation
+
+    def rebuild(self) -> None:
+        """
+        Recompute the incremental state from a full ThreatMemory scan.
+        """
+        packets = self.memory.list_packets()
+        self._reset_time_windows()
+        self._admitted = deque()
+        filtered: List[ThreatPacket] = []
+        for p in packets:
+            admitted = p.severity >= self.min_severity
+            epoch = self._observe_time(p) if admitted else None
+            self._admitted.append((admitted, epoch))
+            if admitted:
+                filtered.append(p)
+        self._total = len(filtered)
+        self._short_types = deque(p.threat_type for p in filtered[-self.short_window :])
+        self._short_counts = Counter(self._short_types)
+        self._generation = self.memory.generation
+
+    def _drop_short(self, threat_type: str) -> None:
+        self._short_counts[threat_type] -= 1
+        if self._short_counts[threat_type] <= 0:
+            del self._short_counts[threat_type]
+
+    def _reset_time_windows(self) -> None:
+        if self.short_seconds is None or self.long_seconds is None:
+            return
+        self._time = SlidingTimeWindow(self.long_seconds)
+
+    def _observe_time(self, packet: ThreatPacket) -> Optional[float]:
+        """Parse the packet epoch once and feed the time window."""
+        if self._time is None:
+            return None
+        epoch = timestamp_epoch(packet.timestamp)
+        if epoch is not None:
+            self._time.add(epoch)
+        return epoch
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -52,13 +227,104 @@ class DeepPatternEngine:
           - spike_score       (0.0 .. 1.0)
           - diversity_score   (0.0 .. 1.0)
           - composite_risk    (0.0 .. 1.0)
+          - window_mode       ("count" or "time")
+
+        In time mode the result also carries short_seconds, long_seconds,
+        short_time_count and long_time_count, and spike_ratio is the ratio
+        of packet rates over those time windows.
         """
+        if min_severity == self.min_severity:
+            if self._generation != self.memory.generation:
+                self.rebuild()
+            time_counts = None
+            if self._time is not None and self.short_seconds is not None:
+                time_counts = self._time_counts(
+                    self._time.count_within(self.short_seconds),
+                    len(self._time),
+                    self._time.now,
+                    self._time.oldest,
+                )
+            return self._scores(
+                total=self._total,
+                short_count=len(self._short_types),
+                unique_types=len(self._short_counts),
+                time_counts=time_counts,
+            )
+
+        # Non-default filter: one-off full scan.
         packets: List[ThreatPacket] = [
             p
             for p in self.memory.list_packets()
             if p.severity >= min_severity
         ]
-        total = len(packets)
+        short_slice = packets[-self.short_window :]
+
+        time_counts = None
+        if self.short_seconds is not None and self.long_seconds is not None:
+            epochs = sorted(
+                e for e in (timestamp_epoch(p.timestamp) for p in packets) if e is not None
+            )
+            if epochs:
+                now = epochs[-1]
+                long_start = bisect_right(epochs, now - self.long_seconds)
+                short_start = bisect_right(epochs, now - self.short_seconds)
+                time_counts = self._time_counts(
+                    len(epochs) - short_start,
+                    len(epochs) - long_start,
+                    now,
+                    epochs[long_start],
+                )
+            else:
+                time_counts = self._time_counts(0, 0, None, None)
+
+        return self._scores(
+            total=len(packets),
+            short_count=len(short_slice),
+            unique_types=len({p.threat_type for p in short_slice}),
+            time_counts=time_counts,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _time_counts(
+        self,
+        short_count: int,
+        long_count: int,
+        now: Optional[float],
+        oldest: Optional[float],
+    ) -> Tuple[int, int, float]:
+        """
+        Return (short_time_count, long_time_count, effective_long_span).
+
+        The long span is the observed history inside the long window,
+        but never shorter than the short window.
+        """
+        short_seconds = self.short_seconds or 0.0
+        long_seconds = self.long_seconds or 0.0
+        span = short_seconds
+        if now is not None and oldest is not None:
+            span = max(short_seconds, min(long_seconds, now - oldest))
+        return short_count, long_count, span
+
+    def _scores(
+        self,
+        *,
+        total: int,
+        short_count: int,
+        unique_types: int,
+        time_counts: Optional[Tuple[int, int, float]] = None,
+    ) -> Dict[str, Any]:
+        time_fields: Dict[str, Any] = {"window_mode": "count"}
+        if time_counts is not None:
+            time_fields = {
+                "window_mode": "time",
+                "short_seconds": self.short_seconds,
+                "long_seconds": self.long_seconds,
+                "short_time_count": time_counts[0],
+                "long_time_count": time_counts[1],
+            }
 
         if total == 0:
             return {
@@ -71,21 +337,23 @@ class DeepPatternEngine:
                 "spike_score": 0.0,
                 "diversity_score": 0.0,
                 "composite_risk": 0.0,
+                **time_fields,
             }
 
         # Long window (older + recent)
-        long_slice = packets[-self.long_window :]
-        long_count = len(long_slice)
-
-        # Short window (most recent activity)
-        short_slice = packets[-self.short_window :]
-        short_count = len(short_slice)
+        long_count = min(total, self.long_window)
 
         # ------------------------------------------------------------------
         # Spike score: is recent activity much higher than long-term average?
         # ------------------------------------------------------------------
-        long_rate = long_count / float(self.long_window)
-        short_rate = short_count / float(self.short_window)
+        if time_counts is not None:
+            # Packets per second: last short_seconds vs observed long span.
+            short_time_count, long_time_count, long_span = time_counts
+            long_rate = long_time_count / long_span
+            short_rate = short_time_count / (self.short_seconds or 1.0)
+        else:
+            long_rate = long_count / float(self.long_window)
+            short_rate = short_count / float(self.short_window)
 
         if long_rate == 0.0:
             spike_ratio = 1.0 if short_rate > 0.0 else 0.0
@@ -104,9 +372,8 @@ class DeepPatternEngine:
         if short_count == 0:
             diversity_score = 0.0
         else:
-            unique_types = {p.threat_type for p in short_slice}
             diversity_score = self._clamp(
-                len(unique_types) / float(short_count),
+                unique_types / float(short_count),
                 0.0,
                 1.0,
             )
@@ -127,12 +394,9 @@ class DeepPatternEngine:
             "spike_score": spike_score,
             "diversity_score": diversity_score,
             "composite_risk": composite_risk,
+            **time_fields,
         }
 
-    # ------------------------------------------------------------------ #
-    # Internal helpers
-    # ------------------------------------------------------------------ #
-
     @staticmethod
     def _clamp(value: float, lower: float, upper: float) -> float:
         return max(lower, min(upper, value))
@@ -41,6 +41,10 @@ class ThreatMemory:
         # even with thousands of stored entries.
         self.max_packets: int = max_packets
 
+        # Monotonic change counter. Bumped on every mutation so read-side
+        # caches (e.g. immune reports) can tell whether memory has changed.
+        self._generation: int = 0
+
     # ------------------------------------------------------------------ #
     # Basic operations
     # ------------------------------------------------------------------ #
@@ -52,6 +56,16 @@ class ThreatMemory:
         """
         self._packets.append(packet)
         self._enforce_limit()
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """
+        Change counter for the packet list.
+
+        Any two reads that observe the same generation see the same packets.
+        """
+        return self._generation
 
     def list_packets(self) -> List[ThreatPacket]:
         """
@@ -73,6 +87,9 @@ class ThreatMemory:
         if self.path is None:
             return
 
+        # Whatever happens below replaces the packet list.
+        self._generation += 1
+
         if not self.path.exists():
             self._packets = []
             return
@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 import uuid
 
 
+def timestamp_epoch(timestamp: str) -> Optional[float]:
+    """
+    Parse a ThreatPacket timestamp into UTC epoch seconds.
+
+    Naive timestamps are treated as UTC (never local time) so results do
+    not depend on the host. Unparseable timestamps return None.
+    """
+    try:
+        dt = datetime.fromisoformat(str(timestamp).replace("Z", ""))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 @dataclass
 class ThreatPacket:
     """
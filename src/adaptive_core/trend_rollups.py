@@ -0,0 +1,235 @@
+# src/adaptive_core/trend_rollups.py
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .threat_packet import ThreatPacket, timestamp_epoch
+
+
+# resolution -> (bucket size in seconds, strftime label format)
+RESOLUTIONS: Dict[str, Tuple[int, str]] = {
+    "minute": (60, "%Y-%m-%d %H:%M"),
+    "hour": (3600, "%Y-%m-%d %H:00"),
+    "day": (86400, "%Y-%m-%d"),
+}
+
+# Default retention, in buckets per resolution (24h / 30d / 1y).
+DEFAULT_RETENTION: Dict[str, int] = {
+    "minute": 24 * 60,
+    "hour": 30 * 24,
+    "day": 365,
+}
+
+# Severity threshold used for the "high_severity" trend column.
+HIGH_SEVERITY = 8
+
+
+def bucket_label(epoch: float, resolution: str) -> str:
+    """
+    UTC label of the `resolution` bucket holding `epoch`.
+
+    Shared by the rollups and AdaptiveEngine.detect_threat_trends(), so an
+    offset timestamp lands in the same bucket on both paths.
+    """
+    size, label_format = RESOLUTIONS[resolution]
+    dt = datetime.fromtimestamp((epoch // size) * size, tz=timezone.utc)
+    return dt.strftime(label_format)
+
+
+class _ResolutionRollup:
+    """
+    Counters for one resolution.
+
+    Each bucket keeps a Counter keyed by (threat_type, severity), which is
+    enough to answer any min_severity / threat_type query without going
+    back to raw packets. Buckets older than `retention` buckets behind the
+    newest one are dropped.
+    """
+
+    def __init__(self, name: str, retention: int) -> None:
+        if retention <= 0:
+            raise ValueError("retention must be > 0")
+        self.name = name
+        self.size = RESOLUTIONS[name][0]
+        self.retention = retention
+        self.buckets: Dict[int, Counter[Tuple[str, int]]] = {}
+        # Sorted bucket ids; a list so queries can bisect and slice it.
+        self.order: List[int] = []
+
+    def add(self, epoch: float, threat_type: str, severity: int) -> bool:
+        """Count one packet. Returns False if it falls outside retention."""
+        bid = int(epoch // self.size)
+        newest = self.order[-1] if self.order else bid
+        if bid <= newest - self.retention:
+            return False
+
+        bucket = self.buckets.get(bid)
+        if bucket is None:
+            bucket = self.buckets[bid] = Counter()
+            if not self.order or bid > self.order[-1]:
+                self.order.append(bid)
+            else:
+                insort(self.order, bid)
+            cutoff = self.order[-1] - self.retention
+            expired = bisect_right(self.order, cutoff)
+            if expired:
+                for old in self.order[:expired]:
+                    del self.buckets[old]
+                del self.order[:expired]
+        bucket[(threat_type, severity)] += 1
+        return True
+
+    def label(self, bid: int) -> str:
+        return bucket_label(bid * self.size, self.name)
+
+
+class ThreatTrendRollups:
+    """
+    Multi-resolution (minute / hour / day) threat counters built at ingest.
+
+    Each ThreatPacket is counted once per resolution when it arrives, so
+    trend queries never rescan ThreatMemory: the cost of a query is the
+    number of buckets in the requested range, not the number of packets.
+
+    Notes:
+      - Bucketing is by UTC epoch (naive timestamps are read as UTC).
+      - Retention is per resolution, counted in buckets behind the newest
+        bucket seen (never the wall clock), so results are deterministic.
+      - Rollups describe ingested history within retention; they are not
+        affected by ThreatMemory pruning.
+      - Unparseable timestamps are counted explicitly, never bucketed.
+    """
+
+    def __init__(self, retention: Optional[Dict[str, int]] = None) -> None:
+        merged = dict(DEFAULT_RETENTION)
+        if retention:
+            unknown = sorted(set(retention) - set(RESOLUTIONS))
+            if unknown:
+                raise ValueError(f"unknown resolution(s): {unknown}")
+            merged.update(retention)
+
+        self._rollups: Dict[str, _ResolutionRollup] = {
+            name: _ResolutionRollup(name, merged[name]) for name in RESOLUTIONS
+        }
+        # invalid timestamps, indexed by severity (0..10)
+        self._invalid_by_severity: Counter[int] = Counter()
+
+    @property
+    def resolutions(self) -> List[str]:
+        return list(RESOLUTIONS)
+
+    def retention(self, resolution: str) -> int:
+        return self._rollup(resolution).retention
+
+    def add_packet(self, packet: ThreatPacket) -> None:
+        """Count one packet into every resolution."""
+        epoch = timestamp_epoch(packet.timestamp)
+        if epoch is None:
+            self._invalid_by_severity[packet.severity] += 1
+            return
+        for rollup in self._rollups.values():
+            rollup.add(epoch, packet.threat_type, packet.severity)
+
+    def query(
+        self,
+        bucket: str = "hour",
+        min_severity: int = 0,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        threat_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Trend view in the same shape as AdaptiveEngine.detect_threat_trends().
+
+        start / end are ISO timestamps bounding the range as [start, end);
+        either may be omitted. threat_type optionally restricts counts to a
+        single threat type.
+        """
+        rollup = self._rollup(bucket)
+
+        lo = None if start is None else self._bucket_bound(rollup, start)
+        hi = None if end is None else self._bucket_bound(rollup, end, ceil=True)
+
+        invalid = sum(
+            n for sev, n in self._invalid_by_severity.items() if sev >= min_severity
+        )
+
+        # Bisect to the buckets in [lo, hi): cost is the number of buckets
+        # in range, not the number retained.
+        order = rollup.order
+        first = 0 if lo is None else bisect_left(order, lo)
+        last = len(order) if hi is None else bisect_left(order, hi)
+        points: List[Dict[str, Any]] = []
+        for bid in order[first:last]:
+            total = 0
+            high = 0
+            for (ttype, sev), n in rollup.buckets[bid].items():
+                if sev < min_severity:
+                    continue
+                if threat_type is not None and ttype != threat_type:
+                    continue
+                total += n
+                if sev >= HIGH_SEVERITY:
+                    high += n
+            if total:
+                points.append(
+                    {"bucket": rollup.label(bid), "total": total, "high_severity": high}
+                )
+
+        if not points:
+            return {
+                "bucket": bucket,
+                "points": [],
+                "trend_direction": "unknown",
+                "start_total": 0,
+                "end_total": 0,
+                "invalid_timestamp_count": invalid,
+            }
+
+        start_total = points[0]["total"]
+        end_total = points[-1]["total"]
+
+        if len(points) < 2:
+            trend_direction = "unknown"
+        elif end_total > start_total:
+            trend_direction = "increasing"
+        elif end_total < start_total:
+            trend_direction = "decreasing"
+        else:
+            trend_direction = "flat"
+
+        return {
+            "bucket": bucket,
+            "points": points,
+            "trend_direction": trend_direction,
+            "start_total": start_total,
+            "end_total": end_total,
+            "invalid_timestamp_count": invalid,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _rollup(self, resolution: str) -> _ResolutionRollup:
+        rollup = self._rollups.get(resolution)
+        if rollup is None:
+            raise ValueError(
+                f"unsupported bucket {resolution!r}; expected one of {list(RESOLUTIONS)}"
+            )
+        return rollup
+
+    @staticmethod
+    def _bucket_bound(rollup: _ResolutionRollup, ts: str, ceil: bool = False) -> int:
+        epoch = timestamp_epoch(ts)
+        if epoch is None:
+            raise ValueError(f"Invalid timestamp format: {ts!r}")
+        bid = int(epoch // rollup.size)
+        # An end bound inside a bucket still includes that bucket.
+        if ceil and epoch % rollup.size:
+            bid += 1
+        return bid
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 
 from .evidence_store import EvidenceSnapshot
 from .findings import FindingV3
@@ -17,6 +18,27 @@ class AnalyzeConfig:
     """
     reason_spike_min_count: int = 5
     reason_spike_min_ratio: float = 0.10  # 10%
+    # Optional top-K: keep only the K strongest spikes (highest count,
+    # ties by reason_id). None = no limit.
+    max_findings: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.max_findings is not None and self.max_findings < 0:
+            raise ValueError("max_findings must be >= 0")
+
+
+def _strongest_first(item: Tuple[str, int]) -> Tuple[int, str]:
+    return -item[1], item[0]
+
+
+def top_k(candidates: List[Tuple[str, int]], k: Optional[int]) -> List[Tuple[str, int]]:
+    """
+    The k strongest (key, count) pairs by count desc, key asc, via heap
+    selection; all candidates when k is None or not binding.
+    """
+    if k is None or len(candidates) <= k:
+        return candidates
+    return heapq.nsmallest(k, candidates, key=_strongest_first)
 
 
 def generate_findings(snapshot: EvidenceSnapshot, cfg: AnalyzeConfig = AnalyzeConfig()) -> List[FindingV3]:
@@ -29,28 +51,53 @@ def generate_findings(snapshot: EvidenceSnapshot, cfg: AnalyzeConfig = AnalyzeCo
     if total <= 0:
         return findings
 
-    # Finding: upstream reason_id spike (repeated fail-closed reasons)
-    for reason_id, count in sorted(snapshot.by_upstream_reason_id.items()):
-        ratio = count / total
-        if count >= cfg.reason_spike_min_count and ratio >= cfg.reason_spike_min_ratio:
-            findings.append(
-                FindingV3(
-                    finding_id=f"AC-FIND-REASON-SPIKE::{reason_id}",
-                    title=f"Repeated upstream reason_id spike: {reason_id}",
-                    severity=min(1.0, 0.2 + ratio),  # deterministic advisory scoring
-                    evidence={
-                        "reason_id": reason_id,
-                        "count": count,
-                        "total_events": total,
-                        "ratio": round(ratio, 6),
-                    },
-                    guardrails=[
-                        # minimal set for this finding type
-                        "AMG-001",  # deny-by-default
-                        "AMG-014",  # no silent fallback
-                        "AMG-051",  # no fix without test
-                    ],
-                )
-            )
+    # Finding: upstream reason_id spike (repeated fail-closed reasons).
+    # Threshold first (linear), then sort only what survives.
+    min_count = cfg.reason_spike_min_count
+    min_ratio = cfg.reason_spike_min_ratio
+    candidates = [
+        (reason_id, count)
+        for reason_id, count in snapshot.by_upstream_reason_id.items()
+        if count >= min_count and count / total >= min_ratio
+    ]
+    for reason_id, count in sorted(top_k(candidates, cfg.max_findings)):
+        findings.append(_reason_spike(reason_id, count, total))
 
     return findings
+
+
+def reason_spike_finding(
+    reason_id: str, count: int, total: int, cfg: AnalyzeConfig = AnalyzeConfig()
+) -> Optional[FindingV3]:
+    """
+    The reason_id spike finding for one counter, or None below thresholds.
+
+    Depends only on (reason_id, count, total), so callers tracking counter
+    deltas can recompute just the reasons that moved.
+    """
+    if total <= 0:
+        return None
+    if count < cfg.reason_spike_min_count or count / total < cfg.reason_spike_min_ratio:
+        return None
+    return _reason_spike(reason_id, count, total)
+
+
+def _reason_spike(reason_id: str, count: int, total: int) -> FindingV3:
+    ratio = count / total
+    return FindingV3(
+        finding_id=f"AC-FIND-REASON-SPIKE::{reason_id}",
+        title=f"Repeated upstream reason_id spike: {reason_id}",
+        severity=min(1.0, 0.2 + ratio),  # deterministic advisory scoring
+        evidence={
+            "reason_id": reason_id,
+            "count": count,
+            "total_events": total,
+            "ratio": round(ratio, 6),
+        },
+        guardrails=[
+            # minimal set for this finding type
+            "AMG-001",  # deny-by-default
+            "AMG-014",  # no silent fallback
+            "AMG-051",  # no fix without test
+        ],
+    )
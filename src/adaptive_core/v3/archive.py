@@ -0,0 +1,325 @@
+# src/adaptive_core/v3/archive.py
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .canonicalize import CanonicalizeResult, canonicalize_event
+from .context_hash import CANONICAL_ENCODER
+from .evidence_store import EvidenceStoreV3, _event_epoch
+from .reason_ids import ReasonId
+
+
+INDEX_FILE = "index.jsonl"
+SEGMENT_PATTERN = "segment-{:06d}.jsonl.gz"
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveBatch:
+    """
+    Index entry for one flushed batch: a single gzip member in a segment.
+
+    Epochs are UTC seconds of the earliest/latest event timestamps in the
+    batch; context_hashes are in archive order.
+    """
+    segment: str
+    offset: int
+    length: int
+    count: int
+    min_epoch: float
+    max_epoch: float
+    context_hashes: List[str]
+
+
+def _invalid(detail: str) -> ValueError:
+    return ValueError(f"{ReasonId.AC_V3_ARCHIVE_INVALID.value}: {detail}")
+
+
+def _record_line(item: CanonicalizeResult) -> str:
+    return CANONICAL_ENCODER.encode(
+        {"context_hash": item.context_hash, "event": item.event.to_canonical_dict()}
+    )
+
+
+class EvidenceArchiveV3:
+    """
+    Append-only, compressed archive for events evicted from EvidenceStoreV3.
+
+    Layout under `directory`:
+      - segment-000001.jsonl.gz, ...: each flushed batch is appended as one
+        gzip member holding canonical JSON lines; a segment is sealed once it
+        holds `segment_max_events` events and a new one is started
+      - index.jsonl: one line per batch (segment, byte offset/length, count,
+        timestamp range, context hashes), appended after the batch is written
+
+    Guarantees:
+      - nothing is rewritten; reopening a directory continues where the
+        index ends (segment bytes not covered by the index are ignored and
+        a torn final index line is dropped)
+      - output is deterministic: gzip members carry no mtime
+      - replay yields events in archive order and re-verifies every
+        context_hash, failing closed with AC_V3_ARCHIVE_INVALID
+
+    Disk I/O is opt-in: nothing is touched until events are flushed.
+    Plug it into a store with EvidenceStoreV3(archive=...), and report
+    CapabilitiesV3(archival="ON") when it is in use.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        batch_size: int = 256,
+        segment_max_events: int = 65536,
+        compresslevel: int = 6,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        if segment_max_events <= 0:
+            raise ValueError("segment_max_events must be > 0")
+        if not 0 <= compresslevel <= 9:
+            raise ValueError("compresslevel must be in [0, 9]")
+
+        self.directory = Path(directory)
+        self.batch_size = batch_size
+        self.segment_max_events = segment_max_events
+        self.compresslevel = compresslevel
+
+        self._pending: List[CanonicalizeResult] = []
+        self._batches: List[ArchiveBatch] = []
+        self._by_hash: Dict[str, List[int]] = {}
+        self._segment_no = 1
+        self._segment_count = 0
+        self._load_index()
+
+    # ------------------------------------------------------------------ #
+    # Writing
+    # ------------------------------------------------------------------ #
+
+    def archive_events(self, items: Sequence[CanonicalizeResult]) -> None:
+        """Buffer events; a batch is written once `batch_size` are pending."""
+        self._pending.extend(items)
+        while len(self._pending) >= self.batch_size:
+            batch, self._pending = self._pending[: self.batch_size], self._pending[self.batch_size :]
+            self._write_batch(batch)
+
+    def flush(self) -> None:
+        """Write all pending events (as one batch)."""
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._write_batch(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "EvidenceArchiveV3":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Events buffered but not yet written."""
+        return len(self._pending)
+
+    @property
+    def archived(self) -> int:
+        """Events written and indexed."""
+        return sum(b.count for b in self._batches)
+
+    @property
+    def batches(self) -> List[ArchiveBatch]:
+        return list(self._batches)
+
+    @property
+    def segments(self) -> List[str]:
+        """Segment file names, oldest first."""
+        return list(dict.fromkeys(b.segment for b in self._batches))
+
+    def _write_batch(self, batch: List[CanonicalizeResult]) -> None:
+        if self._segment_count >= self.segment_max_events:
+            self._segment_no += 1
+            self._segment_count = 0
+
+        payload = "".join(_record_line(it) + "\n" for it in batch).encode("utf-8")
+        member = gzip.compress(payload, compresslevel=self.compresslevel, mtime=0)
+        epochs = [_event_epoch(it.event.timestamp) for it in batch]
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = SEGMENT_PATTERN.format(self._segment_no)
+        with open(self.directory / name, "ab") as fh:
+            offset = fh.tell()
+            fh.write(member)
+
+        entry = ArchiveBatch(
+            segment=name,
+            offset=offset,
+            length=len(member),
+            count=len(batch),
+            min_epoch=min(epochs),
+            max_epoch=max(epochs),
+            context_hashes=[it.context_hash for it in batch],
+        )
+        with open(self.directory / INDEX_FILE, "a", encoding="utf-8") as fh:
+            fh.write(CANONICAL_ENCODER.encode(_entry_to_dict(entry)) + "\n")
+
+        self._remember(entry)
+        self._segment_count += entry.count
+
+    # ------------------------------------------------------------------ #
+    # Reading
+    # ------------------------------------------------------------------ #
+
+    def contains(self, context_hash: str) -> bool:
+        return context_hash in self._by_hash
+
+    def find(self, context_hash: str) -> List[CanonicalizeResult]:
+        """All archived events with this context_hash, in archive order."""
+        out: List[CanonicalizeResult] = []
+        for i in self._by_hash.get(context_hash, []):
+            out.extend(it for it in self._read_batch(self._batches[i]) if it.context_hash == context_hash)
+        return out
+
+    def replay(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[CanonicalizeResult]:
+        """
+        Yield archived events in archive order (pending events are flushed first).
+
+        start / end are v3 timestamps bounding event time as [start, end);
+        batches entirely outside the range are skipped without decompressing.
+        """
+        lo = None if start is None else _event_epoch(start)
+        hi = None if end is None else _event_epoch(end)
+        self.flush()
+        return self._replay(lo, hi)
+
+    def _replay(self, lo: Optional[float], hi: Optional[float]) -> Iterator[CanonicalizeResult]:
+        for entry in list(self._batches):
+            if lo is not None and entry.max_epoch < lo:
+                continue
+            if hi is not None and entry.min_epoch >= hi:
+                continue
+            for item in self._read_batch(entry):
+                if lo is None and hi is None:
+                    yield item
+                    continue
+                epoch = _event_epoch(item.event.timestamp)
+                if (lo is None or epoch >= lo) and (hi is None or epoch < hi):
+                    yield item
+
+    def replay_into(
+        self,
+        store: EvidenceStoreV3,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> int:
+        """Replay into `store` in archive order; returns how many it accepted."""
+        accepted = 0
+        for item in self.replay(start, end):
+            if store.add(item):
+                accepted += 1
+        return accepted
+
+    def _read_batch(self, entry: ArchiveBatch) -> List[CanonicalizeResult]:
+        try:
+            with open(self.directory / entry.segment, "rb") as fh:
+                fh.seek(entry.offset)
+                member = fh.read(entry.length)
+            if len(member) != entry.length:
+                raise _invalid(f"{entry.segment} truncated at offset {entry.offset}")
+            payload = gzip.decompress(member).decode("utf-8")
+        except (OSError, EOFError, zlib.error, UnicodeDecodeError) as e:
+            raise _invalid(f"cannot read {entry.segment} at offset {entry.offset} ({e})") from e
+
+        lines = payload.splitlines()
+        if len(lines) != entry.count:
+            raise _invalid(f"{entry.segment} batch at offset {entry.offset} has {len(lines)} records, index says {entry.count}")
+
+        out: List[CanonicalizeResult] = []
+        for line, expected in zip(lines, entry.context_hashes):
+            try:
+                record = json.loads(line)
+                item = canonicalize_event(record["event"])
+            except (ValueError, KeyError, TypeError) as e:
+                raise _invalid(f"bad record in {entry.segment} ({e})") from e
+            if item.context_hash != record.get("context_hash") or item.context_hash != expected:
+                raise _invalid(f"context_hash mismatch in {entry.segment}")
+            out.append(item)
+        return out
+
+    # ------------------------------------------------------------------ #
+    # Index
+    # ------------------------------------------------------------------ #
+
+    def _remember(self, entry: ArchiveBatch) -> None:
+        i = len(self._batches)
+        self._batches.append(entry)
+        for h in entry.context_hashes:
+            positions = self._by_hash.setdefault(h, [])
+            if not positions or positions[-1] != i:
+                positions.append(i)
+
+    def _load_index(self) -> None:
+        path = self.directory / INDEX_FILE
+        if not path.exists():
+            return
+        valid_bytes = 0
+        with open(path, "rb") as fh:
+            for n, raw in enumerate(fh, start=1):
+                if not raw.endswith(b"\n"):
+                    # Torn final write: that batch was never acknowledged.
+                    break
+                try:
+                    entry = _entry_from_dict(json.loads(raw.decode("utf-8")))
+                except (ValueError, KeyError, TypeError) as e:
+                    raise _invalid(f"{INDEX_FILE} line {n} ({e})") from e
+                self._remember(entry)
+                valid_bytes += len(raw)
+        if valid_bytes != path.stat().st_size:
+            os.truncate(path, valid_bytes)
+
+        if self._batches:
+            last = self._batches[-1].segment
+            self._segment_no = int(last[len("segment-") : len("segment-") + 6])
+            self._segment_count = sum(b.count for b in self._batches if b.segment == last)
+
+
+def _entry_to_dict(entry: ArchiveBatch) -> Dict[str, Any]:
+    return {
+        "segment": entry.segment,
+        "offset": entry.offset,
+        "length": entry.length,
+        "count": entry.count,
+        "min_epoch": entry.min_epoch,
+        "max_epoch": entry.max_epoch,
+        "context_hashes": entry.context_hashes,
+    }
+
+
+def _entry_from_dict(d: Dict[str, Any]) -> ArchiveBatch:
+    return ArchiveBatch(
+        segment=str(d["segment"]),
+        offset=int(d["offset"]),
+        length=int(d["length"]),
+        count=int(d["count"]),
+        min_epoch=float(d["min_epoch"]),
+        max_epoch=float(d["max_epoch"]),
+        context_hashes=[str(h) for h in d["context_hashes"]],
+    )
+
+
+def archive_window(store: EvidenceStoreV3, archive: EvidenceArchiveV3) -> int:
+    """
+    Archive the events still in the store's hot window (e.g. at shutdown).
+
+    Does not modify the store. Returns the number of events handed over.
+    """
+    batch = list(store.iter_window())
+    archive.archive_events(batch)
+    archive.flush()
+    return len(batch)
@@ -4,19 +4,41 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Mapping, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Protocol, Tuple, TypeVar, Union
 
-from .context_hash import compute_context_hash
+from .context_hash import SHA256_EMPTY, compute_context_hash, make_canonical_encode
 from .events import ObservedEventV3
 from .reason_ids import ReasonId
 
 
+class Canonicalizable(Protocol):
+    def to_canonical_dict(self) -> Dict[str, Any]: ...
+
+
+C = TypeVar("C", bound=Canonicalizable)
+R = TypeVar("R")
+
+
 @dataclass(frozen=True, slots=True)
 class CanonicalizeResult:
     event: ObservedEventV3
     context_hash: str
 
 
+@dataclass(frozen=True, slots=True)
+class CanonicalizeFailure:
+    """
+    Per-item failure reported by canonicalize_events() and
+    canonicalize_node_summaries().
+
+    index is the 0-based position in the input stream; message is the
+    full fail-closed error text (it starts with reason_id).
+    """
+    index: int
+    reason_id: ReasonId
+    message: str
+
+
 def _require_str(m: Mapping[str, Any], key: str) -> str:
     if key not in m:
         raise ValueError(f"{ReasonId.AC_V3_MISSING_FIELD.value}: missing {key!r}")
@@ -65,15 +87,7 @@ def _require_meta(m: Mapping[str, Any], key: str) -> Dict[str, Any]:
     return dict(meta)
 
 
-def canonicalize_event(raw: Mapping[str, Any]) -> CanonicalizeResult:
-    """
-    Canonicalize a raw mapping into a strict ObservedEventV3 + deterministic context_hash.
-
-    Fail-closed:
-    - missing fields => error with reason id
-    - type mismatch => error with reason id
-    - no silent defaults
-    """
+def _build_event(raw: Mapping[str, Any]) -> ObservedEventV3:
     if not isinstance(raw, Mapping):
         raise ValueError(f"{ReasonId.AC_V3_INVALID_EVENT.value}: raw must be a mapping")
 
@@ -88,7 +102,7 @@ def canonicalize_event(raw: Mapping[str, Any]) -> CanonicalizeResult:
     if reason_id is not None and (not isinstance(reason_id, str) or not reason_id.strip()):
         raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: 'reason_id' must be str or None")
 
-    ev = ObservedEventV3(
+    return ObservedEventV3(
         source_layer=source_layer,
         event_type=event_type,
         severity=severity,
@@ -98,6 +112,147 @@ def canonicalize_event(raw: Mapping[str, Any]) -> CanonicalizeResult:
         reason_id=reason_id,
     )
 
+
+def _build_event_fast(raw: Any) -> Optional[ObservedEventV3]:
+    """
+    Inline validation for the common, well-typed record: a plain dict with
+    str fields, a float severity and a plain-dict meta.
+
+    Returns None for anything else (or anything invalid) so the caller
+    falls back to _build_event(), which coerces or reports the exact
+    reason. Whatever it accepts, _build_event() accepts with an equal result.
+    """
+    if type(raw) is not dict:
+        return None
+    try:
+        source_layer = raw["source_layer"]
+        event_type = raw["event_type"]
+        severity = raw["severity"]
+        timestamp = raw["timestamp"]
+        correlation_id = raw["correlation_id"]
+        meta = raw["meta"]
+    except KeyError:
+        return None
+    reason_id = raw.get("reason_id")
+
+    if not (
+        type(source_layer) is str
+        and type(event_type) is str
+        and type(correlation_id) is str
+        and type(timestamp) is str
+        and type(severity) is float
+        and type(meta) is dict
+        and source_layer.strip()
+        and event_type.strip()
+        and correlation_id.strip()
+        and 0.0 <= severity <= 1.0
+        and timestamp.endswith("Z")
+    ):
+        return None
+    if reason_id is not None and (type(reason_id) is not str or not reason_id.strip()):
+        return None
+    for k in meta:
+        if type(k) is not str:
+            return None
+    try:
+        datetime.fromisoformat(timestamp[:-1])
+    except ValueError:
+        return None
+
+    return ObservedEventV3(
+        source_layer=source_layer,
+        event_type=event_type,
+        severity=severity,
+        timestamp=timestamp,
+        correlation_id=correlation_id,
+        meta=dict(meta),
+        reason_id=reason_id,
+    )
+
+
+def canonicalize_event(raw: Mapping[str, Any]) -> CanonicalizeResult:
+    """
+    Canonicalize a raw mapping into a strict ObservedEventV3 + deterministic context_hash.
+
+    Fail-closed:
+    - missing fields => error with reason id
+    - type mismatch => error with reason id
+    - no silent defaults
+    """
+    ev = _build_event(raw)
     canonical = ev.to_canonical_dict()
     ctx = compute_context_hash(canonical)
     return CanonicalizeResult(event=ev, context_hash=ctx)
+
+
+def reason_of(message: str) -> ReasonId:
+    """Recover the ReasonId prefix from a fail-closed error message."""
+    prefix = message.split(":", 1)[0]
+    try:
+        return ReasonId(prefix)
+    except ValueError:
+        return ReasonId.AC_V3_INVALID_EVENT
+
+
+def canonicalize_batch(
+    build: Callable[[Any], C],
+    raws: Iterable[Any],
+    result: Callable[[C, str], R],
+) -> Iterator[Union[R, CanonicalizeFailure]]:
+    """
+    Shared fail-closed batch loop behind canonicalize_events() and
+    canonicalize_node_summaries().
+
+    build(raw) validates one input and raises ValueError (message prefixed
+    with a reason id) when it is invalid; result(obj, context_hash) makes
+    the output for a valid one. Streams one output per input, in input
+    order; a bad item becomes a CanonicalizeFailure and never aborts the
+    batch. Values that cannot be JSON-encoded are reported as
+    AC_V3_META_INVALID. One C JSON encoder is reused for the whole batch.
+    """
+    encode = make_canonical_encode()
+    sha_empty = SHA256_EMPTY
+
+    for index, raw in enumerate(raws):
+        try:
+            obj = build(raw)
+            payload = encode(obj.to_canonical_dict())
+        except ValueError as e:
+            message = str(e)
+            yield CanonicalizeFailure(index=index, reason_id=reason_of(message), message=message)
+            continue
+        except TypeError as e:
+            yield CanonicalizeFailure(
+                index=index,
+                reason_id=ReasonId.AC_V3_META_INVALID,
+                message=f"{ReasonId.AC_V3_META_INVALID.value}: meta must be JSON-serializable ({e})",
+            )
+            continue
+
+        h = sha_empty.copy()
+        h.update(payload.encode("utf-8"))
+        yield result(obj, h.hexdigest())
+
+
+def _build_event_batch(raw: Any) -> ObservedEventV3:
+    return _build_event_fast(raw) or _build_event(raw)
+
+
+def canonicalize_events(
+    raws: Iterable[Mapping[str, Any]],
+) -> Iterator[Union[CanonicalizeResult, CanonicalizeFailure]]:
+    """
+    Batch canonicalization for bulk replay.
+
+    Streams one output per input, in input order:
+    - CanonicalizeResult for valid items (identical to canonicalize_event)
+    - CanonicalizeFailure for invalid items (reason id + message)
+
+    A bad record never aborts the batch. Meta values that cannot be
+    JSON-encoded are reported as AC_V3_META_INVALID.
+
+    Faster per item than looping over canonicalize_event(): well-typed
+    dict records are validated inline (anything else takes the full
+    path), and one C JSON encoder is reused for the whole batch.
+    """
+    return canonicalize_batch(_build_event_batch, raws, CanonicalizeResult)
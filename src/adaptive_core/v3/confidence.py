@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from importlib import resources
 from typing import Dict
 
+from .lazy_resource import LazyResource
 from .reason_ids import ReasonId
 
 
@@ -27,8 +28,16 @@ class ConfidenceWeights:
             raise ValueError(f"{ReasonId.AC_V3_CONF_WEIGHTS_INVALID.value}: weights must sum to 1.0, got {s}")
 
 
+def _read_weights_text() -> str:
+    return resources.files("adaptive_core.v3").joinpath("confidence_weights_v3.json").read_text(encoding="utf-8")
+
+
 def load_confidence_weights() -> ConfidenceWeights:
-    text = resources.files("adaptive_core.v3").joinpath("confidence_weights_v3.json").read_text(encoding="utf-8")
+    # Always reads and validates the resource; hot paths use get_confidence_weights().
+    return _parse_weights(_read_weights_text())
+
+
+def _parse_weights(text: str) -> ConfidenceWeights:
     data = json.loads(text)
     if not isinstance(data, dict) or "version" not in data or "weights" not in data:
         raise ValueError(f"{ReasonId.AC_V3_CONF_WEIGHTS_INVALID.value}: invalid root")
@@ -48,6 +57,26 @@ def load_confidence_weights() -> ConfidenceWeights:
     return cw
 
 
+# Process-wide cache. The reader is looked up on each load so a swapped
+# _read_weights_text (tests) is honoured by reload_confidence_weights().
+_WEIGHTS: LazyResource[ConfidenceWeights] = LazyResource(lambda: _read_weights_text(), _parse_weights)
+
+
+def get_confidence_weights() -> ConfidenceWeights:
+    """Shared, lazily loaded weights (frozen; read and validated once per process)."""
+    return _WEIGHTS.get()
+
+
+def confidence_weights_content_hash() -> str:
+    """SHA-256 of the weights resource behind get_confidence_weights(), for audits."""
+    return _WEIGHTS.content_hash()
+
+
+def reload_confidence_weights() -> ConfidenceWeights:
+    """Drop the cached weights and load them again (fail-closed on errors)."""
+    return _WEIGHTS.reload()
+
+
 def compute_confidence(
     *,
     recurrence_ratio: float,
@@ -4,7 +4,20 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict
+import json.encoder
+from typing import Any, Callable, Dict, Iterator
+
+
+# Shared canonical encoder: same output as
+# json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+# without rebuilding an encoder on every call.
+CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+# Pristine SHA-256 state; copy() is cheaper than a fresh constructor lookup.
+SHA256_EMPTY = hashlib.sha256()
+
+# Characters buffered before each hasher update when streaming.
+STREAM_CHUNK_CHARS = 64 * 1024
 
 
 def compute_context_hash(canonical: Dict[str, Any]) -> str:
@@ -15,6 +28,95 @@ def compute_context_hash(canonical: Dict[str, Any]) -> str:
     - UTF-8 encoding
     - SHA-256 hex digest
     """
-    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return digest
+    payload = CANONICAL_ENCODER.encode(canonical)
+    h = SHA256_EMPTY.copy()
+    h.update(payload.encode("utf-8"))
+    return h.hexdigest()
+
+
+def make_canonical_encode() -> Callable[[Any], str]:
+    """
+    Return an encode(obj) function with the same output as
+    CANONICAL_ENCODER.encode, for batch loops.
+
+    JSONEncoder.encode builds a new C encoder on every call; this builds
+    one and reuses it, which saves a fixed cost per item. Each returned
+    function owns its circular-reference markers, so use one per batch
+    and do not share it between threads. Falls back to
+    CANONICAL_ENCODER.encode when the C accelerator is unavailable.
+    """
+    c_make_encoder = getattr(json.encoder, "c_make_encoder", None)
+    if c_make_encoder is None:
+        return CANONICAL_ENCODER.encode
+
+    markers: Dict[int, Any] = {}
+    enc = CANONICAL_ENCODER
+    c_encode = c_make_encoder(
+        markers,
+        enc.default,
+        json.encoder.encode_basestring,
+        enc.indent,
+        enc.key_separator,
+        enc.item_separator,
+        enc.sort_keys,
+        enc.skipkeys,
+        enc.allow_nan,
+    )
+
+    def encode(obj: Any) -> str:
+        try:
+            return "".join(c_encode(obj, 0))
+        except BaseException:
+            # A failed encode leaves its containers in markers; drop them so a
+            # later object reusing one of those ids is not seen as circular.
+            markers.clear()
+            raise
+
+    return encode
+
+
+def iter_canonical_json(obj: Any) -> Iterator[str]:
+    """
+    Yield the canonical JSON encoding of `obj` in pieces.
+
+    Joining the pieces gives exactly
+    json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).
+    """
+    return CANONICAL_ENCODER.iterencode(obj)
+
+
+def sha256_text(text: str, chunk_chars: int = STREAM_CHUNK_CHARS) -> str:
+    """
+    SHA-256 hex digest of text.encode("utf-8"), encoding slice by slice.
+
+    Avoids holding a second, full-size bytes copy of a large string.
+    """
+    h = SHA256_EMPTY.copy()
+    for i in range(0, len(text), chunk_chars):
+        h.update(text[i : i + chunk_chars].encode("utf-8"))
+    return h.hexdigest()
+
+
+def canonical_json_sha256(obj: Any, chunk_chars: int = STREAM_CHUNK_CHARS) -> str:
+    """
+    SHA-256 hex digest of the canonical JSON of `obj`, without ever
+    materializing the full JSON string or its bytes.
+
+    Same digest as compute_context_hash(obj). Peak memory is bounded by
+    `chunk_chars` plus the encoder's nesting depth, which makes it the
+    right choice for large reports / meta payloads. For small events the
+    one-shot compute_context_hash() is faster.
+    """
+    h = SHA256_EMPTY.copy()
+    buf: list[str] = []
+    size = 0
+    for piece in CANONICAL_ENCODER.iterencode(obj):
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_chars:
+            h.update("".join(buf).encode("utf-8"))
+            buf.clear()
+            size = 0
+    if buf:
+        h.update("".join(buf).encode("utf-8"))
+    return h.hexdigest()
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Union
 
+from .analyze import top_k
 from .findings import FindingV3
 from .node_summary import NodeSummaryEventV3
 
@@ -21,29 +22,77 @@ class CorrelationSnapshot:
     nodes_reporting_reason_id: Dict[str, int]
 
 
-def aggregate_node_summaries(events: Iterable[NodeSummaryEventV3]) -> CorrelationSnapshot:
-    total_nodes = 0
-    total_events = 0
-    by_reason: Counter[str] = Counter()
-    nodes_reporting: Counter[str] = Counter()
+def _sorted_counts(counter: Counter[str]) -> Dict[str, int]:
+    return {k: counter[k] for k in sorted(counter)}
+
+
+class CorrelationAggregator:
+    """
+    Streaming, mergeable builder for CorrelationSnapshot.
+
+    - add() folds in one NodeSummaryEventV3; merge() folds in another
+      aggregator or a finished CorrelationSnapshot
+    - merging is associative and commutative: any grouping or order of the
+      same summaries yields the same snapshot (counter keys are sorted)
+    - partials must hold disjoint summaries; like aggregate_node_summaries(),
+      each summary counts as one node
+    """
+
+    def __init__(self) -> None:
+        self._total_nodes = 0
+        self._total_events = 0
+        self._by_reason: Counter[str] = Counter()
+        self._nodes_reporting: Counter[str] = Counter()
 
-    for ev in events:
-        total_nodes += 1
-        total_events += int(ev.total_events)
+    def add(self, ev: NodeSummaryEventV3) -> "CorrelationAggregator":
+        self._total_nodes += 1
+        self._total_events += int(ev.total_events)
 
         # Aggregate reason counts
         for rid, count in ev.by_upstream_reason_id.items():
             if count <= 0:
                 continue
-            by_reason[rid] += int(count)
-            nodes_reporting[rid] += 1
+            self._by_reason[rid] += int(count)
+            self._nodes_reporting[rid] += 1
+        return self
+
+    def add_many(self, events: Iterable[NodeSummaryEventV3]) -> "CorrelationAggregator":
+        for ev in events:
+            self.add(ev)
+        return self
+
+    def merge(self, other: Union["CorrelationAggregator", CorrelationSnapshot]) -> "CorrelationAggregator":
+        """Fold in a partial aggregate (aggregator or snapshot); returns self."""
+        snap = other.snapshot() if isinstance(other, CorrelationAggregator) else other
+        self._total_nodes += snap.total_nodes
+        self._total_events += snap.total_events
+        self._by_reason.update(snap.by_upstream_reason_id)
+        self._nodes_reporting.update(snap.nodes_reporting_reason_id)
+        return self
+
+    def snapshot(self) -> CorrelationSnapshot:
+        return CorrelationSnapshot(
+            total_nodes=self._total_nodes,
+            total_events=self._total_events,
+            by_upstream_reason_id=_sorted_counts(self._by_reason),
+            nodes_reporting_reason_id=_sorted_counts(self._nodes_reporting),
+        )
 
-    return CorrelationSnapshot(
-        total_nodes=total_nodes,
-        total_events=total_events,
-        by_upstream_reason_id=dict(by_reason),
-        nodes_reporting_reason_id=dict(nodes_reporting),
-    )
+
+def aggregate_node_summaries(events: Iterable[NodeSummaryEventV3]) -> CorrelationSnapshot:
+    return CorrelationAggregator().add_many(events).snapshot()
+
+
+def merge_correlation_snapshots(snapshots: Iterable[CorrelationSnapshot]) -> CorrelationSnapshot:
+    """
+    Combine partial snapshots (e.g. from regional collectors) into one.
+
+    Equal to aggregating all underlying summaries at once, in any order.
+    """
+    agg = CorrelationAggregator()
+    for snap in snapshots:
+        agg.merge(snap)
+    return agg.snapshot()
 
 
 def generate_correlation_findings(
@@ -51,42 +100,51 @@ def generate_correlation_findings(
     *,
     min_nodes: int = 3,
     min_nodes_ratio: float = 0.50,
+    max_findings: Optional[int] = None,
 ) -> List[FindingV3]:
     """
     Deterministic findings when a reason_id appears across many nodes.
 
-    min_nodes_ratio is relative to total_nodes.
+    min_nodes_ratio is relative to total_nodes. max_findings optionally
+    keeps only the most widespread reasons (most nodes, ties by reason_id);
+    findings are always emitted in reason_id order.
     """
+    if max_findings is not None and max_findings < 0:
+        raise ValueError("max_findings must be >= 0")
     findings: List[FindingV3] = []
     if snapshot.total_nodes <= 0:
         return findings
 
-    for rid in sorted(snapshot.nodes_reporting_reason_id.keys()):
-        nodes = int(snapshot.nodes_reporting_reason_id[rid])
-        ratio = nodes / snapshot.total_nodes
+    # Threshold first (linear), then sort only what survives.
+    candidates = [
+        (rid, int(nodes))
+        for rid, nodes in snapshot.nodes_reporting_reason_id.items()
+        if int(nodes) >= min_nodes and int(nodes) / snapshot.total_nodes >= min_nodes_ratio
+    ]
 
-        if nodes >= min_nodes and ratio >= min_nodes_ratio:
-            findings.append(
-                FindingV3(
-                    finding_id=f"AC-CORR::REASON-WIDESPREAD::{rid}",
-                    title=f"Reason ID widespread across nodes: {rid}",
-                    severity=min(1.0, 0.3 + ratio),
-                    evidence={
-                        "reason_id": rid,
-                        "nodes_reporting": nodes,
-                        "total_nodes": snapshot.total_nodes,
-                        "nodes_ratio": round(ratio, 6),
-                        "aggregated_count": int(snapshot.by_upstream_reason_id.get(rid, 0)),
-                    },
-                    guardrails=[
-                        "AMG-001",  # deny-by-default
-                        "AMG-011",  # fail-closed defaults
-                        "AMG-036",  # observability without leakage
-                        "AMG-061",  # privacy-preserving aggregation
-                        "AMG-062",  # no raw data centralization
-                        "AMG-063",  # strict summary schemas
-                    ],
-                )
+    for rid, nodes in sorted(top_k(candidates, max_findings)):
+        ratio = nodes / snapshot.total_nodes
+        findings.append(
+            FindingV3(
+                finding_id=f"AC-CORR::REASON-WIDESPREAD::{rid}",
+                title=f"Reason ID widespread across nodes: {rid}",
+                severity=min(1.0, 0.3 + ratio),
+                evidence={
+                    "reason_id": rid,
+                    "nodes_reporting": nodes,
+                    "total_nodes": snapshot.total_nodes,
+                    "nodes_ratio": round(ratio, 6),
+                    "aggregated_count": int(snapshot.by_upstream_reason_id.get(rid, 0)),
+                },
+                guardrails=[
+                    "AMG-001",  # deny-by-default
+                    "AMG-011",  # fail-closed defaults
+                    "AMG-036",  # observability without leakage
+                    "AMG-061",  # privacy-preserving aggregation
+                    "AMG-062",  # no raw data centralization
+                    "AMG-063",  # strict summary schemas
+                ],
             )
+        )
 
     return findings
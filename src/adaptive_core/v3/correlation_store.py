@@ -0,0 +1,220 @@
+# src/adaptive_core/v3/correlation_store.py
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterator, Iterable, List, Optional, Tuple
+
+from .context_hash import compute_context_hash
+from .correlation import CorrelationSnapshot, merge_correlation_snapshots
+from .evidence_store import _event_epoch
+from .node_summary import NodeSummaryEventV3
+from .reason_ids import ReasonId
+
+
+# (window_start epoch, window_end epoch)
+WindowKey = Tuple[float, float]
+
+
+def _supersedes(new: Tuple[NodeSummaryEventV3, str], old: Tuple[NodeSummaryEventV3, str]) -> bool:
+    """
+    Whether `new` replaces `old` for the same node and window.
+
+    Counters only grow while a window is open, so the summary with more
+    events is the later one; equal totals fall back to the greater
+    context_hash. The winner never depends on arrival order.
+    """
+    return (new[0].total_events, new[1]) > (old[0].total_events, old[1])
+
+
+class _WindowCounters:
+    """Latest summary per node for one window, plus its running correlation counters."""
+
+    __slots__ = ("window_start", "window_end", "nodes", "total_events", "by_reason", "nodes_reporting", "_snapshot")
+
+    def __init__(self, window_start: str, window_end: str) -> None:
+        self.window_start = window_start
+        self.window_end = window_end
+        self.nodes: Dict[str, Tuple[NodeSummaryEventV3, str]] = {}
+        self.total_events = 0
+        self.by_reason: Counter[str] = Counter()
+        self.nodes_reporting: Counter[str] = Counter()
+        self._snapshot: Optional[CorrelationSnapshot] = None
+
+    def put(self, ev: NodeSummaryEventV3, ctx: str) -> None:
+        old = self.nodes.get(ev.node_id)
+        if old is not None:
+            self._count(old[0], -1)
+        self.nodes[ev.node_id] = (ev, ctx)
+        self._count(ev, 1)
+        self._snapshot = None
+
+    def _count(self, ev: NodeSummaryEventV3, sign: int) -> None:
+        # Same rules as CorrelationAggregator.add(): zero counts are ignored.
+        self.total_events += sign * ev.total_events
+        for rid, count in ev.by_upstream_reason_id.items():
+            if count <= 0:
+                continue
+            for counter, step in ((self.by_reason, count), (self.nodes_reporting, 1)):
+                value = counter[rid] + sign * step
+                if value:
+                    counter[rid] = value
+                else:
+                    del counter[rid]
+
+    def snapshot(self) -> CorrelationSnapshot:
+        if self._snapshot is None:
+            self._snapshot = CorrelationSnapshot(
+                total_nodes=len(self.nodes),
+                total_events=self.total_events,
+                by_upstream_reason_id={k: self.by_reason[k] for k in sorted(self.by_reason)},
+                nodes_reporting_reason_id={k: self.nodes_reporting[k] for k in sorted(self.nodes_reporting)},
+            )
+        return self._snapshot
+
+
+class CorrelationStoreV3:
+    """
+    Time-indexed store of node summaries for correlation.
+
+    - summaries are indexed by window (window_start, window_end, compared as
+      UTC instants) and node_id; one summary per node per window is kept
+    - when a node re-sends a window, the summary with the larger
+      total_events wins (ties: larger context_hash), so the retained set is
+      the same for any arrival order; exact duplicates are rejected
+    - each window keeps pre-aggregated correlation counters, updated on
+      ingest, so snapshot(start, end) merges one partial per window instead
+      of rescanning summaries
+    - max_windows optionally bounds memory: the windows with the oldest
+      window_start are dropped first, and summaries for a window older
+      than all kept ones are rejected, so the newest max_windows windows
+      are kept whatever the arrival order
+
+    snapshot(start, end) equals aggregate_node_summaries() over the retained
+    summaries whose window_start lies in [start, end).
+    """
+
+    def __init__(self, max_windows: Optional[int] = None) -> None:
+        if max_windows is not None and max_windows <= 0:
+            raise ValueError("max_windows must be > 0")
+        self._max_windows = max_windows
+        self._windows: Dict[WindowKey, _WindowCounters] = {}
+        self._order: List[WindowKey] = []  # sorted window keys
+
+        self._replaced = 0
+        self._superseded_rejected = 0
+        self._late_rejected = 0
+        self._evicted_windows = 0
+
+    @property
+    def max_windows(self) -> Optional[int]:
+        return self._max_windows
+
+    @property
+    def total_summaries(self) -> int:
+        return sum(len(w.nodes) for w in self._windows.values())
+
+    @property
+    def replaced(self) -> int:
+        """Stored summaries later replaced by a newer one for the same node and window."""
+        return self._replaced
+
+    @property
+    def superseded_rejected(self) -> int:
+        """Incoming summaries rejected because the stored one wins (including exact duplicates)."""
+        return self._superseded_rejected
+
+    @property
+    def late_rejected(self) -> int:
+        """Summaries for windows older than everything kept while at max_windows."""
+        return self._late_rejected
+
+    @property
+    def evicted_windows(self) -> int:
+        return self._evicted_windows
+
+    def add(self, ev: NodeSummaryEventV3, context_hash: Optional[str] = None) -> bool:
+        """
+        Ingest one canonical node summary.
+
+        context_hash is the value returned by canonicalize_node_summary();
+        it is recomputed when omitted. Returns True if the summary is now
+        the one kept for its node and window. A window that ends at or
+        before its start fails closed with AC_V3_NON_CANONICAL.
+        """
+        start = _event_epoch(ev.window_start)
+        end = _event_epoch(ev.window_end)
+        if end <= start:
+            raise ValueError(
+                f"{ReasonId.AC_V3_NON_CANONICAL.value}: window_end must be after window_start"
+            )
+        ctx = context_hash if context_hash is not None else compute_context_hash(ev.to_canonical_dict())
+
+        key = (start, end)
+        window = self._windows.get(key)
+        if window is None:
+            if self._is_evicted(key):
+                self._late_rejected += 1
+                return False
+            window = self._windows[key] = _WindowCounters(ev.window_start, ev.window_end)
+            insort(self._order, key)
+            self._evict()
+        else:
+            old = window.nodes.get(ev.node_id)
+            if old is not None:
+                if not _supersedes((ev, ctx), old):
+                    self._superseded_rejected += 1
+                    return False
+                self._replaced += 1
+        window.put(ev, ctx)
+        return True
+
+    def add_many(self, items: Iterable[Tuple[NodeSummaryEventV3, str]]) -> int:
+        """Ingest (summary, context_hash) pairs as returned by canonicalize_node_summary(); returns how many were kept."""
+        return sum(1 for ev, ctx in items if self.add(ev, ctx))
+
+    def windows(self) -> List[Tuple[str, str]]:
+        """(window_start, window_end) of every retained window, oldest first."""
+        return [(self._windows[k].window_start, self._windows[k].window_end) for k in self._order]
+
+    def summaries(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[NodeSummaryEventV3]:
+        """Retained summaries with window_start in [start, end), by window then node_id."""
+        for key in self._range(start, end):
+            nodes = self._windows[key].nodes
+            for node_id in sorted(nodes):
+                yield nodes[node_id][0]
+
+    def snapshot(self, start: Optional[str] = None, end: Optional[str] = None) -> CorrelationSnapshot:
+        """
+        Correlation snapshot for windows starting in [start, end).
+
+        start / end are v3 timestamps; either may be omitted. Cost is the
+        number of windows in range times their distinct reason ids.
+        """
+        return merge_correlation_snapshots(self._windows[k].snapshot() for k in self._range(start, end))
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _range(self, start: Optional[str], end: Optional[str]) -> List[WindowKey]:
+        lo = 0 if start is None else bisect_left(self._order, (_event_epoch(start), float("-inf")))
+        hi = len(self._order) if end is None else bisect_left(self._order, (_event_epoch(end), float("-inf")))
+        return self._order[lo:hi]
+
+    def _is_evicted(self, key: WindowKey) -> bool:
+        # A new window older than everything kept while at capacity would be
+        # dropped straight away; refuse it instead.
+        return (
+            self._max_windows is not None
+            and len(self._order) >= self._max_windows
+            and key < self._order[0]
+        )
+
+    def _evict(self) -> None:
+        if self._max_windows is None:
+            return
+        while len(self._order) > self._max_windows:
+            del self._windows[self._order.pop(0)]
+            self._evicted_windows += 1
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 from dataclasses import dataclass
 from typing import Any, Dict, Literal
 
+from .context_hash import sha256_text
 from .reason_ids import ReasonId
 from .report_models import UpgradeReportV3
 
@@ -41,8 +40,10 @@ class ReportEnvelopeV3:
 def _stable_hash(payload: str) -> str:
     """
     Deterministic SHA-256 hash of canonical JSON string.
+
+    Encoded to UTF-8 in slices so large reports are not duplicated as bytes.
     """
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return sha256_text(payload)
 
 
 def create_report_envelope(
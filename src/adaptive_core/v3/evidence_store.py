@@ -2,13 +2,86 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import Counter, deque
-from dataclasses import dataclass
-from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Sequence, Set, Tuple
 
 from .canonicalize import CanonicalizeResult
 
 
+# Optional joint counters, enabled per store via `composite_counters`.
+COMPOSITE_COUNTERS: Tuple[str, ...] = (
+    "source_layer_reason_id",
+    "event_type_reason_id",
+    "severity_histogram",
+)
+
+# Severity histogram resolution: bin i covers [i / N, (i + 1) / N); 1.0 lands in the last bin.
+SEVERITY_BINS = 10
+
+
+def severity_bin(severity: float) -> int:
+    return min(int(severity * SEVERITY_BINS), SEVERITY_BINS - 1)
+
+
+class ReadOnlyCounts(dict):  # type: ignore[type-arg]
+    """
+    Counter dict handed out by store snapshots.
+
+    Equal to (and JSON-encoded like) a plain dict, but every mutator raises
+    TypeError, so one caller cannot change a cached snapshot under another.
+    Unlike MappingProxyType it pickles, so snapshots still cross process
+    pools. dict(counts) gives a mutable copy.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def sorted_from(cls, counts: Mapping[Any, int]) -> "ReadOnlyCounts":
+        """Copy of `counts` in sorted key order, the canonical form every snapshot uses."""
+        return cls((k, counts[k]) for k in sorted(counts))
+
+    def _readonly(self, *args: object, **kwargs: object) -> None:
+        raise TypeError("snapshot counters are read-only; copy with dict() first")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[object, int]]]:
+        return (type(self), (dict(self),))
+
+
+def _event_epoch(timestamp: str) -> float:
+    """
+    Epoch seconds of a canonical v3 timestamp (ISO8601 + trailing 'Z').
+
+    Naive values are UTC by contract; explicit offsets are honoured.
+    """
+    dt = datetime.fromisoformat(timestamp[:-1] if timestamp.endswith("Z") else timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class EvictionSink(Protocol):
+    """
+    Receives events evicted from the hot window (e.g. EvidenceArchiveV3).
+
+    Called at most once per add(), with the evicted events oldest first.
+    """
+
+    def archive_events(self, items: Sequence[CanonicalizeResult]) -> None:  # pragma: no cover - protocol
+        ...
+
+
+def _discount(counter: Counter, key: object) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
 @dataclass(frozen=True, slots=True)
 class EvidenceSnapshot:
     """
@@ -18,6 +91,12 @@ class EvidenceSnapshot:
     by_source_layer: Dict[str, int]
     by_event_type: Dict[str, int]
     by_upstream_reason_id: Dict[str, int]
+    # Lifetime count of events rejected as duplicates (dedup mode only).
+    duplicates_rejected: int = 0
+    # Composite counters (empty unless enabled on the store).
+    by_source_layer_reason_id: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    by_event_type_reason_id: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    severity_histogram: Dict[int, int] = field(default_factory=dict)
 
 
 class EvidenceStoreV3:
@@ -26,36 +105,188 @@ class EvidenceStoreV3:
 
     - bounded memory (maxlen)
     - deterministic counters
-    - no persistence in Step 3 (future step can add archival)
+    - no persistence of its own; an optional `archive` sink receives every
+      evicted event (see EvidenceArchiveV3), nothing else touches disk
+    - optional dedup: an event whose context_hash is already in the hot
+      window is rejected (upstream retries must not inflate counters)
+    - optional time window: with window_seconds set, the window covers
+      (newest_timestamp - window_seconds, newest_timestamp] using the
+      events' own canonical timestamps (never the wall clock); the window
+      is kept in timestamp order and max_events still caps memory
+    - optional composite counters (see COMPOSITE_COUNTERS): joint
+      (source_layer, reason_id) / (event_type, reason_id) counts and a
+      severity histogram, maintained incrementally like the base counters
     """
 
-    def __init__(self, max_events: int = 1000) -> None:
+    def __init__(
+        self,
+        max_events: int = 1000,
+        dedup: bool = False,
+        window_seconds: Optional[float] = None,
+        composite_counters: Iterable[str] = (),
+        archive: Optional[EvictionSink] = None,
+    ) -> None:
         if max_events <= 0:
             raise ValueError("max_events must be > 0")
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+        composites = frozenset(composite_counters)
+        unknown = sorted(composites - set(COMPOSITE_COUNTERS))
+        if unknown:
+            raise ValueError(f"unknown composite counter(s): {unknown}")
         self._max_events = max_events
-        self._window: Deque[CanonicalizeResult] = deque(maxlen=max_events)
+        self._window: Deque[CanonicalizeResult] = deque()
+
+        # Time window: epochs parallel to _window, newest epoch seen so far.
+        self._window_seconds = window_seconds
+        self._epochs: Deque[float] = deque()
+        self._newest: Optional[float] = None
+        self._late_rejected = 0
+
+        # Change counter + snapshot cache stamped with it. _window_version
+        # moves only when the window itself changes (not on duplicate
+        # rejections), so open iterators survive retried events.
+        self._generation = 0
+        self._window_version = 0
+        self._snapshot: Optional[EvidenceSnapshot] = None
+        self._snapshot_generation = -1
+
+        # Archival: events evicted during the current add(), handed over in one batch.
+        self._archive = archive
+        self._evicted: List[CanonicalizeResult] = []
+
+        # Dedup index: context hashes currently in the window.
+        self._dedup = dedup
+        self._hashes: Set[str] = set()
+        self._duplicates_rejected = 0
 
         self._by_source_layer: Counter[str] = Counter()
         self._by_event_type: Counter[str] = Counter()
         self._by_upstream_reason_id: Counter[str] = Counter()
 
+        # Composite counters; None when disabled so the hot path skips them.
+        self._composites = composites
+        self._by_layer_reason: Optional[Counter[Tuple[str, str]]] = (
+            Counter() if "source_layer_reason_id" in composites else None
+        )
+        self._by_type_reason: Optional[Counter[Tuple[str, str]]] = (
+            Counter() if "event_type_reason_id" in composites else None
+        )
+        self._severity_hist: Optional[Counter[int]] = (
+            Counter() if "severity_histogram" in composites else None
+        )
+
     @property
     def max_events(self) -> int:
         return self._max_events
 
-    def add(self, item: CanonicalizeResult) -> None:
+    @property
+    def dedup(self) -> bool:
+        return self._dedup
+
+    @property
+    def archive(self) -> Optional[EvictionSink]:
+        return self._archive
+
+    @property
+    def composite_counters(self) -> Tuple[str, ...]:
+        """Enabled composite counters, in COMPOSITE_COUNTERS order."""
+        return tuple(name for name in COMPOSITE_COUNTERS if name in self._composites)
+
+    @property
+    def window_seconds(self) -> Optional[float]:
+        return self._window_seconds
+
+    @property
+    def generation(self) -> int:
+        """Bumped on every change visible in snapshot() or the window."""
+        return self._generation
+
+    @property
+    def late_rejected(self) -> int:
+        """Events rejected because they were already older than the time window (or than a full window)."""
+        return self._late_rejected
+
+    def add(self, item: CanonicalizeResult) -> bool:
         """
         Add a canonicalized event into the hot window.
 
-        If the deque is full, the oldest item is evicted and counters are updated.
+        If the window is full, the oldest item is evicted and counters are updated;
+        evicted items are passed to the archive sink, if one is configured.
+        In time-window mode, items that fall out of the time span are expired
+        from the left as newer events arrive.
+
+        Returns False (and stores nothing) when dedup is enabled and an event
+        with the same context_hash is already in the window, or when in
+        time-window mode the event is already outside the window or is
+        older than every event in a window that is at max_events.
         """
-        # If eviction will occur, remove counts for the evicted record first.
-        if len(self._window) == self._window.maxlen:
-            evicted = self._window[0]
-            self._decrement(evicted)
+        window_seconds = self._window_seconds
+        epoch: Optional[float] = None
+        if window_seconds is not None:
+            epoch = _event_epoch(item.event.timestamp)
+            if self._newest is not None and epoch <= self._newest - window_seconds:
+                self._late_rejected += 1
+                return False
+            if len(self._window) >= self._max_events and epoch < self._epochs[0]:
+                # Older than everything in a full window: it would be the
+                # one evicted, so it is never stored or counted.
+                self._late_rejected += 1
+                return False
+
+        if self._dedup:
+            if item.context_hash in self._hashes:
+                self._duplicates_rejected += 1
+                self._generation += 1
+                return False
+            self._hashes.add(item.context_hash)
+
+        if epoch is None or window_seconds is None:
+            # If eviction will occur, remove counts for the evicted record first.
+            if len(self._window) == self._max_events:
+                self._evict_left()
+            self._window.append(item)
+        else:
+            self._insert_by_time(item, epoch, window_seconds)
 
-        self._window.append(item)
         self._increment(item)
+        self._generation += 1
+        self._window_version += 1
+        if self._evicted:
+            evicted, self._evicted = self._evicted, []
+            if self._archive is not None:
+                self._archive.archive_events(evicted)
+        return True
+
+    def _insert_by_time(self, item: CanonicalizeResult, epoch: float, window_seconds: float) -> None:
+        if not self._epochs or epoch >= self._epochs[-1]:
+            self._window.append(item)
+            self._epochs.append(epoch)
+        else:
+            # Late arrival still inside the span: keep timestamp order
+            # (after any equal timestamps, preserving arrival order).
+            i = bisect_right(self._epochs, epoch)
+            self._window.insert(i, item)
+            self._epochs.insert(i, epoch)
+
+        if self._newest is None or epoch > self._newest:
+            self._newest = epoch
+
+        cutoff = self._newest - window_seconds
+        while self._epochs[0] <= cutoff:
+            self._evict_left()
+        while len(self._window) > self._max_events:
+            self._evict_left()
+
+    def _evict_left(self) -> None:
+        evicted = self._window.popleft()
+        if self._epochs:
+            self._epochs.popleft()
+        self._decrement(evicted)
+        if self._dedup:
+            self._hashes.discard(evicted.context_hash)
+        if self._archive is not None:
+            self._evicted.append(evicted)
 
     def _increment(self, item: CanonicalizeResult) -> None:
         ev = item.event
@@ -63,6 +294,12 @@ class EvidenceStoreV3:
         self._by_event_type[ev.event_type] += 1
         if ev.reason_id:
             self._by_upstream_reason_id[ev.reason_id] += 1
+            if self._by_layer_reason is not None:
+                self._by_layer_reason[(ev.source_layer, ev.reason_id)] += 1
+            if self._by_type_reason is not None:
+                self._by_type_reason[(ev.event_type, ev.reason_id)] += 1
+        if self._severity_hist is not None:
+            self._severity_hist[severity_bin(ev.severity)] += 1
 
     def _decrement(self, item: CanonicalizeResult) -> None:
         ev = item.event
@@ -78,15 +315,71 @@ class EvidenceStoreV3:
             self._by_upstream_reason_id[ev.reason_id] -= 1
             if self._by_upstream_reason_id[ev.reason_id] <= 0:
                 del self._by_upstream_reason_id[ev.reason_id]
+            if self._by_layer_reason is not None:
+                _discount(self._by_layer_reason, (ev.source_layer, ev.reason_id))
+            if self._by_type_reason is not None:
+                _discount(self._by_type_reason, (ev.event_type, ev.reason_id))
+        if self._severity_hist is not None:
+            _discount(self._severity_hist, severity_bin(ev.severity))
 
     def snapshot(self) -> EvidenceSnapshot:
-        return EvidenceSnapshot(
-            total_events=len(self._window),
-            by_source_layer=dict(self._by_source_layer),
-            by_event_type=dict(self._by_event_type),
-            by_upstream_reason_id=dict(self._by_upstream_reason_id),
-        )
+        """
+        Deterministic snapshot of the current counters.
+
+        The same snapshot object is returned until the store changes, so
+        polling between adds costs nothing. The snapshot is frozen and its
+        counter dicts are ReadOnlyCounts in sorted key order, so no caller
+        can alter it and it pickles byte-for-byte like a merged sharded
+        snapshot over the same events.
+        """
+        if self._snapshot is None or self._snapshot_generation != self._generation:
+            self._snapshot = EvidenceSnapshot(
+                total_events=len(self._window),
+                by_source_layer=ReadOnlyCounts.sorted_from(self._by_source_layer),
+                by_event_type=ReadOnlyCounts.sorted_from(self._by_event_type),
+                by_upstream_reason_id=ReadOnlyCounts.sorted_from(self._by_upstream_reason_id),
+                duplicates_rejected=self._duplicates_rejected,
+                by_source_layer_reason_id=ReadOnlyCounts.sorted_from(self._by_layer_reason or {}),
+                by_event_type_reason_id=ReadOnlyCounts.sorted_from(self._by_type_reason or {}),
+                severity_histogram=ReadOnlyCounts.sorted_from(self._severity_hist or {}),
+            )
+            self._snapshot_generation = self._generation
+        return self._snapshot
 
     def iter_window(self) -> Iterable[CanonicalizeResult]:
         # stable iteration order: deque order (oldest->newest)
         return list(self._window)
+
+    def iter_events(self) -> Iterator[CanonicalizeResult]:
+        """
+        Lazy oldest->newest iteration over the hot window (no copy).
+
+        Raises RuntimeError if the window changes mid-iteration (a rejected
+        duplicate does not count); use iter_window() for a stable copy.
+        """
+        version = self._window_version
+        for item in self._window:
+            if self._window_version != version:
+                break
+            yield item
+        if self._window_version != version:
+            raise RuntimeError("EvidenceStoreV3 changed during iteration")
+
+    def iter_tail(self, n: int) -> Iterator[CanonicalizeResult]:
+        """
+        Lazy iteration over the newest `n` items, oldest->newest.
+
+        Cost is proportional to n, not to the window size.
+        Raises RuntimeError if the window changes mid-iteration.
+        """
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        return self._iter_tail(n)
+
+    def _iter_tail(self, n: int) -> Iterator[CanonicalizeResult]:
+        version = self._window_version
+        size = len(self._window)
+        for i in range(max(0, size - n), size):
+            if self._window_version != version:
+                raise RuntimeError("EvidenceStoreV3 changed during iteration")
+            yield self._window[i]
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from importlib import resources
 from typing import Dict, Iterable
 
+from ..lazy_resource import LazyResource
 from ..reason_ids import ReasonId
 
 
@@ -50,16 +51,25 @@ def _is_valid_amg_id(gid: object) -> bool:
     )
 
 
+def _read_registry_text() -> str:
+    return (
+        resources.files("adaptive_core.v3.guardrails")
+        .joinpath("amg_guardrails_v1.json")
+        .read_text(encoding="utf-8")
+    )
+
+
 def load_registry() -> GuardrailRegistry:
     """
     Load guardrails registry from package JSON.
     Deterministic: strict validation + stable ordering.
+
+    Always reads and validates the resource; hot paths use get_registry().
     """
-    data_text = (
-        resources.files("adaptive_core.v3.guardrails")
-        .joinpath("amg_guardrails_v1.json")
-        .read_text(encoding="utf-8")
-    )
+    return _parse_registry(_read_registry_text())
+
+
+def _parse_registry(data_text: str) -> GuardrailRegistry:
     data = json.loads(data_text)
 
     if not isinstance(data, dict) or "guardrails" not in data or "version" not in data:
@@ -94,3 +104,28 @@ def load_registry() -> GuardrailRegistry:
         guardrails[gid] = Guardrail(id=gid, title=title.strip(), category=category.strip())
 
     return GuardrailRegistry(guardrails=guardrails, version=version)
+
+
+# Process-wide cache. The reader is looked up on each load so a swapped
+# _read_registry_text (tests) is honoured by reload_registry().
+_REGISTRY: LazyResource[GuardrailRegistry] = LazyResource(lambda: _read_registry_text(), _parse_registry)
+
+
+def get_registry() -> GuardrailRegistry:
+    """
+    Shared, lazily loaded registry (read and validated once per process).
+
+    GuardrailRegistry is read-only, so one instance is safe to share.
+    Call reload_registry() to pick up a changed resource.
+    """
+    return _REGISTRY.get()
+
+
+def registry_content_hash() -> str:
+    """SHA-256 of the registry resource behind get_registry(), for audits."""
+    return _REGISTRY.content_hash()
+
+
+def reload_registry() -> GuardrailRegistry:
+    """Drop the cached registry and load it again (fail-closed on errors)."""
+    return _REGISTRY.reload()
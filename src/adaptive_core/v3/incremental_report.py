@@ -0,0 +1,209 @@
+# src/adaptive_core/v3/incremental_report.py
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from . import analyze
+from .analyze import AnalyzeConfig
+from .correlation import CorrelationSnapshot, generate_correlation_findings
+from .drift import LayerContract, detect_contract_drift
+from .evidence_store import EvidenceSnapshot
+from .findings import FindingV3
+from .reason_ids import ReasonId
+from .report_builder import DEFAULT_CONFIDENCE_THRESHOLD, _assemble_report, _validate_report_inputs
+from .report_models import CapabilitiesV3, UpgradeReportV3
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceDelta:
+    """
+    Signed change in evidence counters between two snapshots.
+
+    Keys absent from a dict did not move.
+    """
+    total_events: int = 0
+    by_source_layer: Dict[str, int] = field(default_factory=dict)
+    by_event_type: Dict[str, int] = field(default_factory=dict)
+    by_upstream_reason_id: Dict[str, int] = field(default_factory=dict)
+
+
+def _diff(old: Mapping[str, int], new: Mapping[str, int]) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    for key in sorted(set(old) | set(new)):
+        d = new.get(key, 0) - old.get(key, 0)
+        if d:
+            out[key] = d
+    return out
+
+
+def snapshot_delta(old: EvidenceSnapshot, new: EvidenceSnapshot) -> EvidenceDelta:
+    """The EvidenceDelta that turns `old` into `new`."""
+    return EvidenceDelta(
+        total_events=new.total_events - old.total_events,
+        by_source_layer=_diff(old.by_source_layer, new.by_source_layer),
+        by_event_type=_diff(old.by_event_type, new.by_event_type),
+        by_upstream_reason_id=_diff(old.by_upstream_reason_id, new.by_upstream_reason_id),
+    )
+
+
+def _check(counter: Counter, delta: Mapping[str, int], name: str) -> None:
+    for key, d in delta.items():
+        if counter.get(key, 0) + d < 0:
+            raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: {name}[{key!r}] would go negative")
+
+
+def _apply(counter: Counter, delta: Mapping[str, int]) -> None:
+    for key, d in delta.items():
+        value = counter.get(key, 0) + d
+        if value:
+            counter[key] = value
+        else:
+            counter.pop(key, None)
+
+
+class IncrementalReportBuilderV3:
+    """
+    Keeps a report current as evidence counters move.
+
+    - drift and correlation findings depend only on construction inputs
+      and are computed once
+    - apply(delta) recomputes only the reason_id findings whose count moved;
+      when total_events moves every ratio changes, so all reasons are redone
+      (still from counters, never from events)
+    - report() is assembled by the same code as build_upgrade_report(), so it
+      equals a from-scratch build on snapshot()
+
+    Counters that reach zero are dropped, as EvidenceStoreV3 does.
+    analyze_config / max_correlation_findings behave as in
+    build_upgrade_report(); top-K is applied when the report is assembled.
+    """
+
+    def __init__(
+        self,
+        *,
+        report_id: str,
+        target_layers: List[str],
+        capabilities: CapabilitiesV3,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        snapshot: Optional[EvidenceSnapshot] = None,
+        drift_contracts: Optional[List[LayerContract]] = None,
+        include_drift_graph: bool = False,
+        correlation_snapshot: Optional[CorrelationSnapshot] = None,
+        include_correlation: bool = False,
+        analyze_config: Optional[AnalyzeConfig] = None,
+        max_correlation_findings: Optional[int] = None,
+    ) -> None:
+        _validate_report_inputs(
+            report_id=report_id,
+            target_layers=target_layers,
+            drift_contracts=drift_contracts,
+            correlation_snapshot=correlation_snapshot,
+            include_correlation=include_correlation,
+            analyze_config=analyze_config,
+            max_correlation_findings=max_correlation_findings,
+        )
+        self._report_id = report_id
+        self._target_layers = list(target_layers)
+        self._capabilities = capabilities
+        self._confidence_threshold = confidence_threshold
+        self._drift_contracts = drift_contracts
+        self._include_drift_graph = include_drift_graph
+        self._correlation_snapshot = correlation_snapshot
+        self._include_correlation = include_correlation
+        # Same thresholds (and top-K) as build_upgrade_report().
+        self._cfg = analyze_config or AnalyzeConfig()
+
+        self._drift_findings: List[FindingV3] = detect_contract_drift(drift_contracts) if drift_contracts else []
+        self._corr_findings: List[FindingV3] = []
+        if include_correlation and correlation_snapshot is not None:
+            self._corr_findings = generate_correlation_findings(
+                correlation_snapshot, max_findings=max_correlation_findings
+            )
+
+        self._total = 0
+        self._by_source_layer: Counter[str] = Counter()
+        self._by_event_type: Counter[str] = Counter()
+        self._by_reason: Counter[str] = Counter()
+        self._reason_findings: Dict[str, FindingV3] = {}
+        self._report: Optional[UpgradeReportV3] = None
+
+        if snapshot is not None:
+            self.apply(snapshot_delta(EvidenceSnapshot(0, {}, {}, {}), snapshot))
+
+    @property
+    def report_id(self) -> str:
+        return self._report_id
+
+    def apply(self, delta: EvidenceDelta, report_id: Optional[str] = None) -> UpgradeReportV3:
+        """
+        Fold a counter delta in and return the refreshed report.
+
+        The delta is validated before anything changes: a delta that would
+        drive a counter negative fails closed and leaves the state as it was.
+        """
+        total = self._total + delta.total_events
+        if total < 0:
+            raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: total_events would go negative")
+        if report_id is not None and (not report_id or not isinstance(report_id, str)):
+            raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: report_id")
+        _check(self._by_source_layer, delta.by_source_layer, "by_source_layer")
+        _check(self._by_event_type, delta.by_event_type, "by_event_type")
+        _check(self._by_reason, delta.by_upstream_reason_id, "by_upstream_reason_id")
+
+        if report_id is not None:
+            self._report_id = report_id
+        _apply(self._by_source_layer, delta.by_source_layer)
+        _apply(self._by_event_type, delta.by_event_type)
+        _apply(self._by_reason, delta.by_upstream_reason_id)
+        self._total = total
+
+        touched: Iterable[str] = delta.by_upstream_reason_id
+        if delta.total_events:
+            touched = set(self._by_reason) | set(delta.by_upstream_reason_id)
+        self._refresh_reasons(touched)
+        self._report = None
+        return self.report()
+
+    def snapshot(self) -> EvidenceSnapshot:
+        """Current counters, in the shape build_upgrade_report() consumes."""
+        return EvidenceSnapshot(
+            total_events=self._total,
+            by_source_layer=dict(self._by_source_layer),
+            by_event_type=dict(self._by_event_type),
+            by_upstream_reason_id=dict(self._by_reason),
+        )
+
+    def report(self) -> UpgradeReportV3:
+        if self._report is None:
+            self._report = _assemble_report(
+                report_id=self._report_id,
+                target_layers=self._target_layers,
+                snapshot=self.snapshot(),
+                capabilities=self._capabilities,
+                confidence_threshold=self._confidence_threshold,
+                evidence_findings=self._evidence_findings(),
+                drift_findings=self._drift_findings,
+                corr_findings=self._corr_findings,
+                drift_contracts=self._drift_contracts,
+                include_drift_graph=self._include_drift_graph,
+                correlation_snapshot=self._correlation_snapshot,
+                include_correlation=self._include_correlation,
+            )
+        return self._report
+
+    def _evidence_findings(self) -> List[FindingV3]:
+        # Every reason past the thresholds has a finding; apply the same
+        # top-K selection as generate_findings() over them.
+        candidates = [(r, self._by_reason[r]) for r in self._reason_findings]
+        return [self._reason_findings[r] for r, _ in sorted(analyze.top_k(candidates, self._cfg.max_findings))]
+
+    def _refresh_reasons(self, reasons: Iterable[str]) -> None:
+        for reason_id in reasons:
+            finding = analyze.reason_spike_finding(reason_id, self._by_reason.get(reason_id, 0), self._total, self._cfg)
+            if finding is None:
+                self._reason_findings.pop(reason_id, None)
+            else:
+                self._reason_findings[reason_id] = finding
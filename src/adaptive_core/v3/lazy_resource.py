@@ -0,0 +1,55 @@
+# src/adaptive_core/v3/lazy_resource.py
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from .context_hash import sha256_text
+
+
+T = TypeVar("T")
+
+
+class LazyResource(Generic[T]):
+    """
+    Packaged text resource, read and parsed once per process.
+
+    - get() returns the shared parsed value; parsing must fail closed
+      (raise) on invalid text, and nothing is cached in that case
+    - content_hash() is the SHA-256 of the exact text that was parsed,
+      for audits
+    - reload() drops the cached value and loads it again
+
+    Loading is guarded by a lock, so concurrent first calls read the
+    resource once. The parsed value is shared, so it must be read-only.
+    """
+
+    __slots__ = ("_read", "_parse", "_lock", "_cached")
+
+    def __init__(self, read: Callable[[], str], parse: Callable[[str], T]) -> None:
+        self._read = read
+        self._parse = parse
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[T, str]] = None
+
+    def get(self) -> T:
+        return self._load()[0]
+
+    def content_hash(self) -> str:
+        return self._load()[1]
+
+    def reload(self) -> T:
+        with self._lock:
+            self._cached = None
+        return self.get()
+
+    def _load(self) -> Tuple[T, str]:
+        cached = self._cached
+        if cached is None:
+            with self._lock:
+                cached = self._cached
+                if cached is None:
+                    text = self._read()
+                    cached = self._cached = (self._parse(text), sha256_text(text))
+        return cached
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Iterable, Iterator, Mapping, Union
 
+from .canonicalize import CanonicalizeFailure, canonicalize_batch
 from .context_hash import compute_context_hash
 from .reason_ids import ReasonId
 
@@ -60,12 +61,15 @@ def _require_int_ge0(m: Mapping[str, Any], key: str) -> int:
     if key not in m:
         raise ValueError(f"{ReasonId.AC_V3_MISSING_FIELD.value}: missing {key!r}")
     v = m[key]
-    if isinstance(v, bool):
-        raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: {key!r} must be int")
-    try:
-        n = int(v)
-    except Exception as e:
-        raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: {key!r} must be int") from e
+    if type(v) is int:
+        n = v
+    else:
+        if isinstance(v, bool):
+            raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: {key!r} must be int")
+        try:
+            n = int(v)
+        except Exception as e:
+            raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: {key!r} must be int") from e
     if n < 0:
         raise ValueError(f"{ReasonId.AC_V3_NON_CANONICAL.value}: {key!r} must be >= 0")
     return n
@@ -81,12 +85,17 @@ def _require_reason_counter(m: Mapping[str, Any], key: str) -> Dict[str, int]:
     for rk, rv in v.items():
         if not isinstance(rk, str) or not rk.strip():
             raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: reason_id key must be non-empty str")
-        if isinstance(rv, bool):
-            raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: reason_id count must be int")
-        try:
-            c = int(rv)
-        except Exception as e:
-            raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: reason_id count must be int") from e
+        # Plain ints (the common case) need no conversion; bool is a
+        # subclass of int, so it never takes this path.
+        if type(rv) is int:
+            c = rv
+        else:
+            if isinstance(rv, bool):
+                raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: reason_id count must be int")
+            try:
+                c = int(rv)
+            except Exception as e:
+                raise ValueError(f"{ReasonId.AC_V3_TYPE_INVALID.value}: reason_id count must be int") from e
         if c < 0:
             raise ValueError(f"{ReasonId.AC_V3_NON_CANONICAL.value}: reason_id count must be >= 0")
         out[rk.strip()] = c
@@ -97,21 +106,36 @@ def canonicalize_node_summary(raw: Mapping[str, Any]) -> tuple[NodeSummaryEventV
     """
     Canonicalize a raw mapping into NodeSummaryEventV3 + deterministic context_hash.
     """
+    ev = _build_node_summary(raw)
+    ctx = compute_context_hash(ev.to_canonical_dict())
+    return ev, ctx
+
+
+def _build_node_summary(raw: Mapping[str, Any]) -> NodeSummaryEventV3:
     if not isinstance(raw, Mapping):
         raise ValueError(f"{ReasonId.AC_V3_INVALID_EVENT.value}: raw must be a mapping")
 
-    node_id = _require_nonempty_str(raw, "node_id")
-    window_start = _require_iso_z(raw, "window_start")
-    window_end = _require_iso_z(raw, "window_end")
-    total_events = _require_int_ge0(raw, "total_events")
-    by_reason = _require_reason_counter(raw, "by_upstream_reason_id")
-
-    ev = NodeSummaryEventV3(
-        node_id=node_id,
-        window_start=window_start,
-        window_end=window_end,
-        total_events=total_events,
-        by_upstream_reason_id=by_reason,
+    return NodeSummaryEventV3(
+        node_id=_require_nonempty_str(raw, "node_id"),
+        window_start=_require_iso_z(raw, "window_start"),
+        window_end=_require_iso_z(raw, "window_end"),
+        total_events=_require_int_ge0(raw, "total_events"),
+        by_upstream_reason_id=_require_reason_counter(raw, "by_upstream_reason_id"),
     )
-    ctx = compute_context_hash(ev.to_canonical_dict())
-    return ev, ctx
+
+
+def canonicalize_node_summaries(
+    raws: Iterable[Mapping[str, Any]],
+) -> Iterator[Union[tuple[NodeSummaryEventV3, str], CanonicalizeFailure]]:
+    """
+    Batch canonicalization for fleet collection.
+
+    Streams one output per input, in input order:
+    - (NodeSummaryEventV3, context_hash) for valid items (identical to
+      canonicalize_node_summary)
+    - CanonicalizeFailure for invalid items (reason id + message)
+
+    A bad summary never aborts the batch. The canonical encoder and hasher
+    state are shared across all items.
+    """
+    return canonicalize_batch(_build_node_summary, raws, lambda ev, ctx: (ev, ctx))
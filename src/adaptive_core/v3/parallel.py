@@ -0,0 +1,283 @@
+# src/adaptive_core/v3/parallel.py
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from .canonicalize import CanonicalizeFailure, CanonicalizeResult, canonicalize_events
+from .node_summary import NodeSummaryEventV3, canonicalize_node_summaries
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ChunkFn = Callable[[int, List[T]], List[R]]
+
+NodeSummaryOutput = Union[Tuple[NodeSummaryEventV3, str], CanonicalizeFailure]
+
+
+def ordered_chunked_map(
+    fn: ChunkFn[T, R],
+    items: Iterable[T],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[R]:
+    """
+    Deterministic parallel map over chunks of `items`.
+
+    - `fn(offset, chunk)` is called once per chunk, where `offset` is the
+      input index of the chunk's first item; it must be a picklable,
+      module-level function when a process pool is used.
+    - Outputs are yielded lazily, flattened, in input order regardless of
+      which worker finishes first.
+    - At most `max_pending` chunks (default 2 * workers) are in flight, so
+      memory stays bounded for arbitrarily long inputs.
+    - workers=1 runs inline with no pool; an explicit `executor` is used
+      as-is and not shut down.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be > 0")
+    if max_pending is None:
+        max_pending = 2 * workers
+    if max_pending <= 0:
+        raise ValueError("max_pending must be > 0")
+
+    # Validation above runs eagerly; the work itself is lazy.
+    return _ordered_chunked_map(fn, items, workers, chunk_size, max_pending, executor)
+
+
+def _ordered_chunked_map(
+    fn: ChunkFn[T, R],
+    items: Iterable[T],
+    workers: int,
+    chunk_size: int,
+    max_pending: int,
+    executor: Optional[Executor],
+) -> Iterator[R]:
+    it = iter(items)
+
+    def chunks() -> Iterator[tuple[int, List[T]]]:
+        offset = 0
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield offset, chunk
+            offset += len(chunk)
+
+    if executor is None and workers == 1:
+        for offset, chunk in chunks():
+            yield from fn(offset, chunk)
+        return
+
+    own_pool = executor is None
+    pool: Executor = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+    pending: Deque[Future[List[R]]] = deque()
+    try:
+        for offset, chunk in chunks():
+            pending.append(pool.submit(fn, offset, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for f in pending:
+            f.cancel()
+        if own_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _offset_chunk(
+    batch: Callable[[Iterable[Mapping[str, Any]]], Iterable[Union[R, CanonicalizeFailure]]],
+    offset: int,
+    chunk: List[Mapping[str, Any]],
+) -> List[Union[R, CanonicalizeFailure]]:
+    # Run a batch API over one chunk, shifting failure indexes from
+    # chunk-relative to global. Bound with partial(), which pickles.
+    out: List[Union[R, CanonicalizeFailure]] = []
+    for item in batch(chunk):
+        if isinstance(item, CanonicalizeFailure):
+            item = replace(item, index=item.index + offset)
+        out.append(item)
+    return out
+
+
+def canonicalize_events_parallel(
+    raws: Iterable[Mapping[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Union[CanonicalizeResult, CanonicalizeFailure]]:
+    """
+    Parallel canonicalize-and-hash over a process pool.
+
+    Same outputs, in the same order, as canonicalize_events(raws):
+    failures keep their global input index. Raw mappings must be
+    picklable. Intended for replaying large archives; for small inputs
+    the pool start-up cost outweighs the gain. Every canonical event is
+    pickled back to the parent, so it only pays off with spare cores;
+    when only hashes are needed, context_hashes_parallel() ships far
+    less (see benchmarks/bench_v3_canonicalize_parallel.py).
+    """
+    return ordered_chunked_map(
+        partial(_offset_chunk, canonicalize_events),
+        raws,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+        executor=executor,
+    )
+
+
+def _context_hash_chunk(
+    offset: int, chunk: List[Mapping[str, Any]]
+) -> List[Union[Tuple[int, str], CanonicalizeFailure]]:
+    out: List[Union[Tuple[int, str], CanonicalizeFailure]] = []
+    for index, item in enumerate(canonicalize_events(chunk), offset):
+        if isinstance(item, CanonicalizeFailure):
+            out.append(replace(item, index=index))
+        else:
+            out.append((index, item.context_hash))
+    return out
+
+
+def context_hashes_parallel(
+    raws: Iterable[Mapping[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Union[Tuple[int, str], CanonicalizeFailure]]:
+    """
+    Parallel context hashes only, for verifying or indexing an archive.
+
+    Yields (index, context_hash) for valid inputs and CanonicalizeFailure
+    for invalid ones, in input order; the hashes equal those of
+    canonicalize_events(raws). Workers send back ~70 bytes per event
+    instead of the whole canonical event, which is most of the result
+    pickling cost of canonicalize_events_parallel().
+    """
+    return ordered_chunked_map(
+        _context_hash_chunk,
+        raws,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+        executor=executor,
+    )
+
+
+def canonicalize_node_summaries_parallel(
+    raws: Iterable[Mapping[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[NodeSummaryOutput]:
+    """
+    Parallel canonicalize-and-hash of node summaries over a process pool.
+
+    Same outputs, in the same order, as canonicalize_node_summaries(raws):
+    (event, context_hash) pairs identical to canonicalize_node_summary(),
+    and failures with their global input index. For collection rounds
+    that repeat every few seconds, pass a long-lived `executor` so the
+    pool start-up cost is paid once.
+    """
+    return ordered_chunked_map(
+        partial(_offset_chunk, canonicalize_node_summaries),
+        raws,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+        executor=executor,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BulkCanonicalizeStats:
+    """
+    Counters for one bulk canonicalization call.
+
+    Timing fields are wall-clock measurements for operators; they never
+    feed into snapshots or reports.
+    """
+    items_read: int
+    canonicalized: int
+    failures: int
+    failures_by_reason: Dict[str, int]
+    elapsed_seconds: float
+    items_per_second: float
+
+
+@dataclass(frozen=True, slots=True)
+class NodeSummaryBatch:
+    """Outputs of canonicalize_node_summaries_batch(), one per input in input order."""
+    items: List[NodeSummaryOutput]
+    stats: BulkCanonicalizeStats
+
+    @property
+    def summaries(self) -> List[Tuple[NodeSummaryEventV3, str]]:
+        return [it for it in self.items if not isinstance(it, CanonicalizeFailure)]
+
+    @property
+    def failures(self) -> List[CanonicalizeFailure]:
+        return [it for it in self.items if isinstance(it, CanonicalizeFailure)]
+
+
+def canonicalize_node_summaries_batch(
+    raws: Iterable[Mapping[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> NodeSummaryBatch:
+    """
+    Canonicalize one collection round of node summaries and report throughput.
+
+    Runs canonicalize_node_summaries_parallel() to completion. Invalid
+    summaries become CanonicalizeFailure entries (never exceptions) and
+    are counted by reason id.
+    """
+    outputs = canonicalize_node_summaries_parallel(
+        raws,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+        executor=executor,
+    )
+    started = time.perf_counter()
+    items = list(outputs)
+    elapsed = time.perf_counter() - started
+
+    failures_by_reason: Counter[str] = Counter(
+        it.reason_id.value for it in items if isinstance(it, CanonicalizeFailure)
+    )
+    failures = sum(failures_by_reason.values())
+    stats = BulkCanonicalizeStats(
+        items_read=len(items),
+        canonicalized=len(items) - failures,
+        failures=failures,
+        failures_by_reason=dict(sorted(failures_by_reason.items())),
+        elapsed_seconds=elapsed,
+        items_per_second=(len(items) / elapsed) if elapsed > 0 else 0.0,
+    )
+    return NodeSummaryBatch(items=items, stats=stats)
@@ -2,16 +2,123 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple, List
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, List
 
+from .analyze import AnalyzeConfig
+from .confidence import get_confidence_weights
 from .correlation import CorrelationSnapshot
 from .drift import LayerContract
 from .evidence_store import EvidenceSnapshot
 from .envelope import ReportEnvelopeV3, create_report_envelope
+from .guardrails.registry import get_registry
+from .parallel import ordered_chunked_map
+from .reason_ids import ReasonId
 from .report_builder import build_upgrade_report, render_report_json, render_report_md
 from .report_models import CapabilitiesV3, UpgradeReportV3
 
 
+PipelineResult = Tuple[UpgradeReportV3, str, str, ReportEnvelopeV3]
+
+
+OUTPUT_KINDS: Tuple[str, ...] = ("object", "json", "markdown", "envelope")
+
+
+class PipelineOutputV3:
+    """
+    Lazily rendered pipeline outputs for one report.
+
+    The report object is built up front; canonical JSON, markdown and the
+    envelope are rendered on first access and cached, so callers that only
+    read report_type / confidence never pay for rendering. The envelope
+    reuses the cached canonical JSON.
+    """
+
+    __slots__ = ("report", "_json", "_markdown", "_envelope")
+
+    def __init__(self, report: UpgradeReportV3) -> None:
+        self.report = report
+        self._json: Optional[str] = None
+        self._markdown: Optional[str] = None
+        self._envelope: Optional[ReportEnvelopeV3] = None
+
+    @property
+    def canonical_json(self) -> str:
+        if self._json is None:
+            self._json = render_report_json(self.report)
+        return self._json
+
+    @property
+    def markdown(self) -> str:
+        if self._markdown is None:
+            self._markdown = render_report_md(self.report)
+        return self._markdown
+
+    @property
+    def envelope(self) -> ReportEnvelopeV3:
+        if self._envelope is None:
+            self._envelope = create_report_envelope(
+                report=self.report,
+                canonical_json=self.canonical_json,
+                classical_signature="ABSENT",
+                pqc_signature="ABSENT",
+            )
+        return self._envelope
+
+    def get(self, kind: str) -> Any:
+        """Selector by name: one of OUTPUT_KINDS."""
+        if kind == "object":
+            return self.report
+        if kind == "json":
+            return self.canonical_json
+        if kind == "markdown":
+            return self.markdown
+        if kind == "envelope":
+            return self.envelope
+        raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: unknown output {kind!r}; expected one of {list(OUTPUT_KINDS)}")
+
+    def as_tuple(self) -> PipelineResult:
+        """All outputs, in run_v3_pipeline() order."""
+        return self.report, self.canonical_json, self.markdown, self.envelope
+
+
+def run_v3_pipeline_lazy(
+    *,
+    report_id: str,
+    target_layers: List[str],
+    snapshot: EvidenceSnapshot,
+    confidence_threshold: float,
+    capabilities: CapabilitiesV3,
+    # Step 8:
+    drift_contracts: Optional[List[LayerContract]] = None,
+    include_drift_graph: bool = False,
+    # Step 10:
+    correlation_snapshot: Optional[CorrelationSnapshot] = None,
+    include_correlation: bool = False,
+    # Finding limits (defaults keep every finding):
+    analyze_config: Optional[AnalyzeConfig] = None,
+    max_correlation_findings: Optional[int] = None,
+) -> PipelineOutputV3:
+    """
+    Same inputs as run_v3_pipeline(); renders outputs only when accessed.
+    """
+    report = build_upgrade_report(
+        report_id=report_id,
+        target_layers=target_layers,
+        snapshot=snapshot,
+        capabilities=capabilities,
+        confidence_threshold=confidence_threshold,
+        drift_contracts=drift_contracts,
+        include_drift_graph=include_drift_graph,
+        correlation_snapshot=correlation_snapshot,
+        include_correlation=include_correlation,
+        analyze_config=analyze_config,
+        max_correlation_findings=max_correlation_findings,
+    )
+    return PipelineOutputV3(report)
+
+
 def run_v3_pipeline(
     *,
     report_id: str,
@@ -25,6 +132,9 @@ def run_v3_pipeline(
     # Step 10:
     correlation_snapshot: Optional[CorrelationSnapshot] = None,
     include_correlation: bool = False,
+    # Finding limits (defaults keep every finding):
+    analyze_config: Optional[AnalyzeConfig] = None,
+    max_correlation_findings: Optional[int] = None,
 ) -> Tuple[UpgradeReportV3, str, str, ReportEnvelopeV3]:
     """
     Deterministic v3 pipeline runner.
@@ -34,27 +144,74 @@ def run_v3_pipeline(
     - canonical JSON (stable renderer)
     - markdown (stable renderer)
     - envelope (hash + signature status)
+
+    Use run_v3_pipeline_lazy() when only some outputs are needed.
     """
-    report = build_upgrade_report(
+    return run_v3_pipeline_lazy(
         report_id=report_id,
         target_layers=target_layers,
         snapshot=snapshot,
-        capabilities=capabilities,
         confidence_threshold=confidence_threshold,
+        capabilities=capabilities,
         drift_contracts=drift_contracts,
         include_drift_graph=include_drift_graph,
         correlation_snapshot=correlation_snapshot,
         include_correlation=include_correlation,
-    )
+        analyze_config=analyze_config,
+        max_correlation_findings=max_correlation_findings,
+    ).as_tuple()
 
-    canonical_json = render_report_json(report)
-    markdown = render_report_md(report)
 
-    envelope = create_report_envelope(
-        report=report,
-        canonical_json=canonical_json,
-        classical_signature="ABSENT",
-        pqc_signature="ABSENT",
-    )
+@dataclass(frozen=True, slots=True)
+class PipelineJobV3:
+    """
+    One report to build in run_v3_pipeline_batch().
+
+    options holds per-job run_v3_pipeline keyword arguments; they override
+    the batch's shared options for this job only.
+    """
+    report_id: str
+    snapshot: EvidenceSnapshot
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+
+def _run_jobs_chunk(shared: Dict[str, Any], offset: int, jobs: List[PipelineJobV3]) -> List[PipelineResult]:
+    out: List[PipelineResult] = []
+    for job in jobs:
+        kwargs = dict(shared)
+        kwargs.update(job.options)
+        out.append(run_v3_pipeline(report_id=job.report_id, snapshot=job.snapshot, **kwargs))
+    return out
+
 
-    return report, canonical_json, markdown, envelope
+def run_v3_pipeline_batch(
+    jobs: Iterable[PipelineJobV3],
+    *,
+    workers: int = 1,
+    chunk_size: int = 16,
+    **shared: Any,
+) -> Iterator[PipelineResult]:
+    """
+    Run many reports with shared configuration; yields results in job order.
+
+    - shared keyword arguments are run_v3_pipeline options common to all
+      jobs (target_layers, confidence_threshold, capabilities, ...)
+    - registry and confidence weights are loaded once per process
+    - workers > 1 spreads chunks of jobs over a process pool (jobs must be
+      picklable); output order and bytes are identical to workers=1
+    - any failing job raises (fail-closed), ending the batch
+    """
+    reserved = sorted({"report_id", "snapshot"} & set(shared))
+    if reserved:
+        raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: shared options must not include {reserved}")
+
+    # Warm the caches before any pool forks so workers inherit them.
+    get_registry()
+    get_confidence_weights()
+
+    return ordered_chunked_map(
+        partial(_run_jobs_chunk, shared),
+        jobs,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
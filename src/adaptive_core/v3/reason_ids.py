@@ -28,3 +28,6 @@ class ReasonId(str, Enum):
     AC_V3_GUARDRAIL_REGISTRY_INVALID = "AC_V3_GUARDRAIL_REGISTRY_INVALID"
     AC_V3_CONF_WEIGHTS_INVALID = "AC_V3_CONF_WEIGHTS_INVALID"
     AC_V3_REPORT_INVALID = "AC_V3_REPORT_INVALID"
+
+    # Archival (evicted evidence) failures
+    AC_V3_ARCHIVE_INVALID = "AC_V3_ARCHIVE_INVALID"
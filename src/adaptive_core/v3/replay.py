@@ -0,0 +1,270 @@
+# src/adaptive_core/v3/replay.py
+
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
+
+from .canonicalize import CanonicalizeFailure, CanonicalizeResult, canonicalize_events
+from .envelope import ReportEnvelopeV3
+from .evidence_store import EvidenceSnapshot, EvidenceStoreV3
+from .parallel import canonicalize_events_parallel, ordered_chunked_map
+from .pipeline import run_v3_pipeline
+from .reason_ids import ReasonId
+from .report_models import UpgradeReportV3
+
+
+PipelineOutput = Tuple[UpgradeReportV3, str, str, ReportEnvelopeV3]
+
+DEFAULT_REPORT_ID_FORMAT = "AC-REPLAY-{events_read:012d}"
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayStats:
+    """
+    Counters for one replay run.
+
+    Timing fields are wall-clock measurements for operators; they never
+    feed into snapshots or reports.
+    """
+    events_read: int
+    events_stored: int
+    # canonical events the store declined (dedup / late time-window arrivals)
+    events_rejected: int
+    failures: int
+    failures_by_reason: Dict[str, int]
+    elapsed_seconds: float
+    events_per_second: float
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayCheckpoint:
+    """
+    Store state after `events_read` input records.
+
+    report is the run_v3_pipeline() output for `snapshot`, present only
+    when the engine was given pipeline options.
+    """
+    sequence: int
+    events_read: int
+    snapshot: EvidenceSnapshot
+    report: Optional[PipelineOutput]
+    stats: ReplayStats
+
+
+def iter_jsonl_lines(paths: Iterable[Union[str, Path]]) -> Iterator[str]:
+    """
+    Non-blank lines from JSON-lines files, in file order then line order.
+
+    Files ending in .gz are decompressed on the fly.
+    """
+    for path in paths:
+        p = Path(path)
+        fh: TextIO
+        if p.suffix == ".gz":
+            fh = gzip.open(p, "rt", encoding="utf-8")
+        else:
+            fh = open(p, "r", encoding="utf-8")
+        with fh:
+            for line in fh:
+                if line.strip():
+                    yield line
+
+
+def _canonicalize_lines_chunk(
+    offset: int, lines: List[str]
+) -> List[Union[CanonicalizeResult, CanonicalizeFailure]]:
+    out: List[Union[CanonicalizeResult, CanonicalizeFailure]] = []
+    for i, line in enumerate(lines):
+        try:
+            raw = json.loads(line)
+        except ValueError as e:
+            out.append(
+                CanonicalizeFailure(
+                    index=offset + i,
+                    reason_id=ReasonId.AC_V3_INVALID_EVENT,
+                    message=f"{ReasonId.AC_V3_INVALID_EVENT.value}: invalid JSON line ({e})",
+                )
+            )
+            continue
+        for item in canonicalize_events([raw]):
+            if isinstance(item, CanonicalizeFailure):
+                item = replace(item, index=offset + i)
+            out.append(item)
+    return out
+
+
+class ReplayEngineV3:
+    """
+    Deterministic replay: raw events -> canonicalize -> EvidenceStoreV3.
+
+    - inputs are consumed as a stream (memory is bounded by the store)
+    - invalid records are counted by reason id and never abort the run;
+      the first `max_failures_kept` are kept for inspection
+    - a checkpoint is yielded every `checkpoint_every` input records and
+      once more at the end of input
+    - with `pipeline` options (run_v3_pipeline keyword arguments other than
+      report_id and snapshot), each checkpoint also carries a report whose
+      report_id is `report_id_format` filled with the checkpoint counters
+    - workers > 1 canonicalizes on a process pool (order is preserved)
+
+    The same input and configuration always produce the same snapshots and
+    reports; only the timing fields of ReplayStats vary between runs.
+
+    An engine replays once: its store accumulates the run, so a second
+    run()/run_jsonl() raises RuntimeError. Use a new engine (and store) for
+    each replay.
+    """
+
+    def __init__(
+        self,
+        store: Optional[EvidenceStoreV3] = None,
+        *,
+        checkpoint_every: Optional[int] = None,
+        pipeline: Optional[Mapping[str, Any]] = None,
+        report_id_format: str = DEFAULT_REPORT_ID_FORMAT,
+        workers: int = 1,
+        chunk_size: int = 1000,
+        max_failures_kept: int = 100,
+    ) -> None:
+        if checkpoint_every is not None and checkpoint_every <= 0:
+            raise ValueError("checkpoint_every must be > 0")
+        if max_failures_kept < 0:
+            raise ValueError("max_failures_kept must be >= 0")
+        if pipeline is not None:
+            reserved = sorted({"report_id", "snapshot"} & set(pipeline))
+            if reserved:
+                raise ValueError(f"pipeline options must not include {reserved}")
+
+        self.store = store if store is not None else EvidenceStoreV3()
+        self.checkpoint_every = checkpoint_every
+        self.pipeline = dict(pipeline) if pipeline is not None else None
+        self.report_id_format = report_id_format
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_failures_kept = max_failures_kept
+
+        self.failures: List[CanonicalizeFailure] = []
+        self._started_run = False
+        self._reset()
+
+    def run(self, raws: Iterable[Mapping[str, Any]]) -> Iterator[ReplayCheckpoint]:
+        """Replay raw event mappings; yields checkpoints lazily."""
+        self._claim_run()
+        items = canonicalize_events_parallel(raws, workers=self.workers, chunk_size=self.chunk_size)
+        return self._drive(items)
+
+    def run_jsonl(self, paths: Iterable[Union[str, Path]]) -> Iterator[ReplayCheckpoint]:
+        """
+        Replay JSON-lines files (one raw event per line, .gz allowed).
+
+        Failure indexes count non-blank lines across all files. Lines that
+        are not valid JSON fail with AC_V3_INVALID_EVENT.
+        """
+        self._claim_run()
+        items = ordered_chunked_map(
+            _canonicalize_lines_chunk,
+            iter_jsonl_lines(paths),
+            workers=self.workers,
+            chunk_size=self.chunk_size,
+        )
+        return self._drive(items)
+
+    def stats(self) -> ReplayStats:
+        elapsed = (time.perf_counter() - self._started) if self._started is not None else 0.0
+        return ReplayStats(
+            events_read=self._read,
+            events_stored=self._stored,
+            events_rejected=self._rejected,
+            failures=sum(self._failures_by_reason.values()),
+            failures_by_reason=dict(sorted(self._failures_by_reason.items())),
+            elapsed_seconds=elapsed,
+            events_per_second=(self._read / elapsed) if elapsed > 0 else 0.0,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+
+    def _claim_run(self) -> None:
+        # Checked eagerly, before the lazy checkpoint generator is created.
+        if self._started_run:
+            raise RuntimeError("ReplayEngineV3 already ran; use a new engine and store per replay")
+        self._started_run = True
+
+    def _reset(self) -> None:
+        self._read = 0
+        self._stored = 0
+        self._rejected = 0
+        self._failures_by_reason: Counter[str] = Counter()
+        self._sequence = 0
+        self._started: Optional[float] = None
+        self.failures = []
+
+    def _drive(
+        self, items: Iterable[Union[CanonicalizeResult, CanonicalizeFailure]]
+    ) -> Iterator[ReplayCheckpoint]:
+        self._reset()
+        self._started = time.perf_counter()
+        every = self.checkpoint_every
+        store_add = self.store.add
+        last_checkpoint = -1
+
+        for item in items:
+            self._read += 1
+            if isinstance(item, CanonicalizeFailure):
+                self._failures_by_reason[item.reason_id.value] += 1
+                if len(self.failures) < self.max_failures_kept:
+                    self.failures.append(item)
+            elif store_add(item):
+                self._stored += 1
+            else:
+                self._rejected += 1
+
+            if every is not None and self._read % every == 0:
+                last_checkpoint = self._read
+                yield self._checkpoint()
+
+        if last_checkpoint != self._read:
+            yield self._checkpoint()
+
+    def _checkpoint(self) -> ReplayCheckpoint:
+        snapshot = self.store.snapshot()
+        report: Optional[PipelineOutput] = None
+        if self.pipeline is not None:
+            report_id = self.report_id_format.format(
+                sequence=self._sequence, events_read=self._read
+            )
+            report = run_v3_pipeline(report_id=report_id, snapshot=snapshot, **self.pipeline)
+        cp = ReplayCheckpoint(
+            sequence=self._sequence,
+            events_read=self._read,
+            snapshot=snapshot,
+            report=report,
+            stats=self.stats(),
+        )
+        self._sequence += 1
+        return cp
+
+
+def replay_jsonl(
+    paths: Iterable[Union[str, Path]],
+    store: Optional[EvidenceStoreV3] = None,
+    **options: Any,
+) -> ReplayCheckpoint:
+    """
+    Replay JSON-lines files to the end in one call; returns the final checkpoint.
+
+    `options` are ReplayEngineV3 keyword arguments.
+    """
+    engine = ReplayEngineV3(store, **options)
+    final: Optional[ReplayCheckpoint] = None
+    for final in engine.run_jsonl(paths):
+        pass
+    # _drive always yields at least the end-of-input checkpoint
+    return final  # type: ignore[return-value]
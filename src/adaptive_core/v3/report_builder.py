@@ -1,23 +1,41 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 
 from .analyze import AnalyzeConfig, generate_findings
-from .confidence import compute_confidence, load_confidence_weights
+from .confidence import compute_confidence, get_confidence_weights
+from .context_hash import STREAM_CHUNK_CHARS
 from .correlation import CorrelationSnapshot, generate_correlation_findings
 from .drift import LayerContract, detect_contract_drift
 from .evidence_store import EvidenceSnapshot
 from .findings import FindingV3
 from .graph import render_drift_dot
-from .guardrails.registry import load_registry
+from .guardrails.registry import get_registry
 from .reason_ids import ReasonId
 from .report_models import CapabilitiesV3, UpgradeReportV3
 
 
 DEFAULT_CONFIDENCE_THRESHOLD = 0.60
 
+# Field names of the report schema, used by render_report_json().
+_REPORT_FIELDS = tuple(f.name for f in fields(UpgradeReportV3))
+_CAPABILITY_FIELDS = tuple(f.name for f in fields(CapabilitiesV3))
+
+
+def _dataclass_default(o: Any) -> Any:
+    # Nested dataclasses render as asdict() would render them.
+    if is_dataclass(o) and not isinstance(o, type):
+        return asdict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Canonical settings (sort_keys, compact, ensure_ascii=False) for report JSON.
+_REPORT_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_dataclass_default
+)
+
 
 def _json_dumps_stable(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
@@ -36,15 +54,69 @@ def build_upgrade_report(
     # Step 10:
     correlation_snapshot: Optional[CorrelationSnapshot] = None,
     include_correlation: bool = False,
+    # Finding limits (defaults keep every finding):
+    analyze_config: Optional[AnalyzeConfig] = None,
+    max_correlation_findings: Optional[int] = None,
 ) -> UpgradeReportV3:
     """
     Build a deterministic v3 report.
 
-    - Evidence findings come from counters (generate_findings)
+    - Evidence findings come from counters (generate_findings), using
+      analyze_config (default AnalyzeConfig()) for thresholds and top-K
     - Drift findings come from explicit LayerContract inputs (detect_contract_drift)
-    - Correlation findings come from explicit CorrelationSnapshot (generate_correlation_findings)
+    - Correlation findings come from explicit CorrelationSnapshot (generate_correlation_findings),
+      optionally limited to the max_correlation_findings most widespread reasons
     - Guardrails are validated against registry (fail-closed)
     """
+    _validate_report_inputs(
+        report_id=report_id,
+        target_layers=target_layers,
+        drift_contracts=drift_contracts,
+        correlation_snapshot=correlation_snapshot,
+        include_correlation=include_correlation,
+        analyze_config=analyze_config,
+        max_correlation_findings=max_correlation_findings,
+    )
+
+    # Evidence findings (from hot-window counters)
+    evidence_findings: List[FindingV3] = generate_findings(snapshot, analyze_config or AnalyzeConfig())
+
+    # Drift findings (explicit inputs only — no guessing)
+    drift_findings: List[FindingV3] = []
+    if drift_contracts:
+        drift_findings = detect_contract_drift(drift_contracts)
+
+    # Correlation findings (explicit snapshot only — summaries, no raw events)
+    corr_findings: List[FindingV3] = []
+    if include_correlation and correlation_snapshot is not None:
+        corr_findings = generate_correlation_findings(correlation_snapshot, max_findings=max_correlation_findings)
+
+    return _assemble_report(
+        report_id=report_id,
+        target_layers=target_layers,
+        snapshot=snapshot,
+        capabilities=capabilities,
+        confidence_threshold=confidence_threshold,
+        evidence_findings=evidence_findings,
+        drift_findings=drift_findings,
+        corr_findings=corr_findings,
+        drift_contracts=drift_contracts,
+        include_drift_graph=include_drift_graph,
+        correlation_snapshot=correlation_snapshot,
+        include_correlation=include_correlation,
+    )
+
+
+def _validate_report_inputs(
+    *,
+    report_id: str,
+    target_layers: List[str],
+    drift_contracts: Optional[List[LayerContract]],
+    correlation_snapshot: Optional[CorrelationSnapshot],
+    include_correlation: bool,
+    analyze_config: Optional[AnalyzeConfig] = None,
+    max_correlation_findings: Optional[int] = None,
+) -> None:
     if not report_id or not isinstance(report_id, str):
         raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: report_id")
     if not target_layers or any((not isinstance(x, str) or not x.strip()) for x in target_layers):
@@ -55,22 +127,38 @@ def build_upgrade_report(
         raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: correlation_snapshot must be CorrelationSnapshot or None")
     if include_correlation and correlation_snapshot is None:
         raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: include_correlation requires correlation_snapshot")
+    if analyze_config is not None and not isinstance(analyze_config, AnalyzeConfig):
+        raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: analyze_config must be AnalyzeConfig or None")
+    if max_correlation_findings is not None and (
+        isinstance(max_correlation_findings, bool)
+        or not isinstance(max_correlation_findings, int)
+        or max_correlation_findings < 0
+    ):
+        raise ValueError(f"{ReasonId.AC_V3_REPORT_INVALID.value}: max_correlation_findings must be int >= 0 or None")
 
-    registry = load_registry()
-    weights = load_confidence_weights()
 
-    # Evidence findings (from hot-window counters)
-    evidence_findings: List[FindingV3] = generate_findings(snapshot, AnalyzeConfig())
-
-    # Drift findings (explicit inputs only — no guessing)
-    drift_findings: List[FindingV3] = []
-    if drift_contracts:
-        drift_findings = detect_contract_drift(drift_contracts)
+def _assemble_report(
+    *,
+    report_id: str,
+    target_layers: List[str],
+    snapshot: EvidenceSnapshot,
+    capabilities: CapabilitiesV3,
+    confidence_threshold: float,
+    evidence_findings: List[FindingV3],
+    drift_findings: List[FindingV3],
+    corr_findings: List[FindingV3],
+    drift_contracts: Optional[List[LayerContract]],
+    include_drift_graph: bool,
+    correlation_snapshot: Optional[CorrelationSnapshot],
+    include_correlation: bool,
+) -> UpgradeReportV3:
+    """
+    Shared tail of build_upgrade_report(): merge findings, score, validate guardrails.
 
-    # Correlation findings (explicit snapshot only — summaries, no raw events)
-    corr_findings: List[FindingV3] = []
-    if include_correlation and correlation_snapshot is not None:
-        corr_findings = generate_correlation_findings(correlation_snapshot)
+    Also used by IncrementalReportBuilderV3, so both produce identical reports.
+    """
+    registry = get_registry()
+    weights = get_confidence_weights()
 
     # Merge findings deterministically: sort by finding_id
     all_findings: List[FindingV3] = sorted(
@@ -213,76 +301,145 @@ def build_upgrade_report(
     )
 
 
+def _report_json_obj(report: UpgradeReportV3) -> Dict[str, Any]:
+    # Shallow view of the report in asdict() shape; nested values are shared, not copied.
+    caps = report.capabilities
+    obj: Dict[str, Any] = {name: getattr(report, name) for name in _REPORT_FIELDS}
+    obj["capabilities"] = {name: getattr(caps, name) for name in _CAPABILITY_FIELDS}
+    return obj
+
+
 def render_report_json(report: UpgradeReportV3) -> str:
-    # JSON stable ordering
+    """
+    Canonical JSON for a report (sorted keys, compact separators).
+
+    Walks the known schema into a shallow dict instead of asdict(), which
+    deep-copies every findings / evidence dict first. Output is
+    byte-identical to _render_report_json_asdict().
+    """
+    return _REPORT_ENCODER.encode(_report_json_obj(report))
+
+
+def write_report_json(report: UpgradeReportV3, fp: TextIO, chunk_chars: int = STREAM_CHUNK_CHARS) -> int:
+    """
+    Stream render_report_json(report) to a text stream; returns characters written.
+
+    The JSON is produced incrementally and written in ~chunk_chars pieces,
+    so the full document is never held in memory.
+    """
+    return _write_chunked(fp, _REPORT_ENCODER.iterencode(_report_json_obj(report)), chunk_chars)
+
+
+def _render_report_json_asdict(report: UpgradeReportV3) -> str:
+    # Reference renderer: JSON stable ordering over a deep copy.
     return _json_dumps_stable(asdict(report))
 
 
 def render_report_md(report: UpgradeReportV3) -> str:
     # Deterministic MD rendering (no timestamps)
-    lines: List[str] = []
-    lines.append("# 🔷 ADAPTIVE CORE — UPGRADE REPORT v3")
-    lines.append("")
-    lines.append(f"**Report ID:** {report.report_id}")
-    lines.append(f"**Type:** {report.report_type}")
-    lines.append(f"**Target Layers:** {', '.join(report.target_layers)}")
-    lines.append("")
-    lines.append("## 🧩 Capabilities")
-    lines.append(f"- Envelope: {report.capabilities.envelope}")
-    lines.append(f"- Correlation: {report.capabilities.correlation}")
-    lines.append(f"- Archival: {report.capabilities.archival}")
-    lines.append(f"- Telemetry: {report.capabilities.telemetry}")
-    lines.append("")
-    lines.append("## 📌 Evidence Summary")
-    lines.append(f"- Total events: {report.evidence.get('total_events')}")
-    lines.append(f"- Drift contracts provided: {report.evidence.get('drift_contracts_provided')}")
-    lines.append(f"- Drift findings: {report.evidence.get('drift_findings')}")
-    lines.append(f"- Correlation enabled: {report.evidence.get('correlation_enabled')}")
-    lines.append(f"- Correlation nodes: {report.evidence.get('correlation_nodes')}")
-    lines.append(f"- Correlation findings: {report.evidence.get('correlation_findings')}")
-    lines.append("")
-    lines.append("## 🛡️ Guardrails Triggered")
+    return "\n".join(_iter_report_md_lines(report))
+
+
+def write_report_md(report: UpgradeReportV3, fp: TextIO, chunk_chars: int = STREAM_CHUNK_CHARS) -> int:
+    """
+    Stream render_report_md(report) to a text stream; returns characters written.
+
+    Lines are generated one at a time and written in ~chunk_chars pieces.
+    """
+    return _write_chunked(fp, _iter_md_pieces(report), chunk_chars)
+
+
+def _iter_md_pieces(report: UpgradeReportV3) -> Iterator[str]:
+    lines = _iter_report_md_lines(report)
+    for line in lines:
+        yield line
+        break
+    for line in lines:
+        yield "\n"
+        yield line
+
+
+def _write_chunked(fp: TextIO, pieces: Iterator[str], chunk_chars: int) -> int:
+    if chunk_chars <= 0:
+        raise ValueError("chunk_chars must be > 0")
+    written = 0
+    buf: List[str] = []
+    size = 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_chars:
+            fp.write("".join(buf))
+            written += size
+            buf, size = [], 0
+    if buf:
+        fp.write("".join(buf))
+        written += size
+    return written
+
+
+def _iter_report_md_lines(report: UpgradeReportV3) -> Iterator[str]:
+    yield "# 🔷 ADAPTIVE CORE — UPGRADE REPORT v3"
+    yield ""
+    yield f"**Report ID:** {report.report_id}"
+    yield f"**Type:** {report.report_type}"
+    yield f"**Target Layers:** {', '.join(report.target_layers)}"
+    yield ""
+    yield "## 🧩 Capabilities"
+    yield f"- Envelope: {report.capabilities.envelope}"
+    yield f"- Correlation: {report.capabilities.correlation}"
+    yield f"- Archival: {report.capabilities.archival}"
+    yield f"- Telemetry: {report.capabilities.telemetry}"
+    yield ""
+    yield "## 📌 Evidence Summary"
+    yield f"- Total events: {report.evidence.get('total_events')}"
+    yield f"- Drift contracts provided: {report.evidence.get('drift_contracts_provided')}"
+    yield f"- Drift findings: {report.evidence.get('drift_findings')}"
+    yield f"- Correlation enabled: {report.evidence.get('correlation_enabled')}"
+    yield f"- Correlation nodes: {report.evidence.get('correlation_nodes')}"
+    yield f"- Correlation findings: {report.evidence.get('correlation_findings')}"
+    yield ""
+    yield "## 🛡️ Guardrails Triggered"
     for gid in report.guardrails:
         title = report.guardrail_titles.get(gid, "")
-        lines.append(f"- **{gid}** — {title}")
-    lines.append("")
-    lines.append("## 📊 Confidence")
-    lines.append(f"**Score:** {report.confidence}")
+        yield f"- **{gid}** — {title}"
+    yield ""
+    yield "## 📊 Confidence"
+    yield f"**Score:** {report.confidence}"
     for k in sorted(report.confidence_breakdown.keys()):
-        lines.append(f"- {k}: {report.confidence_breakdown[k]}")
-    lines.append("")
-    lines.append("## 🔍 Findings")
+        yield f"- {k}: {report.confidence_breakdown[k]}"
+    yield ""
+    yield "## 🔍 Findings"
     if not report.findings:
-        lines.append("_No findings in this window._")
+        yield "_No findings in this window._"
     else:
         for f in report.findings:
-            lines.append(f"- `{f.get('finding_id')}` — {f.get('title')}")
-    lines.append("")
+            yield f"- `{f.get('finding_id')}` — {f.get('title')}"
+    yield ""
 
     if report.drift_dot:
-        lines.append("## 🧭 Drift Radar Graph (DOT)")
-        lines.append("```dot")
-        lines.append(report.drift_dot)
-        lines.append("```")
-        lines.append("")
+        yield "## 🧭 Drift Radar Graph (DOT)"
+        yield "```dot"
+        yield report.drift_dot
+        yield "```"
+        yield ""
 
-    lines.append("## ✅ Recommended Actions")
+    yield "## ✅ Recommended Actions"
     for a in report.recommended_actions:
-        lines.append(f"- {a}")
-    lines.append("")
-    lines.append("## 🧪 Required Tests")
+        yield f"- {a}"
+    yield ""
+    yield "## 🧪 Required Tests"
     if report.required_tests:
         for t in report.required_tests:
-            lines.append(f"- {t}")
+            yield f"- {t}"
     else:
-        lines.append("- (none)")
-    lines.append("")
-    lines.append("## ✅ Exit Criteria")
+        yield "- (none)"
+    yield ""
+    yield "## ✅ Exit Criteria"
     for x in report.exit_criteria:
-        lines.append(f"- {x}")
-    lines.append("")
-    lines.append("## ⛔ Forbidden Actions")
+        yield f"- {x}"
+    yield ""
+    yield "## ⛔ Forbidden Actions"
     for x in report.forbidden_actions:
-        lines.append(f"- {x}")
-    lines.append("")
-    return "\n".join(lines)
+        yield f"- {x}"
+    yield ""
@@ -0,0 +1,159 @@
+# src/adaptive_core/v3/sharded_evidence_store.py
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from .canonicalize import CanonicalizeResult
+from .evidence_store import EvidenceSnapshot, EvidenceStoreV3, ReadOnlyCounts
+
+
+SHARD_KEYS: Tuple[str, ...] = ("correlation_id", "source_layer")
+
+K = TypeVar("K")
+
+
+def stable_shard(key: str, shards: int) -> int:
+    """
+    Process-independent shard index for `key`.
+
+    Uses SHA-256 rather than hash(), which is salted per interpreter.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def _sum_sorted(parts: Iterable[Dict[K, int]]) -> Dict[K, int]:
+    total: Counter = Counter()
+    for part in parts:
+        total.update(part)
+    return ReadOnlyCounts.sorted_from(total)
+
+
+def merge_snapshots(snapshots: Iterable[EvidenceSnapshot]) -> EvidenceSnapshot:
+    """
+    Sum EvidenceSnapshots from disjoint stores into one.
+
+    Counter dicts are emitted in sorted key order, so the result does not
+    depend on the order of `snapshots` or on ingest interleaving. They are
+    ReadOnlyCounts, like EvidenceStoreV3 snapshots.
+    """
+    snaps = list(snapshots)
+    return EvidenceSnapshot(
+        total_events=sum(s.total_events for s in snaps),
+        by_source_layer=_sum_sorted(s.by_source_layer for s in snaps),
+        by_event_type=_sum_sorted(s.by_event_type for s in snaps),
+        by_upstream_reason_id=_sum_sorted(s.by_upstream_reason_id for s in snaps),
+        duplicates_rejected=sum(s.duplicates_rejected for s in snaps),
+        by_source_layer_reason_id=_sum_sorted(s.by_source_layer_reason_id for s in snaps),
+        by_event_type_reason_id=_sum_sorted(s.by_event_type_reason_id for s in snaps),
+        severity_histogram=_sum_sorted(s.severity_histogram for s in snaps),
+    )
+
+
+class ShardedEvidenceStoreV3:
+    """
+    Thread-safe evidence store split into independently locked shards.
+
+    - each event goes to one EvidenceStoreV3 shard, chosen by a stable hash
+      of its correlation_id (default) or source_layer
+    - ingest threads only contend when they hit the same shard
+    - snapshot() locks all shards (in index order) and merges their
+      counters; while no shard has evicted, it equals the snapshot of a
+      single EvidenceStoreV3 fed the same events, with sorted counter keys
+    - dedup is exact: identical events share a context_hash and therefore
+      a shard key, so duplicates always meet in the same shard
+    - capacity is per shard (max_events_per_shard); eviction is per shard,
+      so a full sharded store forgets oldest-per-shard, not oldest-overall
+    """
+
+    def __init__(
+        self,
+        shards: int = 8,
+        shard_key: str = "correlation_id",
+        max_events_per_shard: int = 1000,
+        dedup: bool = False,
+        composite_counters: Iterable[str] = (),
+    ) -> None:
+        if shards <= 0:
+            raise ValueError("shards must be > 0")
+        if shard_key not in SHARD_KEYS:
+            raise ValueError(f"shard_key must be one of {list(SHARD_KEYS)}")
+        composites = tuple(composite_counters)
+        self._shard_key = shard_key
+        self._shards: List[EvidenceStoreV3] = [
+            EvidenceStoreV3(
+                max_events=max_events_per_shard,
+                dedup=dedup,
+                composite_counters=composites,
+            )
+            for _ in range(shards)
+        ]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+
+        # Merged snapshot cache, keyed by the shards' generations.
+        self._merge_lock = threading.Lock()
+        self._snapshot: Optional[EvidenceSnapshot] = None
+        self._snapshot_key: Optional[Tuple[int, ...]] = None
+
+    @property
+    def shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def shard_key(self) -> str:
+        return self._shard_key
+
+    def shard_index(self, item: CanonicalizeResult) -> int:
+        key = getattr(item.event, self._shard_key)
+        return stable_shard(key, len(self._shards))
+
+    def add(self, item: CanonicalizeResult) -> bool:
+        """Add one canonicalized event; same return value as EvidenceStoreV3.add()."""
+        i = self.shard_index(item)
+        with self._locks[i]:
+            return self._shards[i].add(item)
+
+    def add_many(self, items: Iterable[CanonicalizeResult]) -> int:
+        """Add events in order; returns how many were stored."""
+        stored = 0
+        for item in items:
+            if self.add(item):
+                stored += 1
+        return stored
+
+    def snapshot(self) -> EvidenceSnapshot:
+        """
+        Merged snapshot across all shards, taken atomically.
+
+        Cached until any shard changes; treat its dicts as read-only.
+        """
+        parts: List[EvidenceSnapshot] = []
+        generations: List[int] = []
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            for shard in self._shards:
+                parts.append(shard.snapshot())
+                generations.append(shard.generation)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+        key = tuple(generations)
+        with self._merge_lock:
+            if self._snapshot is None or self._snapshot_key != key:
+                self._snapshot = merge_snapshots(parts)
+                self._snapshot_key = key
+            return self._snapshot
+
+    def shard_snapshots(self) -> List[EvidenceSnapshot]:
+        """Per-shard snapshots, in shard index order."""
+        out: List[EvidenceSnapshot] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                out.append(shard.snapshot())
+        return out
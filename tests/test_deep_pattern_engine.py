@@ -83,3 +83,62 @@ def test_deep_pattern_engine_basic_spike_and_diversity(tmp_path) -> None:
 
     # With a spike and diversity, composite risk should be > 0
     assert result["composite_risk"] > 0.0
+
+
+def _full_scan(mem: ThreatMemory, short_window: int, long_window: int, min_severity: int):
+    # Fresh engine with a different configured filter forces the scan path.
+    fresh = DeepPatternEngine(
+        memory=mem,
+        short_window=short_window,
+        long_window=long_window,
+        min_severity=min_severity - 1,
+    )
+    return fresh.analyze(min_severity=min_severity)
+
+
+def test_deep_pattern_engine_incremental_matches_full_scan_with_eviction() -> None:
+    """
+    observe() after every add_packet() must track the same state a full
+    rescan would produce, including FIFO evictions from ThreatMemory.
+    """
+    mem = ThreatMemory(path=None, max_packets=12)
+    engine = DeepPatternEngine(memory=mem, short_window=4, long_window=8, min_severity=5)
+
+    types = ["a", "b", "c"]
+    for i in range(40):
+        p = _packet(i, severity=(i * 7) % 11, threat_type=types[(i * 5) % 3])
+        mem.add_packet(p)
+        engine.observe(p)
+        assert engine.analyze(min_severity=5) == _full_scan(mem, 4, 8, 5)
+
+
+def test_deep_pattern_engine_resyncs_after_out_of_band_changes() -> None:
+    mem = ThreatMemory(path=None, max_packets=100)
+    engine = DeepPatternEngine(memory=mem, short_window=3, long_window=6)
+
+    # Packets added without observe(): analyze() detects the generation gap.
+    for i in range(5):
+        mem.add_packet(_packet(i, threat_type=f"t{i}"))
+    assert engine.analyze() == _full_scan(mem, 3, 6, 0)
+
+    # Two adds, only the second observed: observe() rebuilds instead.
+    mem.add_packet(_packet(5, threat_type="x"))
+    p = _packet(6, threat_type="x")
+    mem.add_packet(p)
+    engine.observe(p)
+    assert engine.analyze()["short_count"] == 3
+    assert engine.analyze() == _full_scan(mem, 3, 6, 0)
+
+    # Other filters always take the scan path.
+    assert engine.analyze(min_severity=6)["total_packets"] == 0
+
+
+def test_deep_pattern_engine_zero_capacity_memory_stays_empty() -> None:
+    mem = ThreatMemory(path=None, max_packets=0)
+    engine = DeepPatternEngine(memory=mem)
+    engine.rebuild()
+
+    p = _packet(0)
+    mem.add_packet(p)
+    engine.observe(p)
+    assert engine.analyze()["total_packets"] == 0
@@ -0,0 +1,185 @@
+# tests/test_deep_pattern_time_windows.py
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_core.engine import AdaptiveEngine
+from adaptive_core.pattern_engine import DeepPatternEngine, SlidingTimeWindow
+from adaptive_core.threat_memory import ThreatMemory
+from adaptive_core.threat_packet import ThreatPacket
+
+
+def _packet(minute: int, severity: int = 5, threat_type: str = "t") -> ThreatPacket:
+    h, m = divmod(minute, 60)
+    return ThreatPacket(
+        source_layer="sentinel",
+        threat_type=threat_type,
+        severity=severity,
+        description="time-window-test",
+        timestamp=f"2025-01-01T{h:02d}:{m:02d}:00Z",
+    )
+
+
+def _feed(mem: ThreatMemory, engine: DeepPatternEngine, packets) -> None:
+    for p in packets:
+        mem.add_packet(p)
+        engine.observe(p)
+
+
+def test_time_window_config_is_validated() -> None:
+    mem = ThreatMemory(path=None)
+    with pytest.raises(ValueError):
+        DeepPatternEngine(memory=mem, short_seconds=300)
+    with pytest.raises(ValueError):
+        DeepPatternEngine(memory=mem, short_seconds=0, long_seconds=10)
+    with pytest.raises(ValueError):
+        SlidingTimeWindow(0)
+
+    engine = DeepPatternEngine(memory=mem, short_seconds=600, long_seconds=60)
+    assert engine.long_seconds == 600  # long never shorter than short
+    assert engine.time_windows_enabled
+    assert not DeepPatternEngine(memory=mem).time_windows_enabled
+    assert DeepPatternEngine(memory=mem).analyze()["window_mode"] == "count"
+
+
+def test_sliding_time_window_counts_and_handles_late_arrivals() -> None:
+    w = SlidingTimeWindow(10)
+    assert w.oldest is None and w.now is None and len(w) == 0
+    for e in (0.0, 5.0, 12.0):
+        w.add(e)
+    assert len(w) == 2 and w.oldest == 5.0 and w.now == 12.0
+
+    w.add(8.0)   # late, inside the window: inserted in order
+    w.add(1.0)   # late, outside the window: held but not counted
+    assert list(w._epochs) == [0.0, 1.0, 5.0, 8.0, 12.0]
+    assert len(w) == 3 and w.count_within(5) == 2
+
+    w.add(15.0)  # 5.0 is now exactly on the (exclusive) boundary
+    assert w.oldest == 8.0
+
+    # Removing the newest epoch moves "now" back and revives older ones.
+    w.discard(15.0)
+    w.discard(12.0)
+    w.discard(99.0)  # unknown: no-op
+    assert w.now == 8.0 and len(w) == 4 and w.oldest == 0.0
+
+
+def test_steady_rate_is_not_a_spike_but_a_burst_is() -> None:
+    mem = ThreatMemory(path=None)
+    engine = DeepPatternEngine(memory=mem, short_seconds=300, long_seconds=6 * 3600)
+
+    # One packet per minute for 6 hours: flat rate.
+    _feed(mem, engine, [_packet(m) for m in range(360)])
+    steady = engine.analyze()
+    assert steady["window_mode"] == "time"
+    assert steady["short_time_count"] == 5
+    assert steady["spike_score"] < 0.05
+
+    # Twenty packets inside the last 5 minutes.
+    _feed(mem, engine, [_packet(370) for _ in range(20)])
+    burst = engine.analyze()
+    assert burst["short_time_count"] == 20
+    assert burst["spike_ratio"] > 2.0
+    assert burst["spike_score"] == 1.0
+
+
+def test_fresh_history_does_not_report_spurious_spike() -> None:
+    mem = ThreatMemory(path=None)
+    engine = DeepPatternEngine(memory=mem, short_seconds=300, long_seconds=6 * 3600)
+    _feed(mem, engine, [_packet(0) for _ in range(10)])
+    assert engine.analyze()["spike_ratio"] == pytest.approx(1.0)
+
+
+def test_incremental_time_windows_match_scan_with_eviction_and_disorder() -> None:
+    mem = ThreatMemory(path=None, max_packets=15)
+    engine = DeepPatternEngine(
+        memory=mem, short_seconds=600, long_seconds=3600, min_severity=3
+    )
+    scan = DeepPatternEngine(
+        memory=mem, short_seconds=600, long_seconds=3600, min_severity=99
+    )
+
+    for i in range(60):
+        minute = i * 7 if i % 9 else max(0, i * 7 - 50)  # some late arrivals
+        p = _packet(minute, severity=i % 6, threat_type=f"t{i % 4}")
+        mem.add_packet(p)
+        engine.observe(p)
+        assert engine.analyze(min_severity=3) == scan.analyze(min_severity=3)
+
+
+def test_scan_path_with_no_admitted_packets() -> None:
+    mem = ThreatMemory(path=None)
+    mem.add_packet(_packet(0, severity=1))
+    engine = DeepPatternEngine(memory=mem, short_seconds=60, long_seconds=120)
+    result = engine.analyze(min_severity=5)
+    assert result["total_packets"] == 0
+    assert result["short_time_count"] == 0
+
+
+def test_unparseable_timestamps_are_skipped_by_time_windows() -> None:
+    mem = ThreatMemory(path=None)
+    engine = DeepPatternEngine(memory=mem, short_seconds=60, long_seconds=120)
+    bad = _packet(0)
+    bad.timestamp = "not-a-timestamp"  # bypass constructor validation
+    _feed(mem, engine, [bad, _packet(1)])
+
+    result = engine.analyze()
+    assert result["total_packets"] == 2
+    assert result["long_time_count"] == 1
+
+
+def test_adaptive_engine_time_windows_survive_memory_swap() -> None:
+    engine = AdaptiveEngine(deep_short_seconds=300, deep_long_seconds=3600)
+    assert engine.deep_patterns.time_windows_enabled
+    engine.receive_threat_packet(_packet(0))
+    assert engine.generate_immune_report()["deep_patterns"]["window_mode"] == "time"
+
+    engine.threat_memory = ThreatMemory(path=None)
+    engine.receive_threat_packet(_packet(1))
+    deep = engine.generate_immune_report()["deep_patterns"]
+    assert deep["window_mode"] == "time"
+    assert (deep["short_seconds"], deep["long_seconds"]) == (300, 3600)
+
+    with pytest.raises(ValueError):
+        AdaptiveEngine(deep_short_seconds=300)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_incremental_time_windows_match_rebuild_with_shuffle_and_eviction(seed: int) -> None:
+    rng = random.Random(seed)
+    mem = ThreatMemory(path=None, max_packets=rng.randint(1, 12))
+    engine = DeepPatternEngine(
+        memory=mem, short_seconds=300, long_seconds=3600, min_severity=rng.randint(0, 3)
+    )
+    # min_severity=99 never matches, so scan.analyze() takes the full-scan path
+    scan = DeepPatternEngine(memory=mem, short_seconds=300, long_seconds=3600, min_severity=99)
+    minutes = [rng.randint(0, 240) for _ in range(40)]
+
+    for i, minute in enumerate(minutes):
+        p = _packet(minute, severity=rng.randint(0, 6), threat_type=f"t{i % 3}")
+        mem.add_packet(p)
+        engine.observe(p)
+        incremental = engine.analyze(min_severity=engine.min_severity)
+
+        fresh = DeepPatternEngine(
+            memory=mem, short_seconds=300, long_seconds=3600, min_severity=engine.min_severity
+        )
+        fresh.rebuild()
+        assert incremental == fresh.analyze(min_severity=engine.min_severity)
+        assert incremental == scan.analyze(min_severity=engine.min_severity)
+
+
+def test_engine_out_of_order_eviction_repro() -> None:
+    engine = AdaptiveEngine(
+        threat_memory=ThreatMemory(path=None, max_packets=2), deep_short_seconds=300, deep_long_seconds=3600
+    )
+    for minute in (60, 0, 1):
+        engine.receive_threat_packet(_packet(minute))
+    incremental = engine.deep_patterns.analyze()
+    engine.deep_patterns.rebuild()
+    rebuilt = engine.deep_patterns.analyze()
+    assert incremental == rebuilt
+    assert (incremental["short_time_count"], incremental["spike_ratio"]) == (2, 1.0)
@@ -112,3 +112,18 @@ def test_immune_report_includes_deep_patterns(tmp_path) -> None:
     assert "composite_risk" in deep
     assert "spike_score" in deep
     assert "diversity_score" in deep
+
+
+def test_engine_keeps_deep_pattern_engine_in_sync_across_memory_swap() -> None:
+    engine = AdaptiveEngine()
+    deep = engine.deep_patterns
+    engine.receive_threat_packet(_packet(0))
+    assert engine.generate_immune_report()["deep_patterns"]["total_packets"] == 1
+    assert engine.deep_patterns is deep
+
+    engine.threat_memory = ThreatMemory(path=None)
+    engine.receive_threat_packet(_packet(1))
+    report = engine.generate_immune_report()
+    assert report["deep_patterns"]["total_packets"] == 1
+    assert engine.deep_patterns is not deep
+    assert engine.deep_patterns.memory is engine.threat_memory
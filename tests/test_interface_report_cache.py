@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from adaptive_core.engine import AdaptiveEngine
+from adaptive_core.interface import AdaptiveCoreInterface
+from adaptive_core.pattern_engine import DeepPatternEngine
+from adaptive_core.threat_memory import ThreatMemory
+from adaptive_core.threat_packet import ThreatPacket
+
+
+def _packet(i: int, threat_type: str = "test_threat") -> ThreatPacket:
+    return ThreatPacket(
+        source_layer="sentinel",
+        threat_type=threat_type,
+        severity=5,
+        description="report-cache-test",
+        timestamp="2025-01-01T00:00:00Z",
+        block_height=i,
+    )
+
+
+class _CountingEngine(AdaptiveEngine):
+    def __init__(self) -> None:
+        super().__init__()
+        self.report_calls = 0
+
+    def generate_immune_report(self, **kwargs: Any) -> Dict[str, Any]:
+        self.report_calls += 1
+        return super().generate_immune_report(**kwargs)
+
+
+def test_threat_memory_generation_bumps_on_every_mutation(tmp_path):
+    mem = ThreatMemory(path=None)
+    g0 = mem.generation
+    mem.add_packet(_packet(0))
+    assert mem.generation == g0 + 1
+
+    mem.load()  # no path: no-op, nothing changed
+    assert mem.generation == g0 + 1
+
+    disk = ThreatMemory(path=tmp_path / "m.json")
+    before = disk.generation
+    disk.load()
+    assert disk.generation == before + 1
+
+
+def test_report_is_served_from_cache_until_next_ingest():
+    engine = _CountingEngine()
+    iface = AdaptiveCoreInterface(engine=engine)
+    iface.submit_threat_packet(_packet(0))
+
+    r1 = iface.get_immune_report()
+    r2 = iface.get_immune_report()
+    text = iface.get_immune_report_text()
+    assert r1 == r2 and r1 is not r2
+    assert text == r1["text"]
+    assert engine.report_calls == 1
+
+    iface.submit_threat_packet(_packet(1, threat_type="other"))
+    r3 = iface.get_immune_report()
+    assert r3 is not r1
+    assert r3["analysis"]["total_count"] == 2
+    assert engine.report_calls == 2
+
+
+def test_report_cache_is_keyed_by_parameters_with_lru_eviction():
+    engine = _CountingEngine()
+    iface = AdaptiveCoreInterface(engine=engine, report_cache_size=2)
+    iface.submit_threat_packet(_packet(0))
+
+    iface.get_immune_report(min_severity=0)
+    iface.get_immune_report(min_severity=1)
+    iface.get_immune_report(min_severity=0)  # hit, becomes most recent
+    assert engine.report_calls == 2
+
+    iface.get_immune_report(min_severity=2)  # evicts min_severity=1
+    iface.get_immune_report(min_severity=0)  # still cached
+    assert engine.report_calls == 3
+
+    iface.get_immune_report(min_severity=1)  # recomputed
+    assert engine.report_calls == 4
+
+    iface.clear_report_cache()
+    iface.get_immune_report(min_severity=0)
+    assert engine.report_calls == 5
+
+
+def test_report_cache_disabled_and_memory_swap_invalidate():
+    engine = _CountingEngine()
+    iface = AdaptiveCoreInterface(engine=engine, report_cache_size=0)
+    iface.get_immune_report()
+    iface.get_immune_report()
+    assert engine.report_calls == 2
+
+    iface = AdaptiveCoreInterface(engine=engine)
+    iface.get_immune_report()
+    engine.threat_memory = ThreatMemory(path=None)  # same generation, new object
+    iface.get_immune_report()
+    assert engine.report_calls == 4
+
+
+def test_cached_report_is_copied_per_call():
+    engine = _CountingEngine()
+    iface = AdaptiveCoreInterface(engine=engine)
+    iface.submit_threat_packet(_packet(0))
+
+    r = iface.get_immune_report()
+    r["summary"]["reorg"] = 999
+    r["text"] = "x"
+
+    again = iface.get_immune_report()
+    assert "reorg" not in again["summary"]
+    assert iface.get_immune_report_text() != "x"
+    assert engine.report_calls == 1
+
+
+def test_deep_pattern_engine_changes_invalidate_cache():
+    engine = _CountingEngine()
+    iface = AdaptiveCoreInterface(engine=engine)
+    iface.submit_threat_packet(_packet(0))
+    assert iface.get_immune_report()["deep_patterns"]["window_mode"] == "count"
+
+    engine.deep_patterns = DeepPatternEngine(
+        memory=engine.threat_memory, short_seconds=300, long_seconds=3600
+    )
+    assert iface.get_immune_report()["deep_patterns"]["window_mode"] == "time"
+    assert engine.report_calls == 2
+
+    engine.deep_patterns.min_severity = 3  # reconfigured in place
+    iface.get_immune_report()
+    assert engine.report_calls == 3
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from adaptive_core.memory_writer import (
+    AdaptiveMemoryWriter,
+    BatchingFanOutEventSink,
+    InMemoryEventSink,
+    JsonLinesFileEventSink,
+    RingBufferEventSink,
+    event_to_json_line,
+)
+from adaptive_core.models import AdaptiveEvent
+
+
+def _event(i: int) -> AdaptiveEvent:
+    return AdaptiveEvent(layer="sentinel", anomaly_type=f"a{i}", severity=float(i))
+
+
+class _SingleOnlySink:
+    """Sink without store_events(): writer must fall back to per-event calls."""
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def store_event(self, event) -> None:
+        self.events.append(event)
+
+
+def test_ring_buffer_sink_keeps_most_recent_and_counts_drops():
+    with pytest.raises(ValueError):
+        RingBufferEventSink(capacity=0)
+
+    sink = RingBufferEventSink(capacity=3)
+    assert sink.capacity == 3
+
+    for i in range(4):
+        sink.store_event(_event(i))
+    sink.store_events([_event(4), _event(5)])
+
+    assert [e.anomaly_type for e in sink.events] == ["a3", "a4", "a5"]
+    assert sink.dropped == 3
+
+
+def test_event_to_json_line_is_sorted_and_serialises_datetime():
+    line = event_to_json_line(_event(1))
+    data = json.loads(line)
+    assert data["layer"] == "sentinel"
+    assert isinstance(data["created_at"], str)
+    assert list(data.keys()) == sorted(data.keys())
+
+    # raw dict payloads are accepted; non-JSON values fall back to str()
+    assert json.loads(event_to_json_line({"b": 1, "a": Path("x")})) == {"a": "x", "b": 1}
+
+
+def test_json_lines_sink_rejects_bad_config(tmp_path):
+    p = tmp_path / "events.jsonl"
+    with pytest.raises(ValueError):
+        JsonLinesFileEventSink(p, max_bytes=0)
+    with pytest.raises(ValueError):
+        JsonLinesFileEventSink(p, backup_count=-1)
+    with pytest.raises(ValueError):
+        JsonLinesFileEventSink(p, flush_every=0)
+
+
+def test_json_lines_sink_buffers_until_flush(tmp_path):
+    p = tmp_path / "sub" / "events.jsonl"
+    sink = JsonLinesFileEventSink(p, flush_every=3)
+
+    sink.store_event(_event(0))
+    sink.store_event(_event(1))
+    assert sink.pending == 2
+    assert not p.exists()  # nothing written yet
+
+    sink.store_event(_event(2))
+    assert sink.pending == 0
+    assert len(p.read_text(encoding="utf-8").splitlines()) == 3
+
+    sink.store_events([_event(3)])
+    sink.close()
+    sink.close()  # idempotent
+    lines = p.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(x)["anomaly_type"] for x in lines] == ["a0", "a1", "a2", "a3"]
+
+
+def test_json_lines_sink_rotates_and_keeps_backup_count(tmp_path):
+    p = tmp_path / "events.jsonl"
+    one_line = len(event_to_json_line(_event(0))) + 1
+
+    with JsonLinesFileEventSink(p, max_bytes=one_line * 2, backup_count=2, flush_every=100) as sink:
+        sink.store_events([_event(0) for _ in range(7)])
+
+    assert len(p.read_text(encoding="utf-8").splitlines()) == 1
+    assert len((tmp_path / "events.jsonl.1").read_text(encoding="utf-8").splitlines()) == 2
+    assert len((tmp_path / "events.jsonl.2").read_text(encoding="utf-8").splitlines()) == 2
+    assert not (tmp_path / "events.jsonl.3").exists()
+
+
+def test_json_lines_sink_without_backups_truncates_on_rotation(tmp_path):
+    p = tmp_path / "events.jsonl"
+    one_line = len(event_to_json_line(_event(0))) + 1
+
+    sink = JsonLinesFileEventSink(p, max_bytes=one_line, backup_count=0, flush_every=1)
+    sink.store_event(_event(0))
+    sink.store_event(_event(0))
+    sink.close()
+
+    assert len(p.read_text(encoding="utf-8").splitlines()) == 1
+    assert not (tmp_path / "events.jsonl.1").exists()
+
+
+def test_fan_out_sink_batches_to_all_downstream_sinks(tmp_path):
+    with pytest.raises(ValueError):
+        BatchingFanOutEventSink([])
+    with pytest.raises(ValueError):
+        BatchingFanOutEventSink([InMemoryEventSink()], batch_size=0)
+
+    mem = InMemoryEventSink()
+    single = _SingleOnlySink()
+    jsonl = JsonLinesFileEventSink(tmp_path / "e.jsonl", flush_every=1000)
+    fan = BatchingFanOutEventSink([mem, single, jsonl], batch_size=2)
+    assert len(fan.sinks) == 3
+
+    fan.store_event(_event(0))
+    assert fan.pending == 1
+    assert mem.events == []
+
+    fan.store_events([_event(1), _event(2)])
+    assert fan.pending == 0
+    assert [e.anomaly_type for e in mem.events] == ["a0", "a1", "a2"]
+    assert [e.anomaly_type for e in single.events] == ["a0", "a1", "a2"]
+    assert jsonl.pending == 0  # downstream flush() is propagated
+
+    fan.store_event(_event(3))
+    fan.close()
+    assert len(mem.events) == 4
+    assert len((tmp_path / "e.jsonl").read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_writer_write_many_uses_batch_api_and_falls_back():
+    sink = RingBufferEventSink(capacity=10)
+    writer = AdaptiveMemoryWriter(sink=sink)
+    out = writer.write_many([_event(0), _event(1)])
+    assert len(out) == 2
+    assert writer.write_many([]) == []
+    assert len(sink.events) == 2
+
+    single = _SingleOnlySink()
+    AdaptiveMemoryWriter(sink=single).write_many(iter([_event(0), _event(1)]))
+    assert len(single.events) == 2
+
+
+def test_writer_write_many_from_dicts_is_all_or_nothing():
+    sink = InMemoryEventSink()
+    writer = AdaptiveMemoryWriter(sink=sink)
+
+    out = writer.write_many_from_dicts(
+        [
+            {"layer": "sentinel", "anomaly_type": "x", "severity": 1},
+            {"layer": "dqsn", "anomaly_type": "y", "severity": 2},
+        ]
+    )
+    assert [e.layer for e in out] == ["sentinel", "dqsn"]
+    assert len(sink.events) == 2
+
+    with pytest.raises(TypeError):
+        writer.write_many_from_dicts(
+            [
+                {"layer": "sentinel", "anomaly_type": "x", "severity": 1},
+                {"layer": "sentinel", "anomaly_type": "x", "severity": 1, "bad": 1},
+            ]
+        )
+    assert len(sink.events) == 2  # nothing from the failed batch was stored
@@ -0,0 +1,153 @@
+# tests/test_trend_rollups.py
+
+from __future__ import annotations
+
+import pytest
+
+from adaptive_core.engine import AdaptiveEngine
+from adaptive_core.threat_memory import ThreatMemory
+from adaptive_core.threat_packet import ThreatPacket
+from adaptive_core.trend_rollups import ThreatTrendRollups
+
+
+def _packet(ts: str, severity: int = 5, threat_type: str = "reorg") -> ThreatPacket:
+    return ThreatPacket(
+        source_layer="sentinel",
+        threat_type=threat_type,
+        severity=severity,
+        description="rollup-test",
+        timestamp=ts,
+    )
+
+
+def test_rollups_match_detect_threat_trends_for_hour_and_day():
+    engine = AdaptiveEngine()
+    stamps = [
+        ("2026-01-01T10:05:00Z", 3),
+        ("2026-01-01T10:45:00Z", 9),
+        ("2026-01-01T11:10:00Z", 8),
+        ("2026-01-02T00:00:00Z", 2),
+        ("2026-01-02T00:30:00Z", 10),
+        ("2026-01-02T00:31:00Z", 1),
+    ]
+    for ts, sev in stamps:
+        engine.receive_threat_packet(_packet(ts, severity=sev))
+
+    for bucket in ("hour", "day"):
+        for min_sev in (0, 3, 9):
+            assert engine.rollup_threat_trends(bucket=bucket, min_severity=min_sev) == (
+                engine.detect_threat_trends(min_severity=min_sev, bucket=bucket)
+            )
+
+
+def test_offset_timestamps_bucket_in_utc_on_both_paths():
+    engine = AdaptiveEngine()
+    engine.receive_threat_packet(_packet("2025-01-03T05:30:00+05:00", severity=9))
+    engine.receive_threat_packet(_packet("2025-01-03T00:10:00Z"))
+    engine.receive_threat_packet(_packet("2025-01-02T23:59:00-01:00"))
+
+    for bucket in ("hour", "day"):
+        assert engine.rollup_threat_trends(bucket=bucket) == engine.detect_threat_trends(bucket=bucket)
+
+    # Wall-clock labels would give three buckets over two days; in UTC
+    # all three packets fall in the same hour.
+    assert engine.detect_threat_trends(bucket="hour")["points"] == [
+        {"bucket": "2025-01-03 00:00", "total": 3, "high_severity": 1}
+    ]
+    assert engine.detect_threat_trends(bucket="day")["points"][0]["bucket"] == "2025-01-03"
+
+
+def test_minute_resolution_range_and_threat_type_filter():
+    r = ThreatTrendRollups()
+    r.add_packet(_packet("2026-01-01T10:00:10Z"))
+    r.add_packet(_packet("2026-01-01T10:00:50Z", threat_type="pqc_risk"))
+    r.add_packet(_packet("2026-01-01T10:01:00Z", severity=9))
+    r.add_packet(_packet("2026-01-01T10:03:00Z"))
+
+    out = r.query(bucket="minute")
+    assert [p["bucket"] for p in out["points"]] == [
+        "2026-01-01 10:00",
+        "2026-01-01 10:01",
+        "2026-01-01 10:03",
+    ]
+    assert out["points"][0]["total"] == 2
+    assert out["points"][1]["high_severity"] == 1
+    assert out["trend_direction"] == "decreasing"
+
+    ranged = r.query(bucket="minute", start="2026-01-01T10:01:00Z", end="2026-01-01T10:03:00Z")
+    assert [p["bucket"] for p in ranged["points"]] == ["2026-01-01 10:01"]
+    assert ranged["trend_direction"] == "unknown"
+
+    # an end bound inside a bucket still includes that bucket
+    partial = r.query(bucket="minute", end="2026-01-01T10:00:30Z")
+    assert partial["points"][0]["total"] == 2
+
+    only_pqc = r.query(bucket="hour", threat_type="pqc_risk")
+    assert only_pqc["points"] == [{"bucket": "2026-01-01 10:00", "total": 1, "high_severity": 0}]
+
+    assert r.query(bucket="day", min_severity=10)["points"] == []
+
+
+def test_retention_drops_old_buckets_and_late_arrivals():
+    r = ThreatTrendRollups(retention={"minute": 3})
+    assert r.retention("minute") == 3
+    assert r.retention("hour") == 30 * 24
+
+    for minute in (0, 2, 1, 5):  # 1 arrives late but is still retained at that time
+        r.add_packet(_packet(f"2026-01-01T10:0{minute}:00Z"))
+    r.add_packet(_packet("2026-01-01T10:02:30Z"))  # too old once 10:05 exists
+
+    buckets = [p["bucket"] for p in r.query(bucket="minute")["points"]]
+    assert buckets == ["2026-01-01 10:05"]
+    assert len(r.query(bucket="hour")["points"]) == 1
+    assert r.query(bucket="hour")["points"][0]["total"] == 5
+
+
+def test_rollups_validate_inputs_and_count_invalid_timestamps():
+    with pytest.raises(ValueError):
+        ThreatTrendRollups(retention={"week": 4})
+    with pytest.raises(ValueError):
+        ThreatTrendRollups(retention={"minute": 0})
+
+    r = ThreatTrendRollups()
+    assert r.resolutions == ["minute", "hour", "day"]
+    with pytest.raises(ValueError):
+        r.query(bucket="week")
+    with pytest.raises(ValueError):
+        r.query(start="yesterday")
+
+    bad = _packet("2026-01-01T10:00:00Z", severity=4)
+    bad.timestamp = "not-a-timestamp"
+    r.add_packet(bad)
+    assert r.query()["invalid_timestamp_count"] == 1
+    assert r.query(min_severity=5)["invalid_timestamp_count"] == 0
+
+
+def test_engine_seeds_rollups_from_loaded_memory(tmp_path):
+    path = tmp_path / "memory.json"
+    mem = ThreatMemory(path=path)
+    mem.add_packet(_packet("2026-01-01T10:00:00Z"))
+    mem.save()
+
+    engine = AdaptiveEngine(threat_memory=ThreatMemory(path=path))
+    assert engine.rollup_threat_trends(bucket="day")["points"][0]["total"] == 1
+
+
+def test_range_query_bisects_to_requested_buckets():
+    r = ThreatTrendRollups()
+    for minute in range(0, 600, 7):
+        h, m = divmod(minute, 60)
+        r.add_packet(_packet(f"2026-01-01T{h:02d}:{m:02d}:00Z"))
+
+    def minutes(**kw):
+        return [p["bucket"][-5:] for p in r.query(bucket="minute", **kw)["points"]]
+
+    everything = minutes()
+    assert len(everything) == len(range(0, 600, 7))
+    assert minutes(start="2026-01-01T03:00:00Z", end="2026-01-01T03:30:00Z") == [
+        m for m in everything if "03:00" <= m < "03:30"
+    ]
+    # a bound inside a bucket still includes that bucket
+    assert minutes(start="2026-01-01T00:07:30Z", end="2026-01-01T00:14:30Z") == ["00:07", "00:14"]
+    assert minutes(start="2026-01-02T00:00:00Z") == []
+    assert minutes(end="2025-12-31T00:00:00Z") == []
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from adaptive_core.v3.archive import INDEX_FILE, EvidenceArchiveV3, archive_window
+from adaptive_core.v3.canonicalize import canonicalize_event
+from adaptive_core.v3.evidence_store import COMPOSITE_COUNTERS, EvidenceStoreV3
+
+
+def _raw(i: int) -> dict:
+    return {
+        "source_layer": ["dqsn", "gate", "edge"][i % 3],
+        "event_type": ["reject", "drop"][i % 2],
+        "severity": (i % 11) / 10,
+        "timestamp": f"2026-01-14T00:{i // 60:02d}:{i % 60:02d}Z",
+        "correlation_id": f"cid-{i}",
+        "meta": {"i": i},
+        "reason_id": ["R1", "R2", None][i % 3],
+    }
+
+
+def _items(n: int):
+    return [canonicalize_event(_raw(i)) for i in range(n)]
+
+
+def test_evicted_events_reach_the_archive_in_order(tmp_path):
+    archive = EvidenceArchiveV3(tmp_path, batch_size=4)
+    store = EvidenceStoreV3(max_events=5, archive=archive)
+    items = _items(20)
+    for it in items:
+        store.add(it)
+
+    assert store.archive is archive
+    assert archive.archived + archive.pending == 15
+    assert [it.context_hash for it in archive.replay()] == [it.context_hash for it in items[:15]]
+    assert archive.pending == 0
+
+
+def test_full_replay_reproduces_a_single_unbounded_store(tmp_path):
+    items = _items(50)
+    with EvidenceArchiveV3(tmp_path, batch_size=7, segment_max_events=14) as archive:
+        store = EvidenceStoreV3(max_events=8, archive=archive, composite_counters=COMPOSITE_COUNTERS)
+        for it in items:
+            store.add(it)
+        assert archive_window(store, archive) == 8
+    assert len(archive.segments) > 1
+
+    reference = EvidenceStoreV3(max_events=1000, composite_counters=COMPOSITE_COUNTERS)
+    for it in items:
+        reference.add(it)
+
+    reopened = EvidenceArchiveV3(tmp_path)
+    assert reopened.archived == 50
+    replayed = EvidenceStoreV3(max_events=1000, composite_counters=COMPOSITE_COUNTERS)
+    assert reopened.replay_into(replayed) == 50
+    assert replayed.snapshot() == reference.snapshot()
+
+
+def test_archive_bytes_are_deterministic(tmp_path):
+    items = _items(30)
+    for name in ("a", "b"):
+        with EvidenceArchiveV3(tmp_path / name, batch_size=8, segment_max_events=16) as archive:
+            archive.archive_events(items)
+    for f in ("segment-000001.jsonl.gz", "segment-000002.jsonl.gz", INDEX_FILE):
+        assert (tmp_path / "a" / f).read_bytes() == (tmp_path / "b" / f).read_bytes()
+
+
+def test_reopen_appends_and_time_range_replay(tmp_path):
+    items = _items(40)
+    with EvidenceArchiveV3(tmp_path, batch_size=10, segment_max_events=20) as archive:
+        archive.archive_events(items[:25])
+    with EvidenceArchiveV3(tmp_path, batch_size=10, segment_max_events=20) as archive:
+        archive.archive_events(items[25:])
+
+    archive = EvidenceArchiveV3(tmp_path)
+    assert archive.segments == ["segment-000001.jsonl.gz", "segment-000002.jsonl.gz"]
+    assert [it.context_hash for it in archive.replay()] == [it.context_hash for it in items]
+
+    window = list(archive.replay(start="2026-01-14T00:00:12Z", end="2026-01-14T00:00:31Z"))
+    assert [it.event.meta["i"] for it in window] == list(range(12, 31))
+
+
+def test_find_by_context_hash(tmp_path):
+    items = _items(12)
+    with EvidenceArchiveV3(tmp_path, batch_size=5) as archive:
+        archive.archive_events(items + [items[3]])
+    assert archive.contains(items[3].context_hash)
+    assert not archive.contains("nope")
+    assert archive.find(items[3].context_hash) == [items[3], items[3]]
+    assert archive.find("nope") == []
+
+
+def test_tampered_segment_fails_closed(tmp_path):
+    with EvidenceArchiveV3(tmp_path, batch_size=5) as archive:
+        archive.archive_events(_items(5))
+    seg = tmp_path / "segment-000001.jsonl.gz"
+    payload = gzip.decompress(seg.read_bytes()).replace(b'"i":1}', b'"i":9}')
+    seg.write_bytes(gzip.compress(payload, mtime=0))
+
+    reopened = EvidenceArchiveV3(tmp_path)
+    with pytest.raises(ValueError, match="AC_V3_ARCHIVE_INVALID"):
+        list(reopened.replay())
+
+
+def test_truncated_segment_and_bad_index_fail_closed(tmp_path):
+    with EvidenceArchiveV3(tmp_path, batch_size=5) as archive:
+        archive.archive_events(_items(5))
+    seg = tmp_path / "segment-000001.jsonl.gz"
+    seg.write_bytes(seg.read_bytes()[:-10])
+    with pytest.raises(ValueError, match="AC_V3_ARCHIVE_INVALID"):
+        list(EvidenceArchiveV3(tmp_path).replay())
+
+    (tmp_path / INDEX_FILE).write_text("{not json}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="AC_V3_ARCHIVE_INVALID"):
+        EvidenceArchiveV3(tmp_path)
+
+
+def test_torn_index_line_is_dropped_on_reopen(tmp_path):
+    items = _items(10)
+    with EvidenceArchiveV3(tmp_path, batch_size=5) as archive:
+        archive.archive_events(items[:5])
+    with open(tmp_path / INDEX_FILE, "a", encoding="utf-8") as fh:
+        fh.write('{"segment": "segm')
+
+    with EvidenceArchiveV3(tmp_path, batch_size=5) as archive:
+        assert archive.archived == 5
+        archive.archive_events(items[5:])
+    assert [it.context_hash for it in EvidenceArchiveV3(tmp_path).replay()] == [it.context_hash for it in items]
+
+
+def test_no_disk_io_until_flush(tmp_path):
+    target = tmp_path / "archive"
+    archive = EvidenceArchiveV3(target, batch_size=100)
+    archive.archive_events(_items(3))
+    assert not target.exists()
+    assert archive.pending == 3
+
+
+def test_invalid_configuration_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        EvidenceArchiveV3(tmp_path, batch_size=0)
+    with pytest.raises(ValueError):
+        EvidenceArchiveV3(tmp_path, segment_max_events=0)
+    with pytest.raises(ValueError):
+        EvidenceArchiveV3(tmp_path, compresslevel=10)
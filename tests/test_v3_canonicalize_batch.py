@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from adaptive_core.v3.canonicalize import (
+    CanonicalizeFailure,
+    CanonicalizeResult,
+    canonicalize_event,
+    canonicalize_events,
+)
+from adaptive_core.v3.context_hash import CANONICAL_ENCODER, compute_context_hash, make_canonical_encode
+from adaptive_core.v3.reason_ids import ReasonId
+
+
+def _raw(i: int, **overrides):
+    raw = {
+        "source_layer": "dqsn",
+        "event_type": "reject",
+        "severity": 0.5,
+        "timestamp": "2026-01-14T00:00:00Z",
+        "correlation_id": f"cid-{i}",
+        "meta": {"i": i, "ü": "ß"},
+        "reason_id": "DQSN_META_AMBIGUOUS" if i % 2 else None,
+    }
+    raw.update(overrides)
+    return raw
+
+
+def test_context_hash_matches_plain_json_dumps():
+    canonical = {"b": [1, 2.5, None], "a": {"z": "ü", "y": True}}
+    expected = hashlib.sha256(
+        json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    assert compute_context_hash(canonical) == expected
+
+
+def test_batch_results_are_identical_to_single_item_function():
+    raws = [_raw(i) for i in range(20)]
+    out = list(canonicalize_events(raws))
+    assert all(isinstance(r, CanonicalizeResult) for r in out)
+    assert out == [canonicalize_event(r) for r in raws]
+
+
+def test_batch_collects_failures_in_order_without_aborting():
+    raws = [
+        _raw(0),
+        ["not", "a", "mapping"],
+        _raw(2, timestamp="2026-01-14T00:00:00"),
+        _raw(3, severity=2.0),
+        _raw(4, meta={"bad": object()}),
+        _raw(5),
+    ]
+    out = list(canonicalize_events(raws))  # type: ignore[arg-type]
+
+    assert isinstance(out[0], CanonicalizeResult)
+    assert isinstance(out[5], CanonicalizeResult)
+
+    failures = [o for o in out if isinstance(o, CanonicalizeFailure)]
+    assert [(f.index, f.reason_id) for f in failures] == [
+        (1, ReasonId.AC_V3_INVALID_EVENT),
+        (2, ReasonId.AC_V3_TIMESTAMP_INVALID),
+        (3, ReasonId.AC_V3_NON_CANONICAL),
+        (4, ReasonId.AC_V3_META_INVALID),
+    ]
+    for f in failures:
+        assert f.message.startswith(f.reason_id.value)
+
+
+def test_batch_unprefixed_value_error_maps_to_invalid_event():
+    # json rejects circular structures with a plain ValueError
+    meta: dict = {}
+    meta["self"] = meta
+    (out,) = list(canonicalize_events([_raw(0, meta=meta)]))
+    assert isinstance(out, CanonicalizeFailure)
+    assert out.reason_id == ReasonId.AC_V3_INVALID_EVENT
+
+
+def test_batch_is_lazy_streaming():
+    consumed = []
+
+    def source():
+        for i in range(3):
+            consumed.append(i)
+            yield _raw(i)
+
+    it = canonicalize_events(source())
+    assert consumed == []
+    next(it)
+    assert consumed == [0]
+
+
+class _Raw(dict):
+    pass
+
+
+def test_batch_fast_path_matches_single_item_function_on_edge_cases():
+    # Each record either passes the inline fast path or falls back to the
+    # full validator; outputs must match canonicalize_event either way.
+    raws = [
+        _raw(0),
+        _raw(1, severity=1),  # int severity is coerced by the full path
+        _raw(2, severity=True),
+        _raw(3, severity="0.25"),
+        _raw(4, severity=-0.0),
+        _Raw(_raw(5)),
+        _raw(6, meta=_Raw(a=1)),
+        _raw(7, reason_id=None),
+        _raw(8, timestamp="2026-01-14T00:00:00+00:00Z"),
+    ]
+    out = list(canonicalize_events(raws))
+    assert out == [canonicalize_event(r) for r in raws]
+    assert all(type(r.event.meta) is dict for r in out if isinstance(r, CanonicalizeResult))
+
+    bad = [
+        _raw(0, source_layer=" "),
+        _raw(1, reason_id=""),
+        _raw(2, meta={1: "x"}),
+        _raw(3, timestamp="not-a-timeZ"),
+        {k: v for k, v in _raw(5).items() if k != "meta"},
+    ]
+    for raw, f in zip(bad, canonicalize_events(bad)):
+        assert isinstance(f, CanonicalizeFailure)
+        try:
+            canonicalize_event(raw)
+        except ValueError as e:
+            assert f.message == str(e)
+        else:  # pragma: no cover
+            raise AssertionError(raw)
+
+
+def test_batch_encoder_recovers_after_a_failed_encode():
+    # A failed encode must not leave stale circular-reference markers that
+    # make a later encode of the same (now valid) container fail.
+    encode = make_canonical_encode()
+    obj = {"a": {"b": 1}, "z": object()}
+    with pytest.raises(TypeError):
+        encode(obj)
+    del obj["z"]
+    assert encode(obj) == CANONICAL_ENCODER.encode(obj)
+
+    raws = [_raw(0, meta={"a": {"b": 1}, "z": object()})] + [_raw(i) for i in range(1, 50)]
+    out = list(canonicalize_events(raws))
+    assert isinstance(out[0], CanonicalizeFailure)
+    assert out[1:] == [canonicalize_event(r) for r in raws[1:]]
+
+
+def test_batch_encoder_falls_back_without_c_accelerator(monkeypatch):
+    monkeypatch.setattr(json.encoder, "c_make_encoder", None)
+    assert make_canonical_encode() == CANONICAL_ENCODER.encode
+    raws = [_raw(i) for i in range(5)]
+    assert list(canonicalize_events(raws)) == [canonicalize_event(r) for r in raws]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+from importlib import resources
+
+import pytest
+
+from adaptive_core.v3 import confidence as conf
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.guardrails import registry as reg
+from adaptive_core.v3.lazy_resource import LazyResource
+from adaptive_core.v3.pipeline import run_v3_pipeline
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    reg.reload_registry()
+    conf.reload_confidence_weights()
+    yield
+    reg.reload_registry()
+    conf.reload_confidence_weights()
+
+
+def _sha(package: str, name: str) -> str:
+    text = resources.files(package).joinpath(name).read_text(encoding="utf-8")
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def test_registry_is_loaded_once_and_hashed():
+    r1 = reg.get_registry()
+    assert reg.get_registry() is r1
+    assert r1.version == reg.load_registry().version
+    assert reg.registry_content_hash() == _sha("adaptive_core.v3.guardrails", "amg_guardrails_v1.json")
+
+    r2 = reg.reload_registry()
+    assert r2 is not r1
+    assert reg.get_registry() is r2
+
+
+def test_weights_are_loaded_once_and_hashed():
+    w1 = conf.get_confidence_weights()
+    assert conf.get_confidence_weights() is w1
+    assert w1 == conf.load_confidence_weights()
+    assert conf.confidence_weights_content_hash() == _sha("adaptive_core.v3", "confidence_weights_v3.json")
+    assert conf.reload_confidence_weights() is not w1
+
+
+def test_reports_do_not_reread_resources_once_warm(monkeypatch: pytest.MonkeyPatch):
+    snap = EvidenceSnapshot(
+        total_events=10,
+        by_source_layer={"dqsn": 10},
+        by_event_type={"reject": 10},
+        by_upstream_reason_id={"SPIKE": 10},
+    )
+    caps = CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF")
+    kwargs = dict(
+        report_id="AC-UR-CACHE-0001",
+        target_layers=["DQSN"],
+        snapshot=snap,
+        confidence_threshold=0.0,
+        capabilities=caps,
+    )
+    _, before, _, _ = run_v3_pipeline(**kwargs)
+
+    def _boom(_):
+        raise AssertionError("resource read on hot path")
+
+    monkeypatch.setattr(resources, "files", _boom)
+    _, after, _, _ = run_v3_pipeline(**kwargs)
+    assert after == before
+
+
+def test_reload_fails_closed_on_bad_resource(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(reg, "_read_registry_text", lambda: '{"nope": true}')
+    with pytest.raises(ValueError, match="AC_V3_GUARDRAIL_REGISTRY_INVALID"):
+        reg.reload_registry()
+
+    monkeypatch.setattr(conf, "_read_weights_text", lambda: '{"version": "x", "weights": []}')
+    with pytest.raises(ValueError, match="AC_V3_CONF_WEIGHTS_INVALID"):
+        conf.reload_confidence_weights()
+
+
+def test_lazy_resource_reads_once_and_does_not_cache_failures():
+    reads = []
+    texts = iter(["bad", '{"v": 1}'])
+
+    def read() -> str:
+        reads.append(1)
+        return next(texts)
+
+    def parse(text: str) -> dict:
+        if text == "bad":
+            raise ValueError("invalid")
+        return {"parsed": text}
+
+    res = LazyResource(read, parse)
+    with pytest.raises(ValueError):
+        res.get()
+    assert res.get() == {"parsed": '{"v": 1}'}
+    assert res.get() is res.get()
+    assert res.content_hash() == hashlib.sha256(b'{"v": 1}').hexdigest()
+    assert len(reads) == 2
@@ -0,0 +1,107 @@
+import itertools
+import random
+
+import pytest
+
+from adaptive_core.v3.correlation import (
+    CorrelationAggregator,
+    CorrelationSnapshot,
+    aggregate_node_summaries,
+    merge_correlation_snapshots,
+)
+from adaptive_core.v3.node_summary import canonicalize_node_summary
+
+
+def _summary(node_id: str, counts: dict, total: int = 100) -> dict:
+    return {
+        "node_id": node_id,
+        "window_start": "2026-01-14T00:00:00Z",
+        "window_end": "2026-01-14T01:00:00Z",
+        "total_events": total,
+        "by_upstream_reason_id": counts,
+    }
+
+
+def _events(n: int = 40, seed: int = 7):
+    rng = random.Random(seed)
+    reasons = ["RISK", "OTHER", "DRIFT", "AUTH"]
+    out = []
+    for i in range(n):
+        counts = {r: rng.randint(0, 5) for r in rng.sample(reasons, rng.randint(0, 3))}
+        ev, _ = canonicalize_node_summary(_summary(f"n{i}", counts, rng.randint(0, 500)))
+        out.append(ev)
+    return out
+
+
+def _as_tuple(snap: CorrelationSnapshot):
+    return (
+        snap.total_nodes,
+        snap.total_events,
+        list(snap.by_upstream_reason_id.items()),
+        list(snap.nodes_reporting_reason_id.items()),
+    )
+
+
+def test_aggregator_matches_single_pass():
+    events = _events()
+    agg = CorrelationAggregator()
+    for ev in events:
+        agg.add(ev)
+    assert agg.snapshot() == aggregate_node_summaries(events)
+
+
+def test_zero_counts_are_ignored():
+    ev, _ = canonicalize_node_summary(_summary("n1", {"RISK": 0, "OTHER": 2}))
+    snap = CorrelationAggregator().add(ev).snapshot()
+    assert snap.by_upstream_reason_id == {"OTHER": 2}
+    assert snap.nodes_reporting_reason_id == {"OTHER": 1}
+    assert snap.total_nodes == 1
+
+
+def test_merge_is_order_independent_including_key_order():
+    events = _events()
+    expected = _as_tuple(aggregate_node_summaries(events))
+    parts = [aggregate_node_summaries(events[i::4]) for i in range(4)]
+
+    for perm in itertools.permutations(parts):
+        assert _as_tuple(merge_correlation_snapshots(perm)) == expected
+
+    shuffled = list(events)
+    random.Random(1).shuffle(shuffled)
+    assert _as_tuple(aggregate_node_summaries(shuffled)) == expected
+
+
+def test_merge_is_associative():
+    events = _events()
+    a, b, c = (aggregate_node_summaries(events[i::3]) for i in range(3))
+
+    left = merge_correlation_snapshots([merge_correlation_snapshots([a, b]), c])
+    right = merge_correlation_snapshots([a, merge_correlation_snapshots([b, c])])
+    assert _as_tuple(left) == _as_tuple(right) == _as_tuple(aggregate_node_summaries(events))
+
+
+def test_merge_accepts_aggregators_and_empty_partials():
+    events = _events()
+    regional = [CorrelationAggregator().add_many(events[:10]), CorrelationAggregator()]
+    central = CorrelationAggregator().add_many(events[10:])
+    for r in regional:
+        central.merge(r)
+    central.merge(aggregate_node_summaries([]))
+    assert central.snapshot() == aggregate_node_summaries(events)
+    assert merge_correlation_snapshots([]) == aggregate_node_summaries([])
+
+
+def test_merge_does_not_mutate_partials():
+    events = _events()
+    part = aggregate_node_summaries(events[:5])
+    before = _as_tuple(part)
+    CorrelationAggregator().merge(part).add_many(events[5:]).snapshot()
+    assert _as_tuple(part) == before
+
+
+@pytest.mark.parametrize("split", [0, 1, 17, 40])
+def test_streaming_split_points(split):
+    events = _events()
+    head = CorrelationAggregator().add_many(events[:split])
+    tail = CorrelationAggregator().add_many(events[split:])
+    assert head.merge(tail).snapshot() == aggregate_node_summaries(events)
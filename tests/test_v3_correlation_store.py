@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from adaptive_core.v3.correlation import aggregate_node_summaries
+from adaptive_core.v3.correlation_store import CorrelationStoreV3
+from adaptive_core.v3.node_summary import NodeSummaryEventV3, canonicalize_node_summary
+
+
+def _summary(node_id: str, hour: int, counts: dict, total: int = 100) -> tuple:
+    return canonicalize_node_summary(
+        {
+            "node_id": node_id,
+            "window_start": f"2026-01-14T{hour:02d}:00:00Z",
+            "window_end": f"2026-01-14T{hour + 1:02d}:00:00Z",
+            "total_events": total,
+            "by_upstream_reason_id": counts,
+        }
+    )
+
+
+def _fleet(seed: int = 3):
+    rng = random.Random(seed)
+    out = []
+    for hour in range(6):
+        for n in range(8):
+            counts = {r: rng.randint(0, 4) for r in rng.sample(["RISK", "OTHER", "DRIFT"], rng.randint(0, 2))}
+            out.append(_summary(f"n{n}", hour, counts, rng.randint(0, 300)))
+    return out
+
+
+def test_snapshot_matches_aggregate_over_range():
+    items = _fleet()
+    store = CorrelationStoreV3()
+    assert store.add_many(items) == len(items)
+    assert store.total_summaries == len(items)
+
+    assert store.snapshot() == aggregate_node_summaries(ev for ev, _ in items)
+
+    in_range = [ev for ev, _ in items if "T02:" <= ev.window_start[10:14] < "T04:"]
+    snap = store.snapshot("2026-01-14T02:00:00Z", "2026-01-14T04:00:00Z")
+    assert snap == aggregate_node_summaries(in_range)
+    assert snap.total_nodes == 16
+    assert list(store.summaries("2026-01-14T02:00:00Z", "2026-01-14T04:00:00Z")) == in_range
+
+
+def test_range_bounds_are_half_open_on_window_start():
+    store = CorrelationStoreV3()
+    store.add_many([_summary("n1", 1, {"RISK": 1}), _summary("n1", 2, {"RISK": 2})])
+
+    assert store.snapshot("2026-01-14T01:00:00Z", "2026-01-14T02:00:00Z").by_upstream_reason_id == {"RISK": 1}
+    assert store.snapshot("2026-01-14T01:30:00Z").by_upstream_reason_id == {"RISK": 2}
+    assert store.snapshot(end="2026-01-14T01:00:00Z").total_nodes == 0
+    # Offsets are normalized to UTC
+    assert store.snapshot("2026-01-14T03:00:00+01:00", "2026-01-14T04:00:00+01:00").total_nodes == 1
+
+
+def test_latest_summary_per_node_wins_in_any_order():
+    early = _summary("n1", 0, {"RISK": 1}, total=10)
+    late = _summary("n1", 0, {"RISK": 3, "OTHER": 1}, total=40)
+    other = _summary("n2", 0, {"RISK": 2}, total=5)
+
+    snaps = []
+    for order in ([early, late, other], [late, other, early], [other, early, late]):
+        store = CorrelationStoreV3()
+        store.add_many(order)
+        snaps.append(store.snapshot())
+        assert store.total_summaries == 2
+    assert snaps[0] == snaps[1] == snaps[2]
+    assert snaps[0] == aggregate_node_summaries([late[0], other[0]])
+    assert snaps[0].nodes_reporting_reason_id == {"OTHER": 1, "RISK": 2}
+
+
+def test_replacement_and_duplicate_counters():
+    store = CorrelationStoreV3()
+    a = _summary("n1", 0, {"RISK": 1}, total=10)
+    b = _summary("n1", 0, {"RISK": 2}, total=10)
+    assert store.add(*a)
+    assert not store.add(*a)
+    winner, loser = (a, b) if a[1] > b[1] else (b, a)
+    assert store.add(*winner) == (winner is b)
+    assert not store.add(*loser)
+
+    assert store.replaced == (1 if winner is b else 0)
+    assert store.superseded_rejected == (2 if winner is b else 3)
+    assert list(store.summaries()) == [winner[0]]
+
+
+def test_replacement_drops_reasons_that_went_away():
+    store = CorrelationStoreV3()
+    store.add(*_summary("n1", 0, {"RISK": 1}, total=10))
+    store.add(*_summary("n1", 0, {"OTHER": 2}, total=20))
+    snap = store.snapshot()
+    assert snap.by_upstream_reason_id == {"OTHER": 2}
+    assert snap.nodes_reporting_reason_id == {"OTHER": 1}
+    assert snap.total_events == 20
+
+
+def test_context_hash_is_computed_when_omitted():
+    ev, ctx = _summary("n1", 0, {"RISK": 1})
+    store = CorrelationStoreV3()
+    assert store.add(ev)
+    assert not store.add(ev, ctx)
+
+
+def test_max_windows_keeps_newest_regardless_of_order():
+    items = _fleet()
+    expected = None
+    for seed in range(3):
+        shuffled = list(items)
+        random.Random(seed).shuffle(shuffled)
+        store = CorrelationStoreV3(max_windows=2)
+        store.add_many(shuffled)
+        assert [w[0] for w in store.windows()] == ["2026-01-14T04:00:00Z", "2026-01-14T05:00:00Z"]
+        assert store.evicted_windows + store.late_rejected > 0
+        if expected is None:
+            expected = store.snapshot()
+        assert store.snapshot() == expected
+    assert expected == aggregate_node_summaries(ev for ev, _ in items if ev.window_start >= "2026-01-14T04")
+
+
+def test_invalid_inputs_fail_closed():
+    with pytest.raises(ValueError):
+        CorrelationStoreV3(max_windows=0)
+    bad = NodeSummaryEventV3("n1", "2026-01-14T01:00:00Z", "2026-01-14T01:00:00Z", 1, {})
+    with pytest.raises(ValueError, match="AC_V3_NON_CANONICAL"):
+        CorrelationStoreV3().add(bad)
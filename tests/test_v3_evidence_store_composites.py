@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from adaptive_core.v3.canonicalize import CanonicalizeResult
+from adaptive_core.v3.evidence_store import COMPOSITE_COUNTERS, EvidenceStoreV3, severity_bin
+from adaptive_core.v3.events import ObservedEventV3
+
+
+def _item(
+    ctx: str,
+    layer: str = "dqsn",
+    etype: str = "reject",
+    reason_id: str | None = "R1",
+    severity: float = 0.5,
+) -> CanonicalizeResult:
+    ev = ObservedEventV3(
+        source_layer=layer,
+        event_type=etype,
+        severity=severity,
+        timestamp="2026-01-14T00:00:00Z",
+        correlation_id=f"cid-{ctx}",
+        meta={},
+        reason_id=reason_id,
+    )
+    return CanonicalizeResult(event=ev, context_hash=ctx)
+
+
+def _rescan(store: EvidenceStoreV3):
+    layer_reason: Counter = Counter()
+    type_reason: Counter = Counter()
+    hist: Counter = Counter()
+    for it in store.iter_window():
+        ev = it.event
+        if ev.reason_id:
+            layer_reason[(ev.source_layer, ev.reason_id)] += 1
+            type_reason[(ev.event_type, ev.reason_id)] += 1
+        hist[severity_bin(ev.severity)] += 1
+    return dict(layer_reason), dict(type_reason), dict(hist)
+
+
+def test_composites_are_disabled_by_default():
+    s = EvidenceStoreV3(max_events=10)
+    s.add(_item("a"))
+    snap = s.snapshot()
+    assert s.composite_counters == ()
+    assert snap.by_source_layer_reason_id == {}
+    assert snap.by_event_type_reason_id == {}
+    assert snap.severity_histogram == {}
+
+
+def test_unknown_composite_is_rejected():
+    with pytest.raises(ValueError):
+        EvidenceStoreV3(composite_counters=["by_color"])
+
+
+def test_composites_match_window_rescan_through_eviction():
+    s = EvidenceStoreV3(max_events=5, composite_counters=COMPOSITE_COUNTERS)
+    assert s.composite_counters == COMPOSITE_COUNTERS
+
+    layers = ["dqsn", "gate", "edge"]
+    types = ["reject", "drop"]
+    reasons = ["R1", "R2", None]
+    for i in range(40):
+        s.add(
+            _item(
+                f"c{i}",
+                layer=layers[i % 3],
+                etype=types[i % 2],
+                reason_id=reasons[i % 3 if i % 4 else 0],
+                severity=(i % 11) / 10,
+            )
+        )
+        snap = s.snapshot()
+        layer_reason, type_reason, hist = _rescan(s)
+        assert snap.by_source_layer_reason_id == layer_reason
+        assert snap.by_event_type_reason_id == type_reason
+        assert snap.severity_histogram == hist
+        assert sum(snap.severity_histogram.values()) == snap.total_events
+
+
+def test_only_selected_composites_are_maintained():
+    s = EvidenceStoreV3(max_events=10, composite_counters=["severity_histogram"])
+    s.add(_item("a", severity=1.0))
+    s.add(_item("b", severity=0.0))
+    snap = s.snapshot()
+    assert snap.severity_histogram == {9: 1, 0: 1}
+    assert snap.by_source_layer_reason_id == {}
+
+
+def test_severity_bin_edges():
+    assert severity_bin(0.0) == 0
+    assert severity_bin(0.09) == 0
+    assert severity_bin(0.1) == 1
+    assert severity_bin(1.0) == 9
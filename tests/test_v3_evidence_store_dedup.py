@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from adaptive_core.v3.canonicalize import CanonicalizeResult
+from adaptive_core.v3.evidence_store import EvidenceStoreV3
+from adaptive_core.v3.events import ObservedEventV3
+
+
+def _item(ctx: str, reason_id: str | None = "R1") -> CanonicalizeResult:
+    ev = ObservedEventV3(
+        source_layer="dqsn",
+        event_type="reject",
+        severity=0.5,
+        timestamp="2026-01-14T00:00:00Z",
+        correlation_id=f"cid-{ctx}",
+        meta={},
+        reason_id=reason_id,
+    )
+    return CanonicalizeResult(event=ev, context_hash=ctx)
+
+
+def test_dedup_is_off_by_default_and_counts_every_copy():
+    s = EvidenceStoreV3(max_events=10)
+    assert s.dedup is False
+    assert s.add(_item("a")) is True
+    assert s.add(_item("a")) is True
+    snap = s.snapshot()
+    assert snap.total_events == 2
+    assert snap.duplicates_rejected == 0
+
+
+def test_dedup_rejects_duplicates_in_window_and_counts_them():
+    s = EvidenceStoreV3(max_events=10, dedup=True)
+    assert s.add(_item("a")) is True
+    assert s.add(_item("a")) is False
+    assert s.add(_item("b")) is True
+    assert s.add(_item("a")) is False
+
+    snap = s.snapshot()
+    assert snap.total_events == 2
+    assert snap.by_upstream_reason_id == {"R1": 2}
+    assert snap.duplicates_rejected == 2
+    assert [x.context_hash for x in s.iter_window()] == ["a", "b"]
+
+
+def test_dedup_index_evicts_in_step_with_window():
+    s = EvidenceStoreV3(max_events=2, dedup=True)
+    s.add(_item("a"))
+    s.add(_item("b"))
+    s.add(_item("c"))  # evicts "a"
+
+    # "a" left the hot window, so it is accepted again
+    assert s.add(_item("a")) is True  # evicts "b"
+    assert s.add(_item("c")) is False
+    assert [x.context_hash for x in s.iter_window()] == ["c", "a"]
+    assert s.snapshot().duplicates_rejected == 1
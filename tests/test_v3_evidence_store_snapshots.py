@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from adaptive_core.v3.canonicalize import CanonicalizeResult
+from adaptive_core.v3.evidence_store import EvidenceStoreV3
+from adaptive_core.v3.events import ObservedEventV3
+
+
+def _item(ctx: str, reason_id: str | None = "R1") -> CanonicalizeResult:
+    ev = ObservedEventV3(
+        source_layer="dqsn",
+        event_type="reject",
+        severity=0.5,
+        timestamp="2026-01-14T00:00:00Z",
+        correlation_id=f"cid-{ctx}",
+        meta={},
+        reason_id=reason_id,
+    )
+    return CanonicalizeResult(event=ev, context_hash=ctx)
+
+
+def test_snapshot_is_reused_until_store_changes():
+    s = EvidenceStoreV3(max_events=10)
+    s.add(_item("a"))
+    first = s.snapshot()
+    assert s.snapshot() is first
+
+    s.add(_item("b"))
+    second = s.snapshot()
+    assert second is not first
+    assert first.total_events == 1
+    assert second.total_events == 2
+    assert s.snapshot() is second
+
+
+def test_generation_tracks_adds_evictions_and_duplicate_rejections():
+    s = EvidenceStoreV3(max_events=1, dedup=True)
+    g0 = s.generation
+    s.add(_item("a"))
+    g1 = s.generation
+    assert g1 > g0
+
+    snap = s.snapshot()
+    assert s.add(_item("a")) is False
+    assert s.generation > g1
+    assert s.snapshot() is not snap
+    assert s.snapshot().duplicates_rejected == 1
+
+    s.add(_item("b"))  # evicts "a"
+    assert [it.context_hash for it in s.iter_events()] == ["b"]
+    assert s.snapshot().total_events == 1
+
+
+def test_iter_events_is_lazy_and_ordered():
+    s = EvidenceStoreV3(max_events=3)
+    for ctx in "abcd":
+        s.add(_item(ctx))
+    it = s.iter_events()
+    assert not isinstance(it, list)
+    assert [x.context_hash for x in it] == ["b", "c", "d"]
+    assert [x.context_hash for x in s.iter_events()] == [x.context_hash for x in s.iter_window()]
+
+
+def test_iter_events_raises_on_mutation():
+    s = EvidenceStoreV3(max_events=10)
+    s.add(_item("a"))
+    s.add(_item("b"))
+    it = s.iter_events()
+    next(it)
+    s.add(_item("c"))
+    with pytest.raises(RuntimeError):
+        list(it)
+
+
+def test_iterators_survive_duplicate_rejections():
+    s = EvidenceStoreV3(max_events=10, dedup=True)
+    for ctx in "abc":
+        s.add(_item(ctx))
+    events, tail = s.iter_events(), s.iter_tail(3)
+    assert next(events).context_hash == "a"
+    assert next(tail).context_hash == "a"
+
+    g = s.generation
+    assert s.add(_item("b")) is False  # upstream retry
+    assert s.generation > g  # snapshot cache still invalidated
+    assert s.snapshot().duplicates_rejected == 1
+
+    assert [x.context_hash for x in events] == ["b", "c"]
+    assert [x.context_hash for x in tail] == ["b", "c"]
+
+
+def test_iter_tail_yields_newest_oldest_first():
+    s = EvidenceStoreV3(max_events=10)
+    for ctx in "abcde":
+        s.add(_item(ctx))
+    assert [x.context_hash for x in s.iter_tail(2)] == ["d", "e"]
+    assert [x.context_hash for x in s.iter_tail(99)] == list("abcde")
+    assert list(s.iter_tail(0)) == []
+
+    it = s.iter_tail(3)
+    next(it)
+    s.add(_item("f"))
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_iter_tail_rejects_negative_n():
+    s = EvidenceStoreV3(max_events=10)
+    with pytest.raises(ValueError):
+        s.iter_tail(-1)
+
+
+def test_cached_snapshot_cannot_be_mutated_by_callers():
+    s = EvidenceStoreV3(max_events=10, composite_counters=["severity_histogram"])
+    s.add(_item("a"))
+    snap = s.snapshot()
+
+    for mutate in (
+        lambda d: d.__setitem__("x", 1),
+        lambda d: d.__delitem__("R1"),
+        lambda d: d.update({"x": 1}),
+        lambda d: d.pop("R1"),
+        lambda d: d.popitem(),
+        lambda d: d.setdefault("x", 1),
+        lambda d: d.clear(),
+    ):
+        with pytest.raises(TypeError):
+            mutate(snap.by_upstream_reason_id)
+    with pytest.raises(TypeError):
+        snap.severity_histogram[0] = 5
+    with pytest.raises(TypeError):
+        snap.by_source_layer |= {"x": 1}
+
+    assert s.snapshot() is snap
+    assert s.snapshot().by_upstream_reason_id == {"R1": 1}
+    assert s.snapshot().by_source_layer == {"dqsn": 1}
+
+
+def test_read_only_snapshot_still_pickles_copies_and_encodes():
+    s = EvidenceStoreV3(max_events=10)
+    s.add(_item("a"))
+    snap = s.snapshot()
+
+    clone = pickle.loads(pickle.dumps(snap))
+    assert clone == snap
+    assert type(clone.by_upstream_reason_id) is type(snap.by_upstream_reason_id)
+    assert copy.deepcopy(snap) == snap
+    assert json.dumps(snap.by_upstream_reason_id) == '{"R1": 1}'
+
+    mutable = dict(snap.by_upstream_reason_id)
+    mutable["R1"] += 1
+    assert snap.by_upstream_reason_id == {"R1": 1}
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_core.v3.canonicalize import canonicalize_event
+from adaptive_core.v3.evidence_store import EvidenceStoreV3
+
+
+def _ev(ts: str, reason_id: str = "R1", layer: str = "dqsn", cid: str | None = None):
+    return canonicalize_event(
+        {
+            "source_layer": layer,
+            "event_type": "reject",
+            "severity": 0.5,
+            "timestamp": ts,
+            "correlation_id": cid or f"cid-{ts}-{reason_id}",
+            "meta": {},
+            "reason_id": reason_id,
+        }
+    )
+
+
+def _hours(store: EvidenceStoreV3):
+    return [x.event.timestamp[11:16] for x in store.iter_window()]
+
+
+def test_time_window_rejects_non_positive_span():
+    with pytest.raises(ValueError):
+        EvidenceStoreV3(window_seconds=0)
+    assert EvidenceStoreV3().window_seconds is None
+
+
+def test_time_window_expires_by_event_timestamp_and_keeps_counters():
+    s = EvidenceStoreV3(max_events=100, window_seconds=3600)
+    assert s.window_seconds == 3600
+
+    s.add(_ev("2026-01-14T00:00:00Z", "OLD", layer="a"))
+    s.add(_ev("2026-01-14T00:30:00Z", "MID"))
+    s.add(_ev("2026-01-14T01:00:00Z", "NEW"))  # 00:00 is exactly on the boundary -> expired
+
+    assert _hours(s) == ["00:30", "01:00"]
+    snap = s.snapshot()
+    assert snap.total_events == 2
+    assert snap.by_source_layer == {"dqsn": 2}
+    assert snap.by_upstream_reason_id == {"MID": 1, "NEW": 1}
+
+    s.add(_ev("2026-01-14T05:00:00Z", "LATEST"))
+    assert s.snapshot().by_upstream_reason_id == {"LATEST": 1}
+
+
+def test_late_events_inside_span_are_ordered_and_outside_are_rejected():
+    s = EvidenceStoreV3(max_events=100, window_seconds=3600)
+    s.add(_ev("2026-01-14T01:00:00Z"))
+    assert s.add(_ev("2026-01-14T00:40:00Z", "A")) is True
+    assert s.add(_ev("2026-01-14T00:40:00Z", "B")) is True  # equal stamps keep arrival order
+    assert s.add(_ev("2026-01-14T00:00:00Z")) is False
+    assert s.late_rejected == 1
+
+    assert [x.event.reason_id for x in s.iter_window()] == ["A", "B", "R1"]
+
+    s.add(_ev("2026-01-14T01:45:00Z"))  # expires both 00:40 events
+    assert _hours(s) == ["01:00", "01:45"]
+    assert s.snapshot().by_upstream_reason_id == {"R1": 2}
+
+
+def test_time_window_still_capped_by_max_events_and_dedups():
+    s = EvidenceStoreV3(max_events=2, window_seconds=86400, dedup=True)
+    s.add(_ev("2026-01-14T00:00:00Z"))
+    s.add(_ev("2026-01-14T00:01:00Z"))
+    assert s.add(_ev("2026-01-14T00:01:00Z")) is False  # duplicate context_hash
+    s.add(_ev("2026-01-14T00:02:00Z"))
+
+    assert _hours(s) == ["00:01", "00:02"]
+    snap = s.snapshot()
+    assert snap.total_events == 2
+    assert snap.duplicates_rejected == 1
+
+    # older than everything in a full window: rejected, never counted
+    assert s.add(_ev("2026-01-14T00:00:00Z", reason_id="LATE", layer="late")) is False
+    assert _hours(s) == ["00:01", "00:02"]
+    assert s.late_rejected == 1
+    snap = s.snapshot()
+    assert snap.total_events == 2
+    assert snap.by_source_layer == {"dqsn": 2}
+    assert snap.by_upstream_reason_id == {"R1": 2}
+
+
+def test_full_time_window_late_event_does_not_corrupt_counters():
+    s = EvidenceStoreV3(max_events=2, window_seconds=100, composite_counters=["source_layer_reason_id"])
+    s.add(_ev("2026-01-14T00:00:10Z", layer="a"))
+    s.add(_ev("2026-01-14T00:00:20Z", layer="a"))
+    assert s.add(_ev("2026-01-14T00:00:05Z", reason_id="R", layer="late")) is False
+
+    snap = s.snapshot()
+    assert snap.by_source_layer == {"a": 2}
+    assert snap.by_upstream_reason_id == {"R1": 2}
+    assert snap.by_source_layer_reason_id == {("a", "R1"): 2}
+
+    # a late event inside a full window still displaces the oldest
+    assert s.add(_ev("2026-01-14T00:00:15Z", reason_id="R", layer="late")) is True
+    assert _hours(s) == ["00:00", "00:00"]
+    assert [x.event.source_layer for x in s.iter_window()] == ["late", "a"]
+    assert s.snapshot().by_source_layer == {"a": 1, "late": 1}
+    assert s.snapshot().by_upstream_reason_id == {"R": 1, "R1": 1}
+
+
+def test_time_window_honours_explicit_offsets():
+    s = EvidenceStoreV3(window_seconds=60)
+    s.add(_ev("2026-01-14T02:00:00+02:00Z"))  # == 00:00 UTC
+    s.add(_ev("2026-01-14T00:00:30Z"))
+    assert s.snapshot().total_events == 2
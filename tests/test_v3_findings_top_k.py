@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_core.v3.analyze import AnalyzeConfig, generate_findings, reason_spike_finding, top_k
+from adaptive_core.v3.correlation import CorrelationSnapshot, generate_correlation_findings
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.incremental_report import EvidenceDelta, IncrementalReportBuilderV3
+from adaptive_core.v3.pipeline import PipelineJobV3, run_v3_pipeline, run_v3_pipeline_batch
+from adaptive_core.v3.report_builder import build_upgrade_report
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+def _snapshot(seed: int, n_reasons: int = 2000) -> EvidenceSnapshot:
+    rng = random.Random(seed)
+    reasons = {f"R{i:05d}": rng.choice([1, 2, 5, 50, 400, 900, 900]) for i in range(n_reasons)}
+    return EvidenceSnapshot(
+        total_events=4000,
+        by_source_layer={"dqsn": 4000},
+        by_event_type={"reject": 4000},
+        by_upstream_reason_id=reasons,
+    )
+
+
+def _reference(snap: EvidenceSnapshot, cfg: AnalyzeConfig):
+    out = []
+    for rid, count in sorted(snap.by_upstream_reason_id.items()):
+        f = reason_spike_finding(rid, count, snap.total_events, cfg)
+        if f is not None:
+            out.append(f)
+    return out
+
+
+def test_prefiltered_findings_match_full_scan():
+    for seed in range(5):
+        snap = _snapshot(seed)
+        cfg = AnalyzeConfig(reason_spike_min_ratio=0.05)
+        assert generate_findings(snap, cfg) == _reference(snap, cfg)
+
+
+def test_top_k_keeps_strongest_and_reason_order():
+    snap = EvidenceSnapshot(
+        total_events=100,
+        by_source_layer={},
+        by_event_type={},
+        by_upstream_reason_id={"D": 20, "A": 10, "C": 30, "B": 20, "E": 1},
+    )
+    found = generate_findings(snap, AnalyzeConfig(max_findings=2))
+    # strongest: C (30), then B/D tie at 20 -> B wins by reason_id
+    assert [f.evidence["reason_id"] for f in found] == ["B", "C"]
+    assert generate_findings(snap, AnalyzeConfig(max_findings=0)) == []
+    assert generate_findings(snap, AnalyzeConfig(max_findings=99)) == generate_findings(snap)
+
+
+def test_top_k_matches_sort_based_selection():
+    snap = _snapshot(11)
+    cfg_all = AnalyzeConfig(reason_spike_min_ratio=0.0)
+    everything = generate_findings(snap, cfg_all)
+    expected = sorted(everything, key=lambda f: (-f.evidence["count"], f.evidence["reason_id"]))[:25]
+    got = generate_findings(snap, AnalyzeConfig(reason_spike_min_ratio=0.0, max_findings=25))
+    assert got == sorted(expected, key=lambda f: f.evidence["reason_id"])
+
+
+def test_correlation_top_k_and_prefilter():
+    rng = random.Random(3)
+    nodes = {f"R{i:04d}": rng.randint(0, 10) for i in range(500)}
+    snap = CorrelationSnapshot(
+        total_nodes=10,
+        total_events=1000,
+        by_upstream_reason_id={rid: n * 3 for rid, n in nodes.items()},
+        nodes_reporting_reason_id=nodes,
+    )
+    full = generate_correlation_findings(snap)
+    assert [f.evidence["reason_id"] for f in full] == sorted(rid for rid, n in nodes.items() if n >= 5)
+
+    limited = generate_correlation_findings(snap, max_findings=7)
+    expected = sorted(full, key=lambda f: (-f.evidence["nodes_reporting"], f.evidence["reason_id"]))[:7]
+    assert limited == sorted(expected, key=lambda f: f.evidence["reason_id"])
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        AnalyzeConfig(max_findings=-1)
+    with pytest.raises(ValueError):
+        generate_correlation_findings(CorrelationSnapshot(0, 0, {}, {}), max_findings=-1)
+    assert top_k([("a", 1)], None) == [("a", 1)]
+
+
+def _spike_snapshot() -> EvidenceSnapshot:
+    return EvidenceSnapshot(
+        total_events=100,
+        by_source_layer={"dqsn": 100},
+        by_event_type={"reject": 100},
+        by_upstream_reason_id={"D": 20, "A": 10, "C": 30, "B": 20, "E": 1},
+    )
+
+
+def _corr_snapshot() -> CorrelationSnapshot:
+    return CorrelationSnapshot(
+        total_nodes=10,
+        total_events=1000,
+        by_upstream_reason_id={"X": 9, "Y": 8, "Z": 7},
+        nodes_reporting_reason_id={"X": 9, "Y": 8, "Z": 7},
+    )
+
+
+_CAPS = CapabilitiesV3(envelope="ABSENT", correlation="ON", archival="OFF", telemetry="OFF")
+
+
+def _report_kwargs(**extra):
+    kwargs = dict(
+        target_layers=["DQSN"],
+        capabilities=_CAPS,
+        confidence_threshold=0.6,
+        correlation_snapshot=_corr_snapshot(),
+        include_correlation=True,
+    )
+    kwargs.update(extra)
+    return kwargs
+
+
+def _finding_ids(report):
+    return [f["finding_id"] for f in report.findings]
+
+
+def test_limits_reach_report_builder_and_pipeline():
+    snap = _spike_snapshot()
+    full = build_upgrade_report(report_id="AC-UR-K-0", snapshot=snap, **_report_kwargs())
+    assert build_upgrade_report(
+        report_id="AC-UR-K-0", snapshot=snap, **_report_kwargs(analyze_config=None, max_correlation_findings=None)
+    ) == full
+
+    limited = build_upgrade_report(
+        report_id="AC-UR-K-1",
+        snapshot=snap,
+        **_report_kwargs(analyze_config=AnalyzeConfig(max_findings=2), max_correlation_findings=1),
+    )
+    assert _finding_ids(limited) == [
+        "AC-CORR::REASON-WIDESPREAD::X",
+        "AC-FIND-REASON-SPIKE::B",
+        "AC-FIND-REASON-SPIKE::C",
+    ]
+
+    report, *_ = run_v3_pipeline(
+        report_id="AC-UR-K-1",
+        snapshot=snap,
+        **_report_kwargs(analyze_config=AnalyzeConfig(max_findings=2), max_correlation_findings=1),
+    )
+    assert report == limited
+
+    jobs = [PipelineJobV3("AC-UR-K-1", snap), PipelineJobV3("AC-UR-K-2", snap, {"max_correlation_findings": 0})]
+    batch = list(
+        run_v3_pipeline_batch(
+            jobs, analyze_config=AnalyzeConfig(max_findings=2), max_correlation_findings=1, **_report_kwargs()
+        )
+    )
+    assert batch[0][0] == limited
+    assert "AC-CORR::REASON-WIDESPREAD::X" not in _finding_ids(batch[1][0])
+
+
+def test_incremental_builder_applies_same_limits():
+    snap = _spike_snapshot()
+    cfg = AnalyzeConfig(max_findings=2)
+    builder = IncrementalReportBuilderV3(
+        report_id="AC-UR-K-1", snapshot=snap, analyze_config=cfg, max_correlation_findings=1, **_report_kwargs()
+    )
+    expected = build_upgrade_report(
+        report_id="AC-UR-K-1", snapshot=snap, **_report_kwargs(analyze_config=cfg, max_correlation_findings=1)
+    )
+    assert builder.report() == expected
+
+    delta = EvidenceDelta(total_events=0, by_upstream_reason_id={"A": 40})
+    moved = builder.apply(delta)
+    assert moved == build_upgrade_report(
+        report_id="AC-UR-K-1",
+        snapshot=builder.snapshot(),
+        **_report_kwargs(analyze_config=cfg, max_correlation_findings=1),
+    )
+    assert "AC-FIND-REASON-SPIKE::A" in _finding_ids(moved)
+
+
+@pytest.mark.parametrize("extra", [{"analyze_config": {"max_findings": 1}}, {"max_correlation_findings": -1}])
+def test_invalid_limits_fail_closed(extra):
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        build_upgrade_report(report_id="AC-UR-K-X", snapshot=_spike_snapshot(), **_report_kwargs(**extra))
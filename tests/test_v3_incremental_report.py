@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_core.v3 import analyze
+from adaptive_core.v3.canonicalize import canonicalize_event
+from adaptive_core.v3.drift import LayerContract
+from adaptive_core.v3.evidence_store import EvidenceSnapshot, EvidenceStoreV3
+from adaptive_core.v3.incremental_report import EvidenceDelta, IncrementalReportBuilderV3, snapshot_delta
+from adaptive_core.v3.report_builder import build_upgrade_report, render_report_json
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+CAPS = CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF")
+CONTRACTS = [
+    LayerContract(layer="Sentinel", assumptions={"meta.canonical": "true"}),
+    LayerContract(layer="DQSN", assumptions={"meta.canonical": "false"}),
+]
+
+
+def _raw(rng: random.Random, i: int) -> dict:
+    return {
+        "source_layer": rng.choice(["dqsn", "gate", "edge"]),
+        "event_type": rng.choice(["reject", "drop"]),
+        "severity": 0.5,
+        "timestamp": "2026-01-14T00:00:00Z",
+        "correlation_id": f"cid-{i}",
+        "meta": {},
+        "reason_id": rng.choice(["SPIKE", "SPIKE", "RARE", "OTHER", None]),
+    }
+
+
+def _scratch(snap: EvidenceSnapshot, report_id: str = "AC-UR-INC-0001"):
+    return build_upgrade_report(
+        report_id=report_id,
+        target_layers=["Sentinel", "DQSN"],
+        snapshot=snap,
+        capabilities=CAPS,
+        confidence_threshold=0.6,
+        drift_contracts=CONTRACTS,
+        include_drift_graph=True,
+    )
+
+
+def test_incremental_reports_match_from_scratch_builds():
+    rng = random.Random(7)
+    store = EvidenceStoreV3(max_events=60)
+    builder = IncrementalReportBuilderV3(
+        report_id="AC-UR-INC-0001",
+        target_layers=["Sentinel", "DQSN"],
+        capabilities=CAPS,
+        confidence_threshold=0.6,
+        drift_contracts=CONTRACTS,
+        include_drift_graph=True,
+    )
+
+    prev = store.snapshot()
+    i = 0
+    for _ in range(30):
+        for _ in range(rng.randint(1, 12)):
+            store.add(canonicalize_event(_raw(rng, i)))
+            i += 1
+        snap = store.snapshot()
+        report = builder.apply(snapshot_delta(prev, snap))
+        prev = snap
+        assert render_report_json(report) == render_report_json(_scratch(snap))
+        assert builder.snapshot() == EvidenceSnapshot(
+            snap.total_events, snap.by_source_layer, snap.by_event_type, snap.by_upstream_reason_id
+        )
+
+
+def test_only_moved_reasons_are_recomputed(monkeypatch: pytest.MonkeyPatch):
+    snap = EvidenceSnapshot(100, {"dqsn": 100}, {"reject": 100}, {"A": 40, "B": 30, "C": 20})
+    builder = IncrementalReportBuilderV3(
+        report_id="AC-UR-INC-0002", target_layers=["DQSN"], capabilities=CAPS, snapshot=snap
+    )
+
+    seen = []
+    real = analyze.reason_spike_finding
+    monkeypatch.setattr(analyze, "reason_spike_finding", lambda r, *a: seen.append(r) or real(r, *a))
+
+    # Same total, counts shift between two reasons.
+    report = builder.apply(EvidenceDelta(by_upstream_reason_id={"A": -5, "B": 5}))
+    assert sorted(seen) == ["A", "B"]
+    moved = EvidenceSnapshot(100, {"dqsn": 100}, {"reject": 100}, {"A": 35, "B": 35, "C": 20})
+    assert render_report_json(report) == render_report_json(_scratch_simple(moved, "AC-UR-INC-0002"))
+
+    # Total moves: every ratio changes.
+    seen.clear()
+    builder.apply(EvidenceDelta(total_events=1, by_source_layer={"dqsn": 1}, by_event_type={"reject": 1}))
+    assert sorted(seen) == ["A", "B", "C"]
+
+
+def _scratch_simple(snap: EvidenceSnapshot, report_id: str):
+    return build_upgrade_report(report_id=report_id, target_layers=["DQSN"], snapshot=snap, capabilities=CAPS)
+
+
+def test_report_is_cached_and_report_id_can_roll():
+    builder = IncrementalReportBuilderV3(report_id="AC-UR-INC-0003", target_layers=["DQSN"], capabilities=CAPS)
+    assert builder.report() is builder.report()
+    assert builder.report().evidence["total_events"] == 0
+
+    report = builder.apply(EvidenceDelta(), report_id="AC-UR-INC-0004")
+    assert report.report_id == builder.report_id == "AC-UR-INC-0004"
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        builder.apply(EvidenceDelta(), report_id="")
+
+
+def test_counters_going_negative_fail_closed():
+    builder = IncrementalReportBuilderV3(report_id="AC-UR-INC-0005", target_layers=["DQSN"], capabilities=CAPS)
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        builder.apply(EvidenceDelta(total_events=-1))
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        builder.apply(EvidenceDelta(total_events=1, by_source_layer={"dqsn": 1}, by_upstream_reason_id={"A": -1}))
+    assert builder.snapshot() == EvidenceSnapshot(0, {}, {}, {})
+
+
+def test_reason_dropping_to_zero_removes_its_finding():
+    snap = EvidenceSnapshot(20, {"dqsn": 20}, {"reject": 20}, {"A": 10})
+    builder = IncrementalReportBuilderV3(
+        report_id="AC-UR-INC-0006", target_layers=["DQSN"], capabilities=CAPS, snapshot=snap
+    )
+    assert [f["finding_id"] for f in builder.report().findings] == ["AC-FIND-REASON-SPIKE::A"]
+    report = builder.apply(EvidenceDelta(total_events=-10, by_source_layer={"dqsn": -10},
+                                         by_event_type={"reject": -10}, by_upstream_reason_id={"A": -10}))
+    assert report.findings == []
+    after = EvidenceSnapshot(10, {"dqsn": 10}, {"reject": 10}, {})
+    assert render_report_json(report) == render_report_json(_scratch_simple(after, "AC-UR-INC-0006"))
+
+
+def test_snapshot_delta_only_lists_moved_keys():
+    old = EvidenceSnapshot(3, {"a": 2, "b": 1}, {"x": 3}, {"R": 1})
+    new = EvidenceSnapshot(4, {"a": 2, "c": 2}, {"x": 4}, {})
+    assert snapshot_delta(old, new) == EvidenceDelta(1, {"b": -1, "c": 2}, {"x": 1}, {"R": -1})
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adaptive_core.v3.canonicalize import CanonicalizeFailure
+from adaptive_core.v3.node_summary import canonicalize_node_summaries, canonicalize_node_summary
+from adaptive_core.v3.parallel import canonicalize_node_summaries_batch, canonicalize_node_summaries_parallel
+from adaptive_core.v3.reason_ids import ReasonId
+
+
+def _raw(i: int):
+    raw = {
+        "node_id": f" node-{i} ",
+        "window_start": "2026-01-14T00:00:00Z",
+        "window_end": "2026-01-14T00:01:00Z",
+        "total_events": i * 10 if i % 2 else str(i * 10),
+        "by_upstream_reason_id": {"RISK": i % 4, " OTHER ": float(i % 3)},
+    }
+    if i % 11 == 5:
+        del raw["node_id"]
+    elif i % 11 == 7:
+        raw["window_end"] = "2026-01-14T00:01:00"
+    elif i % 11 == 9:
+        raw["by_upstream_reason_id"] = {"RISK": True}
+    elif i % 11 == 10:
+        raw["total_events"] = -1
+    return raw
+
+
+def _single(raw):
+    try:
+        return canonicalize_node_summary(raw)
+    except ValueError as e:
+        return str(e)
+
+
+def _normalize(out):
+    return [it.message if isinstance(it, CanonicalizeFailure) else it for it in out]
+
+
+def test_bulk_matches_single_item_function():
+    raws = [_raw(i) for i in range(60)] + ["not a mapping"]
+    expected = [_single(r) for r in raws]
+    got = list(canonicalize_node_summaries(raws))
+    assert _normalize(got) == expected
+
+    failures = [it for it in got if isinstance(it, CanonicalizeFailure)]
+    assert {f.reason_id for f in failures} == {
+        ReasonId.AC_V3_MISSING_FIELD,
+        ReasonId.AC_V3_TIMESTAMP_INVALID,
+        ReasonId.AC_V3_TYPE_INVALID,
+        ReasonId.AC_V3_NON_CANONICAL,
+        ReasonId.AC_V3_INVALID_EVENT,
+    }
+    assert all(f.message.startswith(f.reason_id.value) for f in failures)
+    assert failures[-1].index == 60
+
+
+def test_parallel_preserves_order_and_global_indexes():
+    raws = [_raw(i) for i in range(60)]
+    expected = list(canonicalize_node_summaries(raws))
+    assert list(canonicalize_node_summaries_parallel(raws, workers=1, chunk_size=7)) == expected
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        got = list(canonicalize_node_summaries_parallel(raws, chunk_size=7, executor=pool))
+    assert got == expected
+
+
+def test_parallel_process_pool_matches_inline():
+    raws = [_raw(i) for i in range(30)]
+    got = list(canonicalize_node_summaries_parallel(raws, workers=2, chunk_size=4))
+    assert got == list(canonicalize_node_summaries(raws))
+
+
+def test_batch_reports_counts_and_throughput():
+    raws = [_raw(i) for i in range(44)]
+    batch = canonicalize_node_summaries_batch(raws, workers=1, chunk_size=10)
+    stats = batch.stats
+
+    assert stats.items_read == 44
+    assert stats.failures == len(batch.failures) == 16
+    assert stats.canonicalized == len(batch.summaries) == 28
+    assert stats.failures_by_reason == {
+        "AC_V3_MISSING_FIELD": 4,
+        "AC_V3_NON_CANONICAL": 4,
+        "AC_V3_TIMESTAMP_INVALID": 4,
+        "AC_V3_TYPE_INVALID": 4,
+    }
+    assert stats.elapsed_seconds >= 0.0 and stats.items_per_second >= 0.0
+    assert batch.summaries == [canonicalize_node_summary(r) for r in raws if isinstance(_single(r), tuple)]
+
+
+def test_batch_on_empty_input_and_eager_validation():
+    empty = canonicalize_node_summaries_batch([], workers=1)
+    assert empty.items == [] and empty.stats.items_per_second == 0.0
+    with pytest.raises(ValueError):
+        canonicalize_node_summaries_batch([_raw(0)], chunk_size=0)
+
+
+def test_int_fast_path_keeps_type_checks():
+    ok, _ = canonicalize_node_summary(dict(_raw(1), by_upstream_reason_id={"R": 3}))
+    assert type(ok.by_upstream_reason_id["R"]) is int
+    with pytest.raises(ValueError, match="AC_V3_TYPE_INVALID"):
+        canonicalize_node_summary(dict(_raw(1), total_events=False))
+    with pytest.raises(ValueError, match="AC_V3_NON_CANONICAL"):
+        canonicalize_node_summary(dict(_raw(1), by_upstream_reason_id={"R": -2}))
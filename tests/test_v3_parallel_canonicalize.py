@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adaptive_core.v3.canonicalize import CanonicalizeFailure, canonicalize_events
+from adaptive_core.v3.parallel import canonicalize_events_parallel, context_hashes_parallel, ordered_chunked_map
+from adaptive_core.v3.reason_ids import ReasonId
+
+
+def _raw(i: int):
+    raw = {
+        "source_layer": f"layer-{i % 3}",
+        "event_type": "reject",
+        "severity": 0.5,
+        "timestamp": "2026-01-14T00:00:00Z",
+        "correlation_id": f"cid-{i}",
+        "meta": {"i": i},
+    }
+    if i % 7 == 3:
+        del raw["meta"]  # deliberate failure
+    return raw
+
+
+def _double(offset: int, chunk):
+    return [(offset + j, x * 2) for j, x in enumerate(chunk)]
+
+
+def test_ordered_chunked_map_validates_eagerly():
+    with pytest.raises(ValueError):
+        ordered_chunked_map(_double, [1], chunk_size=0)
+    with pytest.raises(ValueError):
+        ordered_chunked_map(_double, [1], workers=0)
+    with pytest.raises(ValueError):
+        ordered_chunked_map(_double, [1], workers=1, max_pending=0)
+
+
+def test_ordered_chunked_map_inline_and_with_executor_preserve_order():
+    expected = [(i, i * 2) for i in range(25)]
+    assert list(ordered_chunked_map(_double, range(25), workers=1, chunk_size=4)) == expected
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        out = ordered_chunked_map(_double, range(25), chunk_size=4, max_pending=2, executor=pool)
+        assert list(out) == expected
+
+    assert list(ordered_chunked_map(_double, [], workers=1)) == []
+
+
+def test_parallel_canonicalize_matches_batch_api_over_process_pool():
+    raws = [_raw(i) for i in range(60)]
+    expected = list(canonicalize_events(raws))
+
+    got = list(canonicalize_events_parallel(raws, workers=2, chunk_size=7))
+    assert got == expected
+
+    failures = [g for g in got if isinstance(g, CanonicalizeFailure)]
+    assert [f.index for f in failures] == [i for i in range(60) if i % 7 == 3]
+    assert {f.reason_id for f in failures} == {ReasonId.AC_V3_MISSING_FIELD}
+
+
+def test_context_hashes_parallel_returns_index_and_hash_only():
+    raws = [_raw(i) for i in range(60)]
+    expected = [
+        r if isinstance(r, CanonicalizeFailure) else (i, r.context_hash)
+        for i, r in enumerate(canonicalize_events(raws))
+    ]
+    assert list(context_hashes_parallel(raws, workers=1, chunk_size=7)) == expected
+    assert list(context_hashes_parallel(raws, workers=2, chunk_size=7)) == expected
+
+
+def test_parallel_canonicalize_defaults_to_cpu_count_workers():
+    raws = [_raw(i) for i in range(5)]
+    assert list(canonicalize_events_parallel(raws, chunk_size=2)) == list(canonicalize_events(raws))
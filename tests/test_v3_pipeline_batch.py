@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.pipeline import PipelineJobV3, run_v3_pipeline, run_v3_pipeline_batch
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+CAPS = CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF")
+SHARED = dict(target_layers=["DQSN"], confidence_threshold=0.0, capabilities=CAPS)
+
+
+def _snap(n: int) -> EvidenceSnapshot:
+    return EvidenceSnapshot(
+        total_events=n,
+        by_source_layer={"dqsn": n},
+        by_event_type={"reject": n},
+        by_upstream_reason_id={"SPIKE": n // 2} if n else {},
+    )
+
+
+def _jobs():
+    return [PipelineJobV3(report_id=f"AC-UR-NODE-{i:04d}", snapshot=_snap(i)) for i in range(10)]
+
+
+def test_batch_matches_individual_runs_in_order():
+    expected = [run_v3_pipeline(report_id=j.report_id, snapshot=j.snapshot, **SHARED) for j in _jobs()]
+    results = list(run_v3_pipeline_batch(_jobs(), chunk_size=3, **SHARED))
+
+    assert [r[0].report_id for r in results] == [j.report_id for j in _jobs()]
+    assert [r[1] for r in results] == [e[1] for e in expected]
+    assert [r[2] for r in results] == [e[2] for e in expected]
+    assert [r[3].report_hash for r in results] == [e[3].report_hash for e in expected]
+
+
+def test_worker_pool_output_is_identical():
+    serial = [r[1] for r in run_v3_pipeline_batch(_jobs(), **SHARED)]
+    pooled = [r[1] for r in run_v3_pipeline_batch(_jobs(), workers=2, chunk_size=2, **SHARED)]
+    assert pooled == serial
+
+
+def test_per_job_options_override_shared():
+    jobs = [
+        PipelineJobV3(report_id="AC-UR-A", snapshot=_snap(0)),
+        PipelineJobV3(report_id="AC-UR-B", snapshot=_snap(0), options={"target_layers": ["DQSN", "GATE"]}),
+    ]
+    a, b = run_v3_pipeline_batch(jobs, **SHARED)
+    assert a[0].target_layers == ["DQSN"]
+    assert b[0].target_layers == ["DQSN", "GATE"]
+
+
+def test_batch_fails_closed():
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        run_v3_pipeline_batch(_jobs(), report_id="x", **SHARED)
+
+    bad = [PipelineJobV3(report_id="", snapshot=_snap(1))]
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        list(run_v3_pipeline_batch(bad, **SHARED))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_core.v3 import pipeline as pl
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+KWARGS = dict(
+    report_id="AC-UR-LAZY-0001",
+    target_layers=["DQSN"],
+    snapshot=EvidenceSnapshot(
+        total_events=10,
+        by_source_layer={"dqsn": 10},
+        by_event_type={"reject": 10},
+        by_upstream_reason_id={"SPIKE": 10},
+    ),
+    confidence_threshold=0.0,
+    capabilities=CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF"),
+)
+
+
+def test_report_object_access_skips_rendering(monkeypatch: pytest.MonkeyPatch):
+    def _boom(_):
+        raise AssertionError("rendered eagerly")
+
+    monkeypatch.setattr(pl, "render_report_json", _boom)
+    monkeypatch.setattr(pl, "render_report_md", _boom)
+
+    out = pl.run_v3_pipeline_lazy(**KWARGS)
+    assert out.report.report_type == "UPGRADE_REPORT"
+    assert out.get("object") is out.report
+
+
+def test_outputs_render_once_and_match_eager_pipeline(monkeypatch: pytest.MonkeyPatch):
+    calls = {"json": 0, "md": 0}
+    render_json, render_md = pl.render_report_json, pl.render_report_md
+
+    def _json(r):
+        calls["json"] += 1
+        return render_json(r)
+
+    def _md(r):
+        calls["md"] += 1
+        return render_md(r)
+
+    monkeypatch.setattr(pl, "render_report_json", _json)
+    monkeypatch.setattr(pl, "render_report_md", _md)
+
+    out = pl.run_v3_pipeline_lazy(**KWARGS)
+    env = out.get("envelope")
+    assert calls == {"json": 1, "md": 0}
+    assert out.get("json") is out.canonical_json
+    assert out.envelope is env
+    assert out.get("markdown") == out.markdown
+    assert calls == {"json": 1, "md": 1}
+
+    monkeypatch.undo()
+    report, j, m, e = pl.run_v3_pipeline(**KWARGS)
+    assert (out.canonical_json, out.markdown, out.envelope.report_hash) == (j, m, e.report_hash)
+    assert out.as_tuple()[0] == report
+
+
+def test_unknown_output_kind_fails_closed():
+    out = pl.run_v3_pipeline_lazy(**KWARGS)
+    with pytest.raises(ValueError, match="AC_V3_REPORT_INVALID"):
+        out.get("pdf")
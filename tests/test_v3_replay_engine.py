@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from adaptive_core.v3.canonicalize import canonicalize_event
+from adaptive_core.v3.evidence_store import EvidenceStoreV3
+from adaptive_core.v3.replay import ReplayEngineV3, iter_jsonl_lines, replay_jsonl
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+CAPS = CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF")
+
+
+def _raw(i: int) -> dict:
+    return {
+        "source_layer": ["dqsn", "gate"][i % 2],
+        "event_type": "reject",
+        "severity": 0.5,
+        "timestamp": "2026-01-14T00:00:00Z",
+        "correlation_id": f"cid-{i}",
+        "meta": {},
+        "reason_id": "SPIKE",
+    }
+
+
+def _write_jsonl(path, raws, extra_lines=()):
+    lines = [json.dumps(r) for r in raws] + list(extra_lines)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_replay_matches_manual_ingest_and_checkpoints(tmp_path):
+    raws = [_raw(i) for i in range(25)]
+    path = tmp_path / "events.jsonl"
+    _write_jsonl(path, raws)
+
+    manual = EvidenceStoreV3(max_events=100)
+    for r in raws:
+        manual.add(canonicalize_event(r))
+
+    engine = ReplayEngineV3(EvidenceStoreV3(max_events=100), checkpoint_every=10)
+    checkpoints = list(engine.run_jsonl([path]))
+
+    assert [cp.events_read for cp in checkpoints] == [10, 20, 25]
+    assert [cp.sequence for cp in checkpoints] == [0, 1, 2]
+    assert checkpoints[-1].snapshot == manual.snapshot()
+    assert checkpoints[-1].report is None
+    stats = checkpoints[-1].stats
+    assert (stats.events_read, stats.events_stored, stats.failures) == (25, 25, 0)
+    assert stats.elapsed_seconds >= 0.0
+    assert stats.events_per_second >= 0.0
+
+
+def test_no_extra_checkpoint_when_input_ends_on_boundary():
+    engine = ReplayEngineV3(checkpoint_every=5)
+    assert [cp.events_read for cp in engine.run(_raw(i) for i in range(10))] == [5, 10]
+    assert [cp.events_read for cp in ReplayEngineV3().run([])] == [0]
+
+
+def test_failures_are_counted_by_reason_and_do_not_abort(tmp_path):
+    bad = dict(_raw(0))
+    del bad["timestamp"]
+    path = tmp_path / "events.jsonl"
+    _write_jsonl(path, [_raw(1), bad], extra_lines=["", "{not json", json.dumps(_raw(2))])
+
+    engine = ReplayEngineV3(max_failures_kept=1)
+    final = list(engine.run_jsonl([path]))[-1]
+
+    assert final.events_read == 4
+    assert final.stats.events_stored == 2
+    assert final.stats.failures_by_reason == {"AC_V3_INVALID_EVENT": 1, "AC_V3_MISSING_FIELD": 1}
+    assert len(engine.failures) == 1
+    assert engine.failures[0].index == 1
+
+
+def test_checkpoint_reports_are_deterministic(tmp_path):
+    raws = [_raw(i) for i in range(12)]
+    path = tmp_path / "events.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for r in raws:
+            fh.write(json.dumps(r) + "\n")
+
+    options = dict(
+        checkpoint_every=6,
+        pipeline=dict(target_layers=["DQSN"], confidence_threshold=0.0, capabilities=CAPS),
+    )
+    a = list(ReplayEngineV3(**options).run_jsonl([path]))
+    b = list(ReplayEngineV3(**options).run_jsonl([path]))
+
+    assert [cp.report[0].report_id for cp in a] == ["AC-REPLAY-000000000006", "AC-REPLAY-000000000012"]
+    assert [cp.report[1] for cp in a] == [cp.report[1] for cp in b]
+    assert [cp.report[3].report_hash for cp in a] == [cp.report[3].report_hash for cp in b]
+
+
+def test_replay_jsonl_single_call_and_dedup_rejections(tmp_path):
+    raws = [_raw(i) for i in range(5)]
+    path = tmp_path / "events.jsonl"
+    _write_jsonl(path, raws + raws)
+
+    final = replay_jsonl([path], EvidenceStoreV3(dedup=True))
+    assert final.snapshot.total_events == 5
+    assert final.stats.events_rejected == 5
+
+
+def test_parallel_replay_matches_serial(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_jsonl(path, [_raw(i) for i in range(40)], extra_lines=["[1, 2]"])
+    serial = replay_jsonl([path], chunk_size=7)
+    parallel = replay_jsonl([path], chunk_size=7, workers=2)
+    assert parallel.snapshot == serial.snapshot
+    assert parallel.stats.failures_by_reason == serial.stats.failures_by_reason == {"AC_V3_INVALID_EVENT": 1}
+
+
+def test_iter_jsonl_lines_skips_blank_lines(tmp_path):
+    a = tmp_path / "a.jsonl"
+    b = tmp_path / "b.jsonl"
+    a.write_text('{"x": 1}\n\n  \n', encoding="utf-8")
+    b.write_text('{"x": 2}\n', encoding="utf-8")
+    assert [json.loads(l)["x"] for l in iter_jsonl_lines([a, b])] == [1, 2]
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        ReplayEngineV3(checkpoint_every=0)
+    with pytest.raises(ValueError):
+        ReplayEngineV3(max_failures_kept=-1)
+    with pytest.raises(ValueError):
+        ReplayEngineV3(pipeline={"report_id": "x"})
+
+
+def test_engine_replays_once(tmp_path):
+    engine = ReplayEngineV3()
+    first = list(engine.run(_raw(i) for i in range(5)))[-1]
+    assert first.snapshot.total_events == 5
+
+    with pytest.raises(RuntimeError):
+        engine.run(_raw(i) for i in range(5))
+    path = tmp_path / "events.jsonl"
+    _write_jsonl(path, [_raw(i) for i in range(5)])
+    with pytest.raises(RuntimeError):
+        engine.run_jsonl([path])
+
+    # the first run's state is untouched; a new engine replays identically
+    assert engine.store.snapshot().total_events == 5
+    again = list(ReplayEngineV3().run(_raw(i) for i in range(5)))[-1]
+    assert again.snapshot == first.snapshot
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from adaptive_core.v3.correlation import aggregate_node_summaries
+from adaptive_core.v3.drift import LayerContract
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.node_summary import canonicalize_node_summary
+from adaptive_core.v3.report_builder import (
+    _render_report_json_asdict,
+    build_upgrade_report,
+    render_report_json,
+)
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+def _summary(node_id: str, reasons: dict) -> dict:
+    return {
+        "node_id": node_id,
+        "window_start": "2026-01-14T00:00:00Z",
+        "window_end": "2026-01-14T01:00:00Z",
+        "total_events": 100,
+        "by_upstream_reason_id": reasons,
+    }
+
+
+def _corpus():
+    corr = aggregate_node_summaries(
+        [canonicalize_node_summary(_summary(f"n{i}", {"WIDESPREAD": 3, f"R{i}": 1}))[0] for i in range(5)]
+    )
+    contracts = [
+        LayerContract(layer="Sentinel", assumptions={"meta.canonical": "true", "ts": "utc"}),
+        LayerContract(layer="DQSN", assumptions={"meta.canonical": "false", "ts": "local"}),
+    ]
+    for n in (0, 1, 10, 1000):
+        for threshold in (0.0, 0.6, 1.0):
+            for with_extras in (False, True):
+                snap = EvidenceSnapshot(
+                    total_events=n,
+                    by_source_layer={"dqsn": n, "gate": n // 2} if n else {},
+                    by_event_type={"reject": n} if n else {},
+                    by_upstream_reason_id={"SPIKE": n, "ÜNICODE-✓": n // 3} if n else {},
+                )
+                yield build_upgrade_report(
+                    report_id=f"AC-UR-CORPUS-{n}-{threshold}-{with_extras}",
+                    target_layers=["Sentinel", "DQSN"],
+                    snapshot=snap,
+                    capabilities=CapabilitiesV3(
+                        envelope="ABSENT", correlation="ON" if with_extras else "OFF", archival="OFF", telemetry="OFF"
+                    ),
+                    confidence_threshold=threshold,
+                    drift_contracts=contracts if with_extras else None,
+                    include_drift_graph=with_extras,
+                    correlation_snapshot=corr if with_extras else None,
+                    include_correlation=with_extras,
+                )
+
+
+def test_fast_renderer_is_byte_identical_on_corpus():
+    reports = list(_corpus())
+    assert len(reports) == 24
+    assert {r.report_type for r in reports} == {"UPGRADE_REPORT", "SIGNAL_COLLECTION_NOTICE"}
+    for report in reports:
+        assert render_report_json(report) == _render_report_json_asdict(report)
+
+
+def test_renderer_does_not_mutate_report():
+    report = next(_corpus())
+    before = _render_report_json_asdict(report)
+    render_report_json(report)
+    assert _render_report_json_asdict(report) == before
+
+
+def test_out_of_schema_values_fall_back_to_asdict():
+    report = next(_corpus())
+    odd = replace(report, findings=[{"nested": CapabilitiesV3("ABSENT", "OFF", "OFF", "OFF")}])
+    assert render_report_json(odd) == _render_report_json_asdict(odd)
+
+    with pytest.raises(TypeError):
+        render_report_json(replace(report, findings=[{"x": object()}]))
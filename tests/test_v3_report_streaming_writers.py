@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from adaptive_core.v3.drift import LayerContract
+from adaptive_core.v3.evidence_store import EvidenceSnapshot
+from adaptive_core.v3.report_builder import (
+    build_upgrade_report,
+    render_report_json,
+    render_report_md,
+    write_report_json,
+    write_report_md,
+)
+from adaptive_core.v3.report_models import CapabilitiesV3
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def _report(with_drift: bool):
+    contracts = [
+        LayerContract(layer=f"L{i}", assumptions={f"k{j}": str((i + j) % 2) for j in range(20)})
+        for i in range(4)
+    ]
+    return build_upgrade_report(
+        report_id="AC-UR-STREAM-0001",
+        target_layers=["L0", "L1", "L2", "L3"],
+        snapshot=EvidenceSnapshot(
+            total_events=40,
+            by_source_layer={"dqsn": 40},
+            by_event_type={"reject": 40},
+            by_upstream_reason_id={"SPIKE": 30, "ÜNICODE": 10},
+        ),
+        capabilities=CapabilitiesV3(envelope="ABSENT", correlation="OFF", archival="OFF", telemetry="OFF"),
+        confidence_threshold=0.0,
+        drift_contracts=contracts if with_drift else None,
+        include_drift_graph=with_drift,
+    )
+
+
+@pytest.mark.parametrize("with_drift", [False, True])
+@pytest.mark.parametrize("chunk_chars", [1, 64, 1 << 20])
+def test_streamed_output_matches_renderers(with_drift, chunk_chars):
+    report = _report(with_drift)
+
+    md = io.StringIO()
+    assert write_report_md(report, md, chunk_chars=chunk_chars) == len(render_report_md(report))
+    assert md.getvalue() == render_report_md(report)
+
+    js = io.StringIO()
+    assert write_report_json(report, js, chunk_chars=chunk_chars) == len(render_report_json(report))
+    assert js.getvalue() == render_report_json(report)
+
+
+def test_writes_are_chunked():
+    report = _report(True)
+    size = len(render_report_md(report))
+
+    small = _CountingStream()
+    write_report_md(report, small, chunk_chars=256)
+    assert small.writes > 1
+
+    large = _CountingStream()
+    write_report_md(report, large, chunk_chars=size + 1)
+    assert large.writes == 1
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        write_report_json(_report(False), io.StringIO(), chunk_chars=0)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pickle
+import threading
+from dataclasses import asdict
+
+import pytest
+
+from adaptive_core.v3.canonicalize import canonicalize_event
+from adaptive_core.v3.context_hash import CANONICAL_ENCODER
+from adaptive_core.v3.evidence_store import COMPOSITE_COUNTERS, EvidenceSnapshot, EvidenceStoreV3
+from adaptive_core.v3.sharded_evidence_store import (
+    ShardedEvidenceStoreV3,
+    merge_snapshots,
+    stable_shard,
+)
+
+
+def _raw(i: int) -> dict:
+    return {
+        "source_layer": ["dqsn", "gate", "edge", "core"][i % 4],
+        "event_type": ["reject", "drop", "timeout"][i % 3],
+        "severity": (i % 11) / 10,
+        "timestamp": "2026-01-14T00:00:00Z",
+        "correlation_id": f"cid-{i % 37}",
+        "meta": {"i": i % 50},
+        "reason_id": ["R1", "R2", None][i % 3] if i % 5 else "R9",
+    }
+
+
+def _items(n: int):
+    return [canonicalize_event(_raw(i)) for i in range(n)]
+
+
+def _bytes(snap: EvidenceSnapshot) -> bytes:
+    d = asdict(snap)
+    for k in ("by_source_layer_reason_id", "by_event_type_reason_id"):
+        d[k] = {"|".join(key): v for key, v in d[k].items()}
+    d["severity_histogram"] = {str(k): v for k, v in d["severity_histogram"].items()}
+    return CANONICAL_ENCODER.encode(d).encode("utf-8")
+
+
+def test_stable_shard_is_deterministic_and_in_range():
+    assert stable_shard("cid-1", 8) == stable_shard("cid-1", 8)
+    assert all(0 <= stable_shard(f"k{i}", 5) < 5 for i in range(100))
+    assert len({stable_shard(f"k{i}", 4) for i in range(100)}) == 4
+
+
+@pytest.mark.parametrize("shard_key", ["correlation_id", "source_layer"])
+@pytest.mark.parametrize("dedup", [False, True])
+def test_merged_snapshot_matches_single_store(shard_key, dedup):
+    items = _items(300)
+    items += items[:50]  # upstream retries
+    single = EvidenceStoreV3(max_events=10_000, dedup=dedup, composite_counters=COMPOSITE_COUNTERS)
+    sharded = ShardedEvidenceStoreV3(
+        shards=4,
+        shard_key=shard_key,
+        max_events_per_shard=10_000,
+        dedup=dedup,
+        composite_counters=COMPOSITE_COUNTERS,
+    )
+    for it in items:
+        assert sharded.add(it) == single.add(it)
+
+    merged = sharded.snapshot()
+    assert merged == single.snapshot()
+    assert _bytes(merged) == _bytes(single.snapshot())
+    assert pickle.dumps(merged) == pickle.dumps(single.snapshot())
+    if dedup:
+        assert merged.duplicates_rejected > 0
+
+
+def test_concurrent_ingest_is_deterministic():
+    items = _items(2000)
+    reference = ShardedEvidenceStoreV3(shards=4, max_events_per_shard=10_000, dedup=True)
+    assert reference.add_many(items) > 0
+
+    store = ShardedEvidenceStoreV3(shards=4, max_events_per_shard=10_000, dedup=True)
+
+    def worker(k: int) -> None:
+        for it in items[k::4]:
+            store.add(it)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _bytes(store.snapshot()) == _bytes(reference.snapshot())
+
+
+def test_snapshot_is_cached_until_a_shard_changes():
+    store = ShardedEvidenceStoreV3(shards=3)
+    items = _items(5)
+    store.add_many(items[:4])
+    first = store.snapshot()
+    assert store.snapshot() is first
+    store.add(items[4])
+    assert store.snapshot() is not first
+    assert store.snapshot().total_events == 5
+    assert sum(s.total_events for s in store.shard_snapshots()) == 5
+
+    cached = store.snapshot()
+    with pytest.raises(TypeError):
+        cached.by_source_layer["x"] = 1
+    assert "x" not in store.snapshot().by_source_layer
+
+
+def test_merge_snapshots_is_order_independent():
+    a = EvidenceSnapshot(1, {"x": 1}, {"e": 1}, {"R1": 1})
+    b = EvidenceSnapshot(2, {"y": 1, "x": 1}, {"e": 2}, {})
+    assert _bytes(merge_snapshots([a, b])) == _bytes(merge_snapshots([b, a]))
+    assert list(merge_snapshots([b, a]).by_source_layer) == ["x", "y"]
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        ShardedEvidenceStoreV3(shards=0)
+    with pytest.raises(ValueError):
+        ShardedEvidenceStoreV3(shard_key="event_type")
+    store = ShardedEvidenceStoreV3(shards=2, shard_key="source_layer")
+    assert store.shards == 2
+    assert store.shard_key == "source_layer"
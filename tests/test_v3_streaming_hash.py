@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from adaptive_core.v3.context_hash import (
+    canonical_json_sha256,
+    compute_context_hash,
+    iter_canonical_json,
+    sha256_text,
+)
+from adaptive_core.v3.envelope import _stable_hash
+
+
+def _reference(obj) -> str:
+    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Golden vectors: digests pinned so the canonical form can never drift silently.
+GOLDEN = [
+    ({}, "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a"),
+    (
+        {
+            "source_layer": "dqsn",
+            "event_type": "reject",
+            "severity": 0.5,
+            "timestamp": "2026-01-14T00:00:00Z",
+            "correlation_id": "c-123",
+            "meta": {"b": 2, "a": 1},
+            "reason_id": "DQSN_META_AMBIGUOUS",
+        },
+        "d23f25c00e8172106a60a2690859b25861bf06a2f452dfdf869b35b574757b08",
+    ),
+    (
+        {"ü": "ß", "emoji": "🛡️", "ctrl": "\n\t\"\\\u0001"},
+        "feccb5484b795d572b2ed2602f381d83c252c0f00e7d23bceec7dcc5e3441373",
+    ),
+]
+
+# Equivalence corpus: every entry must hash identically to json.dumps.
+CORPUS = [
+    {},
+    [],
+    {"a": []},
+    {"nested": {"z": {"y": {"x": [1, [2, [3, {}]]]}}}},
+    {"floats": [0.0, -0.0, 1e-7, 1.5e300, 0.1 + 0.2, 3.141592653589793]},
+    {"ints": [0, -1, 2**63, -(2**80)]},
+    {"lits": [True, False, None]},
+    {"k" * 10: "v" * 10, "": "empty-key"},
+    {"non_bmp": "𝔘𝔫𝔦𝔠𝔬𝔡𝔢", "cjk": "決定論", "rtl": "שלום"},
+    {"escapes": "\"quoted\" \\ back \b \f \r   \u007f"},
+    {"big": ["x" * 1000 for _ in range(200)], "meta": {str(i): i for i in range(500)}},
+]
+
+
+@pytest.mark.parametrize("obj,digest", GOLDEN)
+def test_golden_vectors(obj, digest):
+    assert compute_context_hash(obj) == digest
+    assert canonical_json_sha256(obj) == digest
+    assert canonical_json_sha256(obj, chunk_chars=1) == digest
+
+
+@pytest.mark.parametrize("obj", CORPUS)
+def test_streaming_hash_equals_one_shot(obj):
+    expected = _reference(obj)
+    assert compute_context_hash(obj) == expected
+    for chunk in (1, 7, 4096, 64 * 1024):
+        assert canonical_json_sha256(obj, chunk_chars=chunk) == expected
+
+
+@pytest.mark.parametrize("obj", CORPUS)
+def test_iter_canonical_json_joins_to_json_dumps(obj):
+    expected = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    assert "".join(iter_canonical_json(obj)) == expected
+
+
+def test_sha256_text_and_envelope_hash_match_plain_encode():
+    text = json.dumps(CORPUS[-1], sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "ü🛡️"
+    expected = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    assert sha256_text(text) == expected
+    assert sha256_text(text, chunk_chars=3) == expected
+    assert _stable_hash(text) == expected
+    assert sha256_text("") == hashlib.sha256(b"").hexdigest()